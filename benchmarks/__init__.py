@@ -0,0 +1 @@
+"""comicfn2dict benchmarks."""
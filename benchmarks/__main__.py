@@ -0,0 +1,60 @@
+"""Run comicfn2dict benchmarks."""
+
+from argparse import ArgumentParser
+
+from benchmarks import (
+    canonical,
+    casefold,
+    catalog,
+    codegen,
+    comicinfo,
+    core,
+    dupes,
+    matcher,
+    memory,
+    rules,
+    scan,
+    serialize,
+    sort,
+    store,
+    threads,
+)
+
+BENCHMARKS = {
+    "core": core.run,
+    "threads": threads.run,
+    "serialize": serialize.run,
+    "matcher": matcher.run,
+    "memory": memory.run,
+    "canonical": canonical.run,
+    "dupes": dupes.run,
+    "sort": sort.run,
+    "casefold": casefold.run,
+    "scan": scan.run,
+    "rules": rules.run,
+    "comicinfo": comicinfo.run,
+    "store": store.run,
+    "codegen": codegen.run,
+    "catalog": catalog.run,
+}
+
+
+def main() -> None:
+    """Run the chosen benchmarks."""
+    parser = ArgumentParser(description="comicfn2dict benchmarks")
+    parser.add_argument(
+        "benchmarks",
+        nargs="*",
+        help="Benchmarks to run from: " + ", ".join(BENCHMARKS) + ". Default is all.",
+    )
+    parser.add_argument(
+        "-n", "--count", type=int, default=100_000, help="Names per benchmark"
+    )
+    args = parser.parse_args()
+    if unknown := set(args.benchmarks) - BENCHMARKS.keys():
+        parser.error("Unknown benchmarks: " + ", ".join(sorted(unknown)))
+    for name in args.benchmarks or BENCHMARKS:
+        BENCHMARKS[name](args.count)
+
+
+main()
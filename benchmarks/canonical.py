@@ -0,0 +1,24 @@
+"""Benchmark the canonical fast path on an already normalized library."""
+
+from benchmarks.common import corpus, measure, report
+from comicfn2dict import comicfn2dict, dict2comicfn
+from comicfn2dict.engine import ComicFilenameEngine
+
+
+def run(count: int) -> None:
+    """Parse normalized names with and without the canonical fast path."""
+    print(f"# canonical: {count} names")
+    names = [dict2comicfn(comicfn2dict(name)) for name in corpus(count)]
+    plain_engine = ComicFilenameEngine()
+    plain = measure(lambda: plain_engine.parse_batch(names))
+    report("engine.parse_batch", count, plain)
+    engine = ComicFilenameEngine(canonical=True)
+    fast = measure(lambda: engine.parse_batch(names))
+    counts = engine.canonical_counts
+    hit_rate = counts.rate if counts else 0.0
+    report(
+        "engine.parse_batch canonical=True",
+        count,
+        fast,
+        f"speedup x{plain / fast:.2f} hit rate {hit_rate:.1%}",
+    )
@@ -0,0 +1,28 @@
+"""Benchmark case sensitive matching against lowercased names."""
+
+from benchmarks.common import corpus, measure, report
+from comicfn2dict.engine import ComicFilenameEngine
+
+
+def _compare(names: list[str], label: str, *, prescan: bool) -> None:
+    """Parse names with and without case folded matching."""
+    count = len(names)
+    plain_engine = ComicFilenameEngine(prescan=prescan)
+    plain = measure(lambda: plain_engine.parse_batch(names))
+    report("engine.parse_batch" + label, count, plain)
+    engine = ComicFilenameEngine(prescan=prescan, casefold=True)
+    folded = measure(lambda: engine.parse_batch(names))
+    report(
+        "engine.parse_batch casefold=True" + label,
+        count,
+        folded,
+        f"speedup x{plain / folded:.2f}",
+    )
+
+
+def run(count: int) -> None:
+    """Parse the corpus with and without case folded matching."""
+    print(f"# casefold: {count} names")
+    names = corpus(count)
+    _compare(names, "", prescan=False)
+    _compare(names, " prescan=True", prescan=True)
@@ -0,0 +1,102 @@
+"""Benchmark indexed catalog queries against scanning parse results."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from benchmarks.common import measure, report
+from comicfn2dict import comicfn2dict
+from comicfn2dict.catalog import ComicCatalog
+from tests.comic_filenames import PARSE_FNS
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_PUBLISHERS = ("Image", "Marvel", "DC Comics", "Dark Horse", "Boom", "IDW", "Oni")
+_FORMATS = ("TPB", "Digital", "Annual", "HC", "Omnibus")
+_SERIES = 5000
+_QUERIES = 20
+
+
+def _records(count: int) -> list[tuple[str, dict]]:
+    """Spread parsed test names across series, publishers, years & issues."""
+    names = tuple(PARSE_FNS)
+    bases = [comicfn2dict(name) for name in names]
+    records = []
+    for index in range(count):
+        metadata = dict(bases[index % len(bases)])
+        metadata["series"] = f"Series {index % _SERIES}"
+        metadata["publisher"] = _PUBLISHERS[index % len(_PUBLISHERS)]
+        metadata["original_format"] = _FORMATS[index // 3 % len(_FORMATS)]
+        metadata["volume"] = str(index // _SERIES % 4 + 1)
+        metadata["year"] = str(1980 + index // 11 % 45)
+        metadata["issue"] = str(index // (_SERIES * 4) % 120 + 1)
+        records.append((f"comics/{index:07d}/{names[index % len(names)]}", metadata))
+    return records
+
+
+def _in_years(metadata: dict, low: int, high: int) -> bool:
+    """Check a year is in a range."""
+    year = metadata.get("year", "")
+    return year.isdigit() and low <= int(year) <= high
+
+
+def _in_issues(metadata: dict, low: int, high: int) -> bool:
+    """Check a whole issue number is in a range."""
+    issue = metadata.get("issue", "")
+    return issue.isdigit() and low <= int(issue) <= high
+
+
+def _compare(
+    label: str, count: int, scan: Callable[[], list], query: Callable[[], list]
+) -> None:
+    """Run a query by scanning and through the catalog."""
+    scanned = measure(lambda: [scan() for _ in range(_QUERIES)])
+    report(f"scan {label}", _QUERIES, scanned, f"{count} records")
+    queried = measure(lambda: [query() for _ in range(_QUERIES)])
+    hits = len(query())
+    report(
+        f"query {label}", _QUERIES, queried, f"x{scanned / queried:.0f}, {hits} hits"
+    )
+
+
+def run(count: int) -> None:
+    """Query a catalog of parse results by field and range."""
+    print(f"# catalog: {count} records")
+    records = _records(count)
+    catalogs: list[ComicCatalog] = []
+    build = measure(lambda: catalogs.append(ComicCatalog(records)))
+    report("ComicCatalog()", count, build)
+    catalog = catalogs[0]
+    _compare(
+        "Image TPBs 2010-2015",
+        count,
+        lambda: [
+            path
+            for path, md in records
+            if md.get("publisher") == "Image"
+            and md.get("original_format") == "TPB"
+            and _in_years(md, 2010, 2015)
+        ],
+        lambda: catalog.query(
+            publisher="Image", original_format="TPB", year=(2010, 2015)
+        ),
+    )
+    _compare(
+        "series, volume 2, issues 1-12",
+        count,
+        lambda: [
+            path
+            for path, md in records
+            if md.get("series") == "Series 42"
+            and md.get("volume") == "2"
+            and _in_issues(md, 1, 12)
+        ],
+        lambda: catalog.query(series="Series 42", volume="2", issue=("1", "12")),
+    )
+    _compare(
+        "years 2010-2015",
+        count,
+        lambda: [path for path, md in records if _in_years(md, 2010, 2015)],
+        lambda: catalog.query(year=(2010, 2015)),
+    )
@@ -0,0 +1,28 @@
+"""Benchmark the generated parse function against the parser's stages."""
+
+from benchmarks.common import corpus, measure, report
+from comicfn2dict.engine import ComicFilenameEngine
+
+
+def _compare(names: list[str], label: str, *, prescan: bool) -> None:
+    """Parse names one at a time with and without the generated function."""
+    count = len(names)
+    plain_engine = ComicFilenameEngine(prescan=prescan)
+    plain = measure(lambda: [plain_engine.parse(name) for name in names])
+    report("engine.parse" + label, count, plain)
+    engine = ComicFilenameEngine(prescan=prescan, codegen=True)
+    generated = measure(lambda: [engine.parse(name) for name in names])
+    report(
+        "engine.parse codegen=True" + label,
+        count,
+        generated,
+        f"speedup x{plain / generated:.2f}",
+    )
+
+
+def run(count: int) -> None:
+    """Parse the corpus with and without the generated parse function."""
+    print(f"# codegen: {count} names")
+    names = corpus(count)
+    _compare(names, "", prescan=False)
+    _compare(names, " prescan=True", prescan=True)
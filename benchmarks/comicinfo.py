@@ -0,0 +1,56 @@
+"""Benchmark reading ComicInfo.xml against extracting whole archives."""
+
+from os import urandom
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from zipfile import ZipFile
+
+from benchmarks.common import corpus, measure, report, timed
+from comicfn2dict.comicinfo import enrich_batch, parse_comicinfo, read_comicinfo
+
+_PAGES = 24
+_PAGE_SIZE = 256 * 1024
+# Archives on disk, however many names the other benchmarks parse.
+_MAX_COUNT = 200
+_COMICINFO = b"<ComicInfo><Series>Saga</Series><Number>1</Number></ComicInfo>"
+
+
+def _make_archives(root: Path, count: int) -> list[str]:
+    """Make archives of incompressible pages, like real scans."""
+    page = urandom(_PAGE_SIZE)
+    paths = []
+    for name in corpus(count):
+        path = root / f"{len(paths):05d} {Path(name).stem}.cbz"
+        with ZipFile(path, "w") as archive:
+            for number in range(_PAGES):
+                archive.writestr(f"{number:03d}.jpg", page)
+            archive.writestr("ComicInfo.xml", _COMICINFO)
+        paths.append(str(path))
+    return paths
+
+
+def _extract(path: str) -> dict[str, str]:
+    """Read every member, as extracting the archive would."""
+    with ZipFile(path) as archive:
+        members = {info.filename: archive.read(info) for info in archive.infolist()}
+    return parse_comicinfo(members["ComicInfo.xml"])
+
+
+def run(count: int) -> None:
+    """Read ComicInfo from archives by extraction and by central directory."""
+    count = min(count, _MAX_COUNT)
+    with TemporaryDirectory() as tmp:
+        paths = _make_archives(Path(tmp), count)
+        size = _PAGES * _PAGE_SIZE // (1024 * 1024)
+        print(f"# comicinfo: {count} archives of {_PAGES} pages, {size}MiB each")
+        extract = timed(
+            "extract whole archive", count, lambda: list(map(_extract, paths))
+        )
+        central = measure(lambda: list(map(read_comicinfo, paths)))
+        report(
+            "read_comicinfo",
+            count,
+            central,
+            f"speedup x{extract / central:.2f}",
+        )
+        timed("enrich_batch", count, lambda: enrich_batch(paths))
@@ -0,0 +1,42 @@
+"""Shared benchmark helpers."""
+
+from __future__ import annotations
+
+from itertools import cycle, islice
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from tests.comic_filenames import PARSE_FNS
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_LABEL_WIDTH = 40
+
+
+def corpus(count: int) -> list[str]:
+    """Cycle the test filenames into a corpus of count names."""
+    return list(islice(cycle(PARSE_FNS), count))
+
+
+def report(label: str, count: int, seconds: float, extra: str = "") -> None:
+    """Print one benchmark result line."""
+    rate = count / seconds if seconds else float("inf")
+    line = f"{label:<{_LABEL_WIDTH}} {count:>9} {seconds:>9.3f}s {rate:>12,.0f}/s"
+    if extra:
+        line += f"  {extra}"
+    print(line)
+
+
+def measure(func: Callable[[], object]) -> float:
+    """Time one call to func."""
+    start = perf_counter()
+    func()
+    return perf_counter() - start
+
+
+def timed(label: str, count: int, func: Callable[[], object], extra: str = "") -> float:
+    """Time one call to func and report it."""
+    seconds = measure(func)
+    report(label, count, seconds, extra)
+    return seconds
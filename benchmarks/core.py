@@ -0,0 +1,55 @@
+"""Benchmark the parser core and compare pure python with compiled builds."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from benchmarks.common import corpus, timed
+from comicfn2dict import comicfn2dict, dict2comicfn
+from comicfn2dict.compiled import compiled_modules
+
+_RESULTS_DIR = Path("test-results/benchmarks")
+
+
+def _build() -> str:
+    """Name the build being measured."""
+    return "compiled" if compiled_modules() else "pure"
+
+
+def _save(build: str, rates: dict[str, float]) -> dict[str, float]:
+    """Save this build's rates and load the other build's."""
+    _RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    (_RESULTS_DIR / f"core-{build}.json").write_text(json.dumps(rates))
+    other = "pure" if build == "compiled" else "compiled"
+    other_path = _RESULTS_DIR / f"core-{other}.json"
+    return json.loads(other_path.read_text()) if other_path.exists() else {}
+
+
+def run(count: int) -> None:
+    """Time parsing and serializing with whichever build is installed."""
+    build = _build()
+    print(
+        f"# core {build}: " + (", ".join(compiled_modules()) or "no compiled modules")
+    )
+    names = corpus(count)
+    metadatas: list = []
+
+    def _parse() -> None:
+        metadatas.extend(comicfn2dict(name) for name in names)
+
+    rates = {
+        "parse": count / timed(f"comicfn2dict {build}", count, _parse),
+        "serialize": count
+        / timed(
+            f"dict2comicfn {build}",
+            count,
+            lambda: [dict2comicfn(md) for md in metadatas],
+        ),
+    }
+    other_rates = _save(build, rates)
+    pure = other_rates if build == "compiled" else rates
+    compiled = rates if build == "compiled" else other_rates
+    for label in rates:
+        if label in pure and label in compiled:
+            print(f"  {label} speedup {compiled[label] / pure[label]:.2f}x")
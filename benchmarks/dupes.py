@@ -0,0 +1,15 @@
+"""Benchmark duplicate detection over parsed records."""
+
+from benchmarks.common import corpus, timed
+from comicfn2dict.batch import iter_parsed
+from comicfn2dict.dupes import DuplicateIndex
+
+
+def run(count: int) -> None:
+    """Index parsed records by identity fingerprint."""
+    print(f"# dupes: {count} records")
+    records = list(iter_parsed(corpus(count)))
+    index = DuplicateIndex()
+    timed("DuplicateIndex.add_many", count, lambda: index.add_many(records))
+    groups = sum(1 for _ in index.iter_groups())
+    print(f"{len(index)} distinct issues, {groups} duplicate groups")
@@ -0,0 +1,53 @@
+"""Benchmark building, loading and querying the series index."""
+
+from __future__ import annotations
+
+import random
+import string
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from benchmarks.common import timed
+from comicfn2dict.matcher import SeriesIndex
+
+_QUERIES = 2000
+
+
+def _catalog(count: int) -> list[str]:
+    """Make a catalog of made up series names."""
+    rng = random.Random(0)  # noqa: S311
+    words = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9)))
+        for _ in range(max(count // 10, 100))
+    ]
+    return [
+        " ".join(rng.choice(words).title() for _ in range(rng.randint(1, 4)))
+        for _ in range(count)
+    ]
+
+
+def run(count: int) -> None:
+    """Time the index with a catalog of count series."""
+    print(f"# matcher: {count} series")
+    catalog = _catalog(count)
+    index = SeriesIndex.build([])
+
+    def _build() -> None:
+        nonlocal index
+        index = SeriesIndex.build(catalog)
+
+    timed("SeriesIndex.build", count, _build)
+    with TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "series.idx"
+        timed("SeriesIndex.save", count, lambda: index.save(path))
+        timed("SeriesIndex.load", count, lambda: SeriesIndex.load(path))
+    rng = random.Random(1)  # noqa: S311
+    exact = rng.sample(catalog, min(_QUERIES, len(catalog)))
+    fuzzy = [name[:-1] + "x" for name in exact]
+    timed("lookup exact", len(exact), lambda: [index.lookup(name) for name in exact])
+    timed("lookup fuzzy", len(fuzzy), lambda: [index.lookup(name) for name in fuzzy])
+    timed(
+        "lookup fuzzy cached",
+        len(fuzzy),
+        lambda: [index.lookup(name) for name in fuzzy],
+    )
@@ -0,0 +1,117 @@
+"""Measure allocations and peak memory, failing on regressions."""
+
+from __future__ import annotations
+
+import gc
+import json
+import os
+import sys
+import tracemalloc
+from io import StringIO
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from benchmarks.common import corpus
+from comicfn2dict import comicfn2dict, dict2comicfn
+from comicfn2dict.batch import batch
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+_LIMITS_PATH = Path(__file__).parent / "memory_limits.json"
+_LIMITS_ENV = "BENCH_MEMORY_LIMITS"
+_SAMPLE_SIZE = 2000
+_LABEL_WIDTH = 40
+
+
+class _NullOutput(StringIO):
+    """Discard batch output so only parsing is measured."""
+
+    def write(self, s: str) -> int:
+        """Discard."""
+        return len(s)
+
+    def writelines(self, lines: Iterable[str]) -> None:
+        """Discard."""
+        for _ in lines:
+            pass
+
+
+def _load_limits() -> dict[str, float]:
+    """Load byte limits from the env var path or the default file."""
+    path = Path(os.environ.get(_LIMITS_ENV, _LIMITS_PATH))
+    return json.loads(path.read_text())
+
+
+def _per_call(func: Callable[[Any], object], args: list) -> float:
+    """Average peak bytes allocated during one call."""
+    total = 0
+    for arg in args:
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        func(arg)
+        _, peak = tracemalloc.get_traced_memory()
+        total += peak - before
+    return total / len(args)
+
+
+def _batch_peak(names: list[str]) -> float:
+    """Peak bytes for a streaming batch run, beyond the names themselves."""
+    tracemalloc.reset_peak()
+    before, _ = tracemalloc.get_traced_memory()
+    batch(iter(names), _NullOutput())
+    _, peak = tracemalloc.get_traced_memory()
+    return peak - before
+
+
+def _retained(names: list[str]) -> float:
+    """Bytes per parse result held in a list."""
+    gc.collect()
+    before, _ = tracemalloc.get_traced_memory()
+    results = [comicfn2dict(name) for name in names]
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    del results
+    return (after - before) / len(names)
+
+
+def _check(label: str, key: str, value: float, limits: dict[str, float]) -> bool:
+    """Report one measurement against its limit."""
+    limit = limits.get(key)
+    ok = limit is None or value <= limit
+    status = "ok" if ok else "REGRESSION"
+    limit_text = f"limit {limit:>12,.0f}" if limit is not None else ""
+    print(f"{label:<{_LABEL_WIDTH}} {value:>12,.0f} bytes  {limit_text}  {status}")
+    return ok
+
+
+def run(count: int) -> None:
+    """Measure memory and exit 1 if any measurement is over its limit."""
+    print(f"# memory: {count} names")
+    limits = _load_limits()
+    names = corpus(count)
+    sample = names[:_SAMPLE_SIZE]
+    metadatas = [comicfn2dict(name) for name in sample]
+
+    tracemalloc.start()
+    try:
+        results = (
+            _check(
+                "comicfn2dict per call",
+                "parse_call",
+                _per_call(comicfn2dict, sample),
+                limits,
+            ),
+            _check(
+                "dict2comicfn per call",
+                "serialize_call",
+                _per_call(dict2comicfn, metadatas),
+                limits,
+            ),
+            _check("batch peak", "batch_peak", _batch_peak(names), limits),
+            _check("held result", "held_result", _retained(sample), limits),
+        )
+    finally:
+        tracemalloc.stop()
+    if not all(results):
+        sys.exit(1)
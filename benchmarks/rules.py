@@ -0,0 +1,56 @@
+"""Benchmark rule packs compiled into one pattern per stage."""
+
+from benchmarks.common import corpus, measure, report
+from comicfn2dict.engine import ComicFilenameEngine
+from comicfn2dict.regex import re_compile
+from comicfn2dict.rules import RULE_STAGES, Rule, compile_rules
+
+_RULE_COUNT = 50
+
+
+def _rules() -> tuple[Rule, ...]:
+    """Make site rules spread over every stage that rarely match."""
+    patterns = (r"\((site{}-\w+)\)", r"\b(tag{})\b", r"-(release{})$")
+    return tuple(
+        Rule(
+            f"site_{index}",
+            patterns[index % len(patterns)].format(index),
+            stage=RULE_STAGES[index % len(RULE_STAGES)],
+        )
+        for index in range(_RULE_COUNT)
+    )
+
+
+def run(count: int) -> None:
+    """Parse with and without rules and compare combined to separate scans."""
+    print(f"# rules: {count} names, {_RULE_COUNT} rules")
+    names = corpus(count)
+    rules = _rules()
+    plain_engine = ComicFilenameEngine()
+    plain = measure(lambda: plain_engine.parse_batch(names))
+    report("engine.parse_batch", count, plain)
+    engine = ComicFilenameEngine(rules=rules)
+    with_rules = measure(lambda: engine.parse_batch(names))
+    report(
+        f"engine.parse_batch {_RULE_COUNT} rules",
+        count,
+        with_rules,
+        f"overhead x{with_rules / plain:.2f}",
+    )
+
+    # Both sides find every match, as a stage has to.
+    separate_res = [re_compile(rule.pattern) for rule in rules]
+    separate = measure(
+        lambda: [list(regex.finditer(name)) for name in names for regex in separate_res]
+    )
+    report(f"{_RULE_COUNT} separate searches", count, separate)
+    stage_res = [stage_rules.regex for stage_rules in compile_rules(rules).values()]
+    combined = measure(
+        lambda: [list(regex.finditer(name)) for name in names for regex in stage_res]
+    )
+    report(
+        f"{len(stage_res)} combined stage scans",
+        count,
+        combined,
+        f"speedup x{separate / combined:.2f}",
+    )
@@ -0,0 +1,67 @@
+"""Benchmark walking a library with simulated network filesystem latency."""
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import sleep
+
+from benchmarks.common import measure, report
+from comicfn2dict import scan
+
+_FILES_PER_DIR = 50
+_DIRS_PER_PUBLISHER = 20
+_LATENCY = 0.002
+_WORKERS = 16
+# Files on disk, however many names the other benchmarks parse.
+_MAX_COUNT = 100_000
+
+
+def _make_library(root: Path, count: int) -> int:
+    """Make publisher and series directories of empty comics."""
+    dirs = 0
+    for index in range(count):
+        series, number = divmod(index, _FILES_PER_DIR)
+        publisher = series // _DIRS_PER_PUBLISHER
+        path = root / f"Publisher {publisher}" / f"Series {series}"
+        if not number:
+            path.mkdir(parents=True, exist_ok=True)
+            dirs += 1
+        (path / f"Series {series} #{number:03d}.cbz").touch()
+    return dirs
+
+
+def _walk(root: Path, workers: int) -> list[str]:
+    """Walk the whole library."""
+    return list(scan.iter_library(root, workers=workers))
+
+
+def _compare(root: Path, count: int, extra: str = "") -> None:
+    """Time serial and thread pool walks."""
+    serial = measure(lambda: _walk(root, 1))
+    report("iter_library", count, serial, extra)
+    pooled = measure(lambda: _walk(root, _WORKERS))
+    extra = f"{extra} speedup x{serial / pooled:.2f}".strip()
+    report(f"iter_library workers={_WORKERS}", count, pooled, extra)
+
+
+def run(count: int) -> None:
+    """Walk a library serially and on a thread pool."""
+    count = min(count, _MAX_COUNT)
+    with TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        dirs = _make_library(root, count)
+        print(f"# scan: {count} comics in {dirs} series directories")
+        _compare(root, count)
+        list_dir = scan._list_dir  # noqa: SLF001
+
+        def slow_list_dir(
+            path: str, suffixes: frozenset[str]
+        ) -> list[tuple[str, bool]]:
+            """List a directory after a network round trip."""
+            sleep(_LATENCY)
+            return list_dir(path, suffixes)
+
+        scan._list_dir = slow_list_dir  # noqa: SLF001
+        try:
+            _compare(root, count, f"{_LATENCY * 1000:.0f}ms per scandir")
+        finally:
+            scan._list_dir = list_dir  # noqa: SLF001
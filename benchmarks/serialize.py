@@ -0,0 +1,21 @@
+"""Benchmark filename rendering."""
+
+from benchmarks.common import corpus, timed
+from comicfn2dict import comicfn2dict, dict2comicfn
+from comicfn2dict.unparse import FilenameTemplate
+
+
+def run(count: int) -> None:
+    """Render the parsed corpus per call and in bulk."""
+    print("# serialize")
+    mds = [comicfn2dict(name) for name in corpus(count)]
+    timed("dict2comicfn", count, lambda: [dict2comicfn(md) for md in mds])
+    template = FilenameTemplate()
+    timed("FilenameTemplate.render_many", count, lambda: template.render_many(mds))
+    keys = sorted({key for md in mds for key in md})
+    columns = {key: [md.get(key) for md in mds] for key in keys}
+    timed(
+        "FilenameTemplate.render_columns",
+        count,
+        lambda: template.render_columns(columns),
+    )
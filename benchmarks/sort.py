@@ -0,0 +1,52 @@
+"""Benchmark sorting issue numbers."""
+
+import random
+from operator import itemgetter
+
+from benchmarks.common import timed
+from comicfn2dict.sort import issue_sort_key
+
+_SUFFIXES = ("", "", "", "", "a", "b", "AU", ".BEY")
+_MAX_ISSUE = 1000
+
+
+def _issues(count: int) -> list[str]:
+    """Make a list of issue numbers in the forms the parser finds."""
+    rng = random.Random(42)  # noqa: S311
+    issues = []
+    for _ in range(count):
+        number = str(rng.randrange(_MAX_ISSUE)).zfill(rng.choice((1, 3)))
+        form = rng.random()
+        if form < 0.05:  # noqa: PLR2004
+            number += "½"
+        elif form < 0.1:  # noqa: PLR2004
+            number += f".{rng.randrange(10)}"
+        elif form < 0.12:  # noqa: PLR2004
+            number = "-" + number
+        issues.append(number + rng.choice(_SUFFIXES))
+    return issues
+
+
+def run(count: int) -> None:
+    """Sort issue numbers as strings, by sort key and by precomputed keys."""
+    print(f"# sort: {count} issues")
+    issues = _issues(count)
+    timed("sorted by string (wrong order)", count, lambda: sorted(issues))
+    issue_sort_key.cache_clear()
+    timed(
+        "sorted by issue_sort_key cold",
+        count,
+        lambda: sorted(issues, key=issue_sort_key),
+    )
+    timed(
+        "sorted by issue_sort_key warm",
+        count,
+        lambda: sorted(issues, key=issue_sort_key),
+    )
+    # Parse results with sort_keys=True carry their keys.
+    records = [(issue, issue_sort_key(issue)) for issue in issues]
+    timed(
+        "sorted by precomputed keys",
+        count,
+        lambda: sorted(records, key=itemgetter(1)),
+    )
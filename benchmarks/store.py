@@ -0,0 +1,53 @@
+"""Benchmark lookups in the result store against a dict of results."""
+
+import tracemalloc
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from benchmarks.common import corpus, measure, report, timed
+from comicfn2dict.batch import dump_record, iter_parsed, load_record
+from comicfn2dict.store import ResultStore, write_store
+
+_MIB = 1024 * 1024
+
+
+def _records(count: int) -> list[str]:
+    """Parse unique paths into batch JSON lines."""
+    names = corpus(count)
+    paths = [f"comics/{index:07d}/{name}" for index, name in enumerate(names)]
+    return [dump_record(path, metadata) for path, metadata in iter_parsed(paths)]
+
+
+def _dict_size(lines: list[str]) -> tuple[dict, int]:
+    """Load results into a dict the way a worker process would."""
+    tracemalloc.start()
+    results = dict(map(load_record, lines))
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return results, size
+
+
+def run(count: int) -> None:
+    """Compare a per process dict with one shared store file."""
+    print(f"# store: {count} results")
+    lines = _records(count)
+    results, dict_size = _dict_size(lines)
+    paths = list(results)
+    with TemporaryDirectory() as tmp:
+        path = Path(tmp) / "results.store"
+        timed(
+            "write_store",
+            count,
+            lambda: write_store((load_record(line) for line in lines), path),
+        )
+        store_size = path.stat().st_size
+        jsonl_size = sum(len(line.encode()) for line in lines)
+        print(
+            f"dict {dict_size / _MIB:.1f}MiB per process,"
+            f" store {store_size / _MIB:.1f}MiB shared,"
+            f" jsonl {jsonl_size / _MIB:.1f}MiB"
+        )
+        plain = timed("dict lookups", count, lambda: [results[p] for p in paths])
+        with ResultStore(path) as store:
+            mapped = measure(lambda: [store[p] for p in paths])
+            report("ResultStore lookups", count, mapped, f"x{plain / mapped:.2f}")
@@ -0,0 +1,26 @@
+"""Benchmark thread scaling of the shared engine."""
+
+import sys
+
+from benchmarks.common import corpus, measure, report
+from comicfn2dict.engine import ComicFilenameEngine
+
+_THREAD_COUNTS = (1, 2, 4, 8)
+
+
+def run(count: int) -> None:
+    """Parse the corpus with increasing thread counts."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)
+    print(f"# threads: GIL {'enabled' if is_gil_enabled() else 'disabled'}")
+    names = corpus(count)
+    engine = ComicFilenameEngine()
+    single = 0.0
+    for workers in _THREAD_COUNTS:
+        seconds = measure(lambda workers=workers: engine.parse_many(names, workers))
+        single = single or seconds
+        report(
+            f"engine.parse_many workers={workers}",
+            count,
+            seconds,
+            f"speedup x{single / seconds:.2f}",
+        )
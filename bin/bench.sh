@@ -0,0 +1,4 @@
+#!/bin/bash
+# Run benchmarks
+set -euxo pipefail
+uv run python -m benchmarks "$@"
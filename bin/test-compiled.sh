@@ -0,0 +1,14 @@
+#!/bin/bash
+# Run tests and the core benchmark against pure python then mypyc compiled modules
+set -euxo pipefail
+CORE=(comicfn2dict/parse.py comicfn2dict/unparse.py)
+clean() {
+  rm -rf build comicfn2dict/*.so ./*__mypyc*.so
+}
+trap clean EXIT
+clean
+./bin/test.sh "$@"
+uv run python -m benchmarks core
+uv run --with mypy mypyc "${CORE[@]}"
+COMICFN2DICT_EXPECT_COMPILED=1 ./bin/test.sh "$@"
+uv run python -m benchmarks core
@@ -1,4 +1,14 @@
 """Comic Filename to Dict parser and unparser."""
 
-from .parse import ComicFilenameParser, comicfn2dict  # noqa: F401
-from .unparse import ComicFilenameSerializer, dict2comicfn  # noqa: F401
+from .engine import ComicFilenameEngine  # noqa: F401
+from .parse import (  # noqa: F401
+    ComicFilenameParser,
+    comicfn2dict,
+    comicfn2dict_batch,
+    iter_comicfn2dict_batch,
+)
+from .unparse import (  # noqa: F401
+    ComicFilenameSerializer,
+    columns2comicfn,
+    dict2comicfn,
+)
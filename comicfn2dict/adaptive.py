@@ -0,0 +1,97 @@
+"""Learn which fallback patterns are worth guarding from observed hit rates."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from threading import Lock
+from types import MappingProxyType
+
+# Literals each fallback pattern can't match without. A guard never changes
+#     results, it only skips searches that can't hit.
+FALLBACK_GUARDS: MappingProxyType[str, str] = MappingProxyType(
+    {
+        "issue_number": "#",
+        "issue_with_count": "(of",
+        "volume_with_count": "(of",
+        "secondary_scan_info": "c2c",
+        "book_volume": "book",
+    }
+)
+_PROFILE_VERSION = 1
+# Guard patterns until there are enough tries to trust their hit rate.
+_MIN_TRIES = 256
+_GUARD_BELOW_HIT_RATE = 0.5
+
+
+class AdaptiveProfile:
+    """Hit rates of fallback patterns, persisted between runs."""
+
+    # Guarding a pattern that usually hits only adds a substring test, and
+    #     searching for one that usually misses wastes a regex scan, so each
+    #     pattern is guarded while its hit rate is low. Engines shared by
+    #     threads record into one profile, so counts change under a lock.
+
+    def record(self, name: str, hit: bool) -> None:
+        """Count one try of a fallback pattern."""
+        with self._lock:
+            counts = self._counts.setdefault(name, [0, 0])
+            counts[0] += 1
+            if hit:
+                counts[1] += 1
+
+    def _snapshot(self) -> list[tuple[str, tuple[int, ...]]]:
+        """Copy the counts, sorted by pattern name."""
+        with self._lock:
+            return sorted(
+                (name, tuple(counts)) for name, counts in self._counts.items()
+            )
+
+    def use_guard(self, name: str) -> bool:
+        """Whether to test the guard literal before searching."""
+        tries, hits = self._counts.get(name, (0, 0))
+        return tries < _MIN_TRIES or hits < tries * _GUARD_BELOW_HIT_RATE
+
+    def rates(self) -> dict[str, float]:
+        """Hit rate of each fallback pattern."""
+        return {name: hits / tries for name, (tries, hits) in self._snapshot() if tries}
+
+    def merge(self, other: AdaptiveProfile) -> None:
+        """Add another profile's counts to this one."""
+        other_counts = other._snapshot()
+        with self._lock:
+            for name, (tries, hits) in other_counts:
+                counts = self._counts.setdefault(name, [0, 0])
+                counts[0] += tries
+                counts[1] += hits
+
+    def save(self, path: str | Path) -> None:
+        """Write the profile as JSON."""
+        data = {
+            "version": _PROFILE_VERSION,
+            "patterns": {
+                name: {"tries": tries, "hits": hits}
+                for name, (tries, hits) in self._snapshot()
+            },
+        }
+        Path(path).write_text(json.dumps(data, indent=2) + "\n")
+
+    @classmethod
+    def load(cls, path: str | Path) -> AdaptiveProfile:
+        """Read a saved profile, or start a new one if there isn't one."""
+        profile = cls()
+        path = Path(path)
+        if not path.exists():
+            return profile
+        data = json.loads(path.read_text())
+        if data.get("version") != _PROFILE_VERSION:
+            return profile
+        for name, counts in data.get("patterns", {}).items():
+            if name in FALLBACK_GUARDS:
+                profile._counts[name] = [int(counts["tries"]), int(counts["hits"])]
+        return profile
+
+    def __init__(self):
+        """Initialize empty counts of tries and hits."""
+        self._lock = Lock()
+        self._counts: dict[str, list[int]] = {}
@@ -0,0 +1,134 @@
+"""Parse listings of many filenames into JSON lines."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, TextIO
+
+from comicfn2dict.engine import ComicFilenameEngine
+from comicfn2dict.listing import decode_path, iter_listing, listing_path_at
+from comicfn2dict.shard import iter_numbered_shard
+from comicfn2dict.util import JSON_SEPARATORS, iter_chunks
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+    from pathlib import Path
+
+    from comicfn2dict.checkpoint import Checkpointer
+
+
+def dump_record(path: str, metadata: Mapping, offset: int | None = None) -> str:
+    """Serialize one parse result as a JSON line."""
+    record: dict = {"path": path}
+    if offset is not None:
+        record["offset"] = offset
+    record["metadata"] = metadata
+    return json.dumps(record, separators=JSON_SEPARATORS, ensure_ascii=False) + "\n"
+
+
+def load_record(line: str | bytes) -> tuple[str, dict[str, str | tuple[str, ...]]]:
+    """Deserialize one JSON line into a path and metadata."""
+    record = json.loads(line)
+    metadata = record["metadata"]
+    for key, value in metadata.items():
+        if isinstance(value, list):
+            metadata[key] = tuple(value)
+    return record["path"], metadata
+
+
+def iter_lines(lines: Iterable[str]) -> Iterator[str]:
+    """Strip line endings and skip blank lines."""
+    for line in lines:
+        if path := line.rstrip("\r\n"):
+            yield path
+
+
+def iter_records(lines: Iterable[str]) -> Iterator[tuple[str, dict]]:
+    """Load paths and metadata from JSON lines, skipping blank lines."""
+    for line in lines:
+        if line.strip():
+            yield load_record(line)
+
+
+def iter_parsed(
+    paths: Iterable[str],
+    chunk_size: int = 1024,
+    engine: ComicFilenameEngine | None = None,
+) -> Iterator[tuple[str, dict[str, str | tuple[str, ...]]]]:
+    """Parse paths a chunk at a time, yielding each path with its metadata."""
+    engine = engine or ComicFilenameEngine()
+    for chunk in iter_chunks(paths, chunk_size):
+        yield from zip(chunk, engine.parse_batch(chunk, chunk_size=chunk_size))  # noqa: B905
+
+
+def _write_chunks(
+    items: Iterable[tuple[int | None, str, str]],
+    output: TextIO,
+    chunk_size: int,
+    engine: ComicFilenameEngine | None,
+    checkpointer: Checkpointer | None = None,
+) -> int:
+    """Parse the names of offset, path & name records a chunk at a time."""
+    engine = engine or ComicFilenameEngine()
+    count = 0
+    for chunk in iter_chunks(items, chunk_size):
+        results = engine.parse_batch(
+            (name for *_, name in chunk), chunk_size=chunk_size
+        )
+        output.writelines(
+            dump_record(path, metadata, offset)
+            for (offset, path, _), metadata in zip(chunk, results)  # noqa: B905
+        )
+        count += len(chunk)
+        if checkpointer:
+            checkpointer.update(output, chunk)
+    if checkpointer:
+        checkpointer.finish()
+    return count
+
+
+def batch(  # noqa: PLR0913
+    paths: Iterable[str],
+    output: TextIO,
+    chunk_size: int = 1024,
+    shard: tuple[int, int] | None = None,
+    engine: ComicFilenameEngine | None = None,
+    *,
+    checkpointer: Checkpointer | None = None,
+) -> int:
+    """Parse paths into JSON lines numbered in input order, returning the count."""
+    items: Iterable[tuple[int | None, str]] = iter_numbered_shard(paths, shard)
+    if checkpointer:
+        # Resume after the paths the checkpoint counts.
+        checkpointer.restore(output)
+        items = checkpointer.skip(items)
+    records = ((number, path, path) for number, path in items)
+    return _write_chunks(records, output, chunk_size, engine, checkpointer)
+
+
+def batch_listing(  # noqa: PLR0913, PLR0917
+    listing: str | Path,
+    output: TextIO,
+    chunk_size: int = 1024,
+    start: int = 0,
+    end: int | None = None,
+    shard: tuple[int, int] | None = None,
+    engine: ComicFilenameEngine | None = None,
+    *,
+    checkpointer: Checkpointer | None = None,
+) -> int:
+    """Parse the lines in a byte range of a listing file by their basenames."""
+    if checkpointer:
+        # Resume at the line after the last one the checkpoint counts, if
+        #     that line is still at its offset.
+        last_offset = checkpointer.restore(output).last_offset
+        if last_offset is not None:
+            checkpointer.check_last_path(listing_path_at(listing, last_offset))
+            start = max(start, last_offset + 1)
+    items = (
+        (offset, decode_path(raw_path), name)
+        for offset, raw_path, name in iter_listing(
+            listing, start=start, end=end, shard=shard
+        )
+    )
+    return _write_chunks(items, output, chunk_size, engine, checkpointer)
@@ -0,0 +1,180 @@
+"""Read names already in the dict2comicfn() layout without the full parser."""
+
+from __future__ import annotations
+
+import re
+from string import Formatter
+from threading import Lock
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+from comicfn2dict.regex import (
+    ORIGINAL_FORMAT_PATTERNS,
+    PUBLISHERS_AMBIGUOUS,
+    PUBLISHERS_UNAMBIGUOUS,
+)
+from comicfn2dict.unparse import _FILENAME_FORMAT_TAGS, issue_formatter
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from re import Pattern
+
+# Only the fields the full parser reads back unchanged from their canonical
+#     form get a pattern. Names with any other field, like publisher, dates
+#     with months or remainders, don't match and take the full parser.
+#     Words are letters only so no numeric pattern can match inside them.
+_WORD = r"[A-Za-z]+(?:[-'][A-Za-z]+)*"
+_WORDS = _WORD + r"(?: " + _WORD + r")*"
+_FIELD_PATTERNS: MappingProxyType[str, str] = MappingProxyType(
+    {
+        "series": _WORDS,
+        "volume": r"\d+",
+        "volume_count": r"\d+",
+        "issue": r"\d+(?:\.\d+)?[A-Za-z]?",
+        "issue_count": r"\d+",
+        "date": r"[12]\d{3}",
+        "title": _WORDS,
+        # Dashes split formats from scan info in the full parser.
+        "original_format": r"[A-Za-z][A-Za-z' ]*",
+        "scan_info": _WORDS,
+    }
+)
+# The metadata key each field is read into.
+_FIELD_KEYS: MappingProxyType[str, str] = MappingProxyType({"date": "year"})
+# The full parser adds keys in this order.
+_KEY_ORDER: tuple[str, ...] = (
+    "ext",
+    "issue",
+    "issue_count",
+    "volume",
+    "volume_count",
+    "year",
+    "original_format",
+    "scan_info",
+    "series",
+    "title",
+)
+_SAMPLE_ISSUE = "1"
+_MIN_TOKEN_LENGTH = 2
+# Publisher and format words make the full parser move text between fields.
+_UNSAFE_WORDS_RE: Pattern = re.compile(
+    r"\b(?:"
+    + r"|".join(
+        PUBLISHERS_UNAMBIGUOUS + PUBLISHERS_AMBIGUOUS + ORIGINAL_FORMAT_PATTERNS
+    )
+    + r")\b",
+    flags=re.IGNORECASE,
+)
+_ORIGINAL_FORMAT_RE: Pattern = re.compile(
+    r"|".join(ORIGINAL_FORMAT_PATTERNS), flags=re.IGNORECASE
+)
+
+
+def _field_exp(tag: str, fmt: str | Callable) -> str:
+    """Turn one format tag into a named group wrapped in its literals."""
+    if callable(fmt):
+        # Formatters return the format string they apply.
+        fmt = fmt(_SAMPLE_ISSUE) if fmt is issue_formatter else "{}"
+    exp = ""
+    for literal, field, _spec, _conversion in Formatter().parse(fmt):
+        exp += re.escape(literal)
+        if field is not None:
+            key = _FIELD_KEYS.get(tag, tag)
+            exp += "(?P<" + key + ">" + _FIELD_PATTERNS[tag] + ")"
+    return exp
+
+
+def _canonical_exp() -> str:
+    """Build one anchored pattern from the dict2comicfn() format tags."""
+    fields = [
+        _field_exp(tag, fmt)
+        for tag, fmt in _FILENAME_FORMAT_TAGS
+        if tag in _FIELD_PATTERNS
+    ]
+    first, *rest = fields
+    optional = "".join("(?: " + field + ")?" for field in rest)
+    return first + optional + r"\.(?P<ext>[A-Za-z0-9]+)"
+
+
+CANONICAL_RE: Pattern = re.compile(_canonical_exp())
+
+
+def _is_at_title_position(name: str, title: str, groups: dict) -> bool:
+    """Check the title the way the full parser does, by first occurrences."""
+    title_index = name.find(title)
+    if title_index < name.find(groups["series"]):
+        return False
+    return all(
+        title_index <= name.find(value)
+        for key in ("original_format", "scan_info")
+        if (value := groups[key]) is not None
+    )
+
+
+def _is_readable(groups: dict, alpha_month_range_re: Pattern) -> bool:
+    """Check that the full parser would read the fields back unchanged."""
+    # The full parser only reads these fields in these combinations.
+    if (
+        # Volumes without issues are copied into issue.
+        (groups["issue"] is None and groups["volume"] is not None)
+        or (groups["original_format"] is None) != (groups["scan_info"] is None)
+        or (groups["volume_count"] is not None and groups["volume"] is None)
+    ):
+        return False
+    values = [
+        value
+        for key in ("series", "title", "scan_info")
+        if (value := groups[key]) is not None
+    ]
+    # Series and title tokens shorter than two characters are remainders.
+    if any(len(value) < _MIN_TOKEN_LENGTH for value in values):
+        return False
+    # Join on a divider so lookbehinds can't see across fields.
+    words = "/".join(values)
+    if _UNSAFE_WORDS_RE.search(words) or (
+        "-" in words and alpha_month_range_re.search(words)
+    ):
+        return False
+    original_format = groups["original_format"]
+    return original_format is None or bool(
+        _ORIGINAL_FORMAT_RE.fullmatch(original_format)
+    )
+
+
+def match_canonical(
+    name: str, alpha_month_range_re: Pattern
+) -> dict[str, str | tuple[str, ...]] | None:
+    """Read a canonical name into metadata, or None if it needs the full parser."""
+    match = CANONICAL_RE.fullmatch(name)
+    if not match:
+        return None
+    groups = match.groupdict()
+    if not _is_readable(groups, alpha_month_range_re):
+        return None
+    if (title := groups["title"]) is not None and not _is_at_title_position(
+        name, title, groups
+    ):
+        return None
+    return {key: value for key in _KEY_ORDER if (value := groups[key]) is not None}
+
+
+class CanonicalCounts:
+    """Count names tried on the canonical fast path and how many it read."""
+
+    def record(self, hit: bool) -> None:
+        """Count one try."""
+        with self._lock:
+            self.tries += 1
+            if hit:
+                self.hits += 1
+
+    @property
+    def rate(self) -> float:
+        """Fraction of tried names the fast path read."""
+        return self.hits / self.tries if self.tries else 0.0
+
+    def __init__(self):
+        """Initialize zero counts."""
+        self._lock = Lock()
+        self.tries: int = 0
+        self.hits: int = 0
@@ -0,0 +1,234 @@
+"""Query parse results by field with in memory indexes."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from comicfn2dict.dupes import normalize_number
+from comicfn2dict.matcher import normalize_series
+from comicfn2dict.sort import issue_sort_key
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+
+    from comicfn2dict.sort import IssueSortKey
+
+    YearBound = int | str | None
+    IssueBound = str | None
+    RangeKey = int | IssueSortKey
+
+# Value id & rank columns hold this for rows without the field. It is
+#     outside every condition's bounds.
+_MISSING = 0xFFFFFFFF
+_HASH_FIELDS: tuple[tuple[str, Callable[[str], str]], ...] = (
+    ("publisher", str.casefold),
+    ("original_format", str.casefold),
+    ("ext", str.casefold),
+    ("series", normalize_series),
+    ("volume", normalize_number),
+)
+
+
+class CatalogEntry(NamedTuple):
+    """A path and its parse result."""
+
+    path: str
+    metadata: Mapping
+
+
+class _Condition(NamedTuple):
+    """The rows an index matched and the column bounds that match them."""
+
+    rows: Sequence[int]
+    column: array
+    low: int
+    high: int
+
+
+def _strings(metadatas: Sequence[Mapping], field: str) -> list[str | None]:
+    """Read one field of every row, or None where it isn't a string."""
+    return [
+        value if isinstance(value := metadata.get(field), str) else None
+        for metadata in metadatas
+    ]
+
+
+def _keys(values: Sequence[str | None], make_key: Callable[[str], Any]) -> list:
+    """Make a key for each value, once per distinct value."""
+    keys: dict[str | None, Any] = {
+        value: make_key(value) for value in dict.fromkeys(values) if value
+    }
+    return [keys.get(value) for value in values]
+
+
+def _year(value: object) -> int | None:
+    """Read a year as a number."""
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str) and (value := value.strip()).isdigit():
+        return int(value)
+    return None
+
+
+def _year_bound(value: YearBound) -> int | None:
+    """Read a year bound as a number, or None for an open end."""
+    if value is None:
+        return None
+    year = _year(value)
+    if year is None:
+        reason = f"Year bounds must be numbers, not {value!r}"
+        raise ValueError(reason)
+    return year
+
+
+class _HashIndex:
+    """Rows by normalized field value."""
+
+    def condition(self, value: str) -> _Condition:
+        """Match rows with a value."""
+        value_id = self._ids.get(self._normalize(value), _MISSING)
+        if value_id == _MISSING:
+            return _Condition((), self.column, 0, 0)
+        return _Condition(self._rows[value_id], self.column, value_id, value_id + 1)
+
+    def __init__(self, values: Sequence[str | None], normalize: Callable[[str], str]):
+        """Index each row's value."""
+        self._normalize = normalize
+        self._ids: dict[str, int] = {}
+        # Libraries repeat values, so each distinct one is normalized once.
+        raw_ids: dict[str | None, int] = {}
+        for value in dict.fromkeys(values):
+            if value is not None and (key := normalize(value)):
+                raw_ids[value] = self._ids.setdefault(key, len(self._ids))
+        self.column = array("I", [raw_ids.get(value, _MISSING) for value in values])
+        self._rows: list[array] = [array("I") for _ in self._ids]
+        for row, value_id in enumerate(self.column):
+            if value_id != _MISSING:
+                self._rows[value_id].append(row)
+
+
+class _RangeIndex:
+    """Rows sorted by a comparable key."""
+
+    # Each row's rank is its position in key order, so a key range is one
+    #     slice of sorted rows and one rank range to check other rows against.
+
+    def condition(self, low: RangeKey | None, high: RangeKey | None) -> _Condition:
+        """Match rows with keys between low and high, inclusive."""
+        start = 0 if low is None else bisect_left(self._keys, low)
+        stop = len(self._keys) if high is None else bisect_right(self._keys, high)
+        stop = max(start, stop)
+        return _Condition(self._rows[start:stop], self.column, start, stop)
+
+    def __init__(self, keys: Sequence[RangeKey | None]):
+        """Sort the rows that have keys."""
+        rows = sorted(
+            (row for row, key in enumerate(keys) if key is not None),
+            key=keys.__getitem__,  # type: ignore[arg-type]
+        )
+        self._keys: list = [keys[row] for row in rows]
+        self._rows = array("I", rows)
+        self.column = array("I", [_MISSING]) * len(keys)
+        for rank, row in enumerate(rows):
+            self.column[row] = rank
+
+
+class ComicCatalog:
+    """Find parse results by publisher, format, series, volume, year & issue."""
+
+    # Equality fields have hash indexes of rows by normalized value. Years
+    #     and issue sort keys have sorted rows for range queries. A query takes
+    #     the rows of its smallest condition and checks them against the
+    #     value id or rank columns of the others.
+
+    def _conditions(  # noqa: PLR0913
+        self,
+        *,
+        publisher: str | None,
+        original_format: str | None,
+        ext: str | None,
+        series: str | None,
+        volume: str | None,
+        year: YearBound | tuple[YearBound, YearBound],
+        issue: IssueBound | tuple[IssueBound, IssueBound],
+    ) -> list[_Condition]:
+        """Make a condition for each filter given."""
+        conditions = [
+            self._hash_indexes[field].condition(value)
+            for field, value in (
+                ("publisher", publisher),
+                ("original_format", original_format),
+                ("ext", ext),
+                ("series", series),
+                ("volume", volume),
+            )
+            if value is not None
+        ]
+        if year is not None:
+            low, high = year if isinstance(year, tuple) else (year, year)
+            conditions.append(
+                self._years.condition(_year_bound(low), _year_bound(high))
+            )
+        if issue is not None:
+            low, high = issue if isinstance(issue, tuple) else (issue, issue)
+            conditions.append(
+                self._issues.condition(
+                    None if low is None else issue_sort_key(low),
+                    None if high is None else issue_sort_key(high),
+                )
+            )
+        return conditions
+
+    def query(  # noqa: PLR0913
+        self,
+        *,
+        publisher: str | None = None,
+        original_format: str | None = None,
+        ext: str | None = None,
+        series: str | None = None,
+        volume: str | None = None,
+        year: YearBound | tuple[YearBound, YearBound] = None,
+        issue: IssueBound | tuple[IssueBound, IssueBound] = None,
+    ) -> list[CatalogEntry]:
+        """Find entries matching every filter given, in catalog order."""
+        # Text filters match like their indexes normalize them. Year & issue
+        #     take one value or an inclusive (low, high) range where None is
+        #     open ended.
+        conditions = self._conditions(
+            publisher=publisher,
+            original_format=original_format,
+            ext=ext,
+            series=series,
+            volume=volume,
+            year=year,
+            issue=issue,
+        )
+        if not conditions:
+            return list(self)
+        conditions.sort(key=lambda condition: len(condition.rows))
+        first, *others = conditions
+        rows = first.rows
+        for column, low, high in ((c.column, c.low, c.high) for c in others):
+            rows = [row for row in rows if low <= column[row] < high]
+        return list(map(self._entries.__getitem__, sorted(rows)))
+
+    def __iter__(self) -> Iterator[CatalogEntry]:
+        """Iterate over every entry in catalog order."""
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        """Count entries."""
+        return len(self._entries)
+
+    def __init__(self, records: Iterable[tuple[str, Mapping]]):
+        """Index path & metadata records."""
+        self._entries: list[CatalogEntry] = list(map(CatalogEntry._make, records))
+        metadatas = [entry.metadata for entry in self._entries]
+        self._hash_indexes = {
+            field: _HashIndex(_strings(metadatas, field), normalize)
+            for field, normalize in _HASH_FIELDS
+        }
+        self._years = _RangeIndex(_keys(_strings(metadatas, "year"), _year))
+        self._issues = _RangeIndex(_keys(_strings(metadatas, "issue"), issue_sort_key))
@@ -0,0 +1,134 @@
+"""Checkpoints that let long batch & scan runs resume."""
+
+from __future__ import annotations
+
+import json
+from itertools import islice
+from os import fstat, fsync, ftruncate
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple, TextIO
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+CHECKPOINT_SUFFIX = ".checkpoint"
+DEFAULT_CHECKPOINT_EVERY = 65536
+_CHECKPOINT_VERSION = 1
+
+
+class Checkpoint(NamedTuple):
+    """How far a run got when its output was last synced to disk."""
+
+    records: int = 0
+    output_size: int = 0
+    last_path: str | None = None
+    # The listing byte offset of the last record, for listing runs.
+    last_offset: int | None = None
+
+
+def checkpoint_path(output: str | Path) -> Path:
+    """Get the path of the checkpoint kept beside an output file."""
+    return Path(str(output) + CHECKPOINT_SUFFIX)
+
+
+def load_checkpoint(path: str | Path) -> Checkpoint | None:
+    """Load a checkpoint, or None if there isn't one."""
+    try:
+        data = json.loads(Path(path).read_text())
+    except FileNotFoundError:
+        return None
+    if not isinstance(data, dict) or data.pop("version", None) != _CHECKPOINT_VERSION:
+        reason = f"{path} is not a version {_CHECKPOINT_VERSION} checkpoint"
+        raise ValueError(reason)
+    return Checkpoint(**data)
+
+
+def save_checkpoint(path: str | Path, checkpoint: Checkpoint) -> None:
+    """Replace a checkpoint file in one step so it is never half written."""
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with tmp_path.open("w") as checkpoint_file:
+        json.dump(
+            {"version": _CHECKPOINT_VERSION, **checkpoint._asdict()}, checkpoint_file
+        )
+        checkpoint_file.flush()
+        fsync(checkpoint_file.fileno())
+    tmp_path.replace(path)
+
+
+class Checkpointer:
+    """Save how far a run got each time its output is synced to disk."""
+
+    # A checkpoint is only saved after the records it counts are flushed and
+    #     fsynced, so the output always holds at least those records.
+    #     Resuming truncates anything written after the checkpoint and skips
+    #     the input the checkpoint counts, so no record is lost or repeated.
+    #     The checkpoint is removed when the run finishes.
+
+    def restore(self, output: TextIO) -> Checkpoint:
+        """Truncate output back to the checkpoint and return it."""
+        output.flush()
+        if fstat(output.fileno()).st_size < self._checkpoint.output_size:
+            reason = f"Output is shorter than {self._path} says."
+            raise ValueError(reason)
+        ftruncate(output.fileno(), self._checkpoint.output_size)
+        output.seek(0, 2)
+        return self._checkpoint
+
+    def check_last_path(self, path: str | None) -> None:
+        """Refuse to resume if the input's last counted path has changed."""
+        if path != self._checkpoint.last_path:
+            reason = f"Input has changed since {self._path} was saved."
+            raise ValueError(reason)
+
+    def skip(self, items: Iterable[tuple[int | None, str]]) -> Iterator:
+        """Skip the offset & path pairs the checkpoint counts."""
+        iterator = iter(items)
+        if records := self._checkpoint.records:
+            done = tuple(islice(iterator, records))
+            self.check_last_path(done[-1][1] if len(done) == records else None)
+        return iterator
+
+    def update(
+        self, output: TextIO, chunk: tuple[tuple[int | None, str, str], ...]
+    ) -> None:
+        """Count a written chunk, saving a checkpoint every so many records."""
+        offset, path, _ = chunk[-1]
+        self._checkpoint: Checkpoint = self._checkpoint._replace(
+            records=self._checkpoint.records + len(chunk),
+            last_path=path,
+            last_offset=offset,
+        )
+        self._unsaved += len(chunk)
+        if self._every and self._unsaved >= self._every:
+            self._save(output)
+
+    def _save(self, output: TextIO) -> None:
+        """Sync the output to disk, then save a checkpoint of it."""
+        output.flush()
+        fsync(output.fileno())
+        self._checkpoint = self._checkpoint._replace(
+            output_size=fstat(output.fileno()).st_size
+        )
+        save_checkpoint(self._path, self._checkpoint)
+        self._unsaved: int = 0
+
+    def finish(self) -> None:
+        """Remove the checkpoint of a finished run."""
+        self._path.unlink(missing_ok=True)
+
+    def __init__(
+        self,
+        path: str | Path,
+        every: int = DEFAULT_CHECKPOINT_EVERY,
+        *,
+        resume: bool = False,
+    ):
+        """Initialize, loading the checkpoint to resume from."""
+        self._path: Path = Path(path)
+        self._every: int = every
+        if not resume:
+            # A fresh run starts over, so an old checkpoint no longer applies.
+            self._path.unlink(missing_ok=True)
+        self._checkpoint = (resume and load_checkpoint(self._path)) or Checkpoint()
+        self._unsaved = 0
@@ -1,18 +1,65 @@
 #!/usr/bin/env python3
 """Simple cli for comicfn2dict."""
 
-from argparse import ArgumentParser
+from __future__ import annotations
+
+import json
+import sys
+from argparse import ArgumentParser, ArgumentTypeError, Namespace
+from contextlib import contextmanager, nullcontext
 from pathlib import Path
 from pprint import pprint
+from typing import TYPE_CHECKING, TextIO
 
+from comicfn2dict.adaptive import AdaptiveProfile
+from comicfn2dict.batch import (
+    batch,
+    batch_listing,
+    dump_record,
+    iter_lines,
+    iter_parsed,
+    iter_records,
+)
+from comicfn2dict.checkpoint import (
+    DEFAULT_CHECKPOINT_EVERY,
+    Checkpointer,
+    checkpoint_path,
+)
+from comicfn2dict.comicinfo import iter_enriched
+from comicfn2dict.dupes import DuplicateIndex
+from comicfn2dict.engine import ComicFilenameEngine
+from comicfn2dict.listing import iter_listing, listing_ranges
 from comicfn2dict.parse import ComicFilenameParser
+from comicfn2dict.rules import load_rules
+from comicfn2dict.scan import scan
+from comicfn2dict.shard import iter_shard, merge_shards
+from comicfn2dict.store import write_store
+from comicfn2dict.validate import validate_round_trip
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
-def main() -> None:
-    """Test parser."""
-    description = "Comic book filename metadata parser."
-    parser = ArgumentParser(description=description)
-    parser.add_argument("path", help="Path of comic filename to parse", type=Path)
+    from comicfn2dict.validate import RoundTripFailure
+
+_DESCRIPTION = "Comic book filename metadata parser."
+
+
+def _open_output(path: str, *, append: bool = False) -> TextIO:
+    """Open a text output file or stdout."""
+    if path == "-":
+        return nullcontext(sys.stdout)  # type: ignore[reportReturnType]
+    mode = "a" if append else "w"
+    return Path(path).open(mode, encoding="utf-8", errors="surrogateescape")
+
+
+def _open_input(path: str) -> TextIO:
+    """Open a text input file or stdin."""
+    if path == "-":
+        return nullcontext(sys.stdin)  # type: ignore[reportReturnType]
+    return Path(path).open(encoding="utf-8", errors="surrogateescape")
+
+
+def _add_verbose(parser: ArgumentParser) -> None:
     parser.add_argument(
         "-v",
         "--verbose",
@@ -20,7 +67,10 @@ def main() -> None:
         action="count",
         help="Display intermediate parsing steps. Good for debugging.",
     )
-    args = parser.parse_args()
+
+
+def _parse_one(args: Namespace) -> None:
+    """Parse one filename."""
     name = args.path.name
     cfnparser = ComicFilenameParser(name, verbose=args.verbose)
     metadata = cfnparser.parse()
@@ -29,5 +79,483 @@ def main() -> None:
     pprint(metadata)  # noqa:T203
 
 
+def _serve(args: Namespace) -> None:
+    """Run the parse server."""
+    # Unix sockets aren't available everywhere.
+    from comicfn2dict.server import serve  # noqa: PLC0415
+
+    if args.socket is None and args.port is None:
+        args.parser.error("serve needs --socket, --port or both.")
+    try:
+        serve(
+            socket_path=args.socket,
+            http_port=args.port,
+            workers=args.workers,
+            verbose=args.verbose,
+        )
+    except ValueError as exc:
+        # Socket paths taken by other files.
+        args.parser.error(str(exc))
+
+
+def _part(value: str) -> tuple[int, int]:
+    """Parse an i/N part spec."""
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError as exc:
+        reason = f"expected i/N, not {value!r}"
+        raise ArgumentTypeError(reason) from exc
+    if not 0 <= index < count:
+        reason = f"i must be between 0 and N-1 in {value!r}"
+        raise ArgumentTypeError(reason)
+    return index, count
+
+
+@contextmanager
+def _engine(args: Namespace) -> Iterator[ComicFilenameEngine]:
+    """Engine for a run, loading and then saving any adaptive profile."""
+    profile = AdaptiveProfile.load(args.profile) if args.profile else None
+    try:
+        engine = ComicFilenameEngine(
+            profile=profile,
+            canonical=args.canonical,
+            sort_keys=args.sort_keys,
+            casefold=args.casefold,
+            rules=[rule for path in args.rules for rule in load_rules(path)],
+        )
+    except ValueError as exc:
+        args.parser.error(str(exc))
+    else:
+        yield engine
+        if profile is not None:
+            profile.save(args.profile)
+        if counts := engine.canonical_counts:
+            print(  # noqa: T201
+                f"canonical fast path: {counts.hits}/{counts.tries} names"
+                f" ({counts.rate:.1%})",
+                file=sys.stderr,
+            )
+
+
+def _checkpointer(args: Namespace) -> Checkpointer | None:
+    """Checkpoint runs that write to a file so they may resume."""
+    if args.output == "-":
+        if args.resume:
+            args.parser.error("--resume needs an --output file, not stdout.")
+        return None
+    if not args.checkpoint_every:
+        if args.resume:
+            # Without a checkpoint nothing is skipped, so every record repeats.
+            args.parser.error("--resume needs a --checkpoint-every above 0.")
+        return None
+    try:
+        return Checkpointer(
+            checkpoint_path(args.output), args.checkpoint_every, resume=args.resume
+        )
+    except ValueError as exc:
+        args.parser.error(str(exc))
+
+
+def _batch(args: Namespace) -> None:
+    """Parse a listing of paths into JSON lines."""
+    checkpointer = _checkpointer(args)
+    try:
+        with (
+            _open_output(args.output, append=args.resume) as output_file,
+            _engine(args) as engine,
+        ):
+            if args.input == "-":
+                if args.part:
+                    args.parser.error("--part needs a listing file, not stdin.")
+                batch(
+                    iter_lines(sys.stdin),
+                    output_file,
+                    chunk_size=args.chunk_size,
+                    shard=args.shard,
+                    engine=engine,
+                    checkpointer=checkpointer,
+                )
+                return
+            start, end = 0, None
+            if args.part:
+                index, count = args.part
+                start, end = listing_ranges(args.input, count)[index]
+            batch_listing(
+                args.input,
+                output_file,
+                chunk_size=args.chunk_size,
+                start=start,
+                end=end,
+                shard=args.shard,
+                engine=engine,
+                checkpointer=checkpointer,
+            )
+    except ValueError as exc:
+        # Checkpoints that don't fit the output or input.
+        args.parser.error(str(exc))
+
+
+def _scan(args: Namespace) -> None:
+    """Parse the comics in a library directory into JSON lines."""
+    checkpointer = _checkpointer(args)
+    try:
+        with (
+            _open_output(args.output, append=args.resume) as output_file,
+            _engine(args) as engine,
+        ):
+            scan(
+                args.root,
+                output_file,
+                chunk_size=args.chunk_size,
+                shard=args.shard,
+                engine=engine,
+                workers=args.workers,
+                max_pending=args.max_pending,
+                checkpointer=checkpointer,
+            )
+    except ValueError as exc:
+        # Checkpoints that don't fit the output or input.
+        args.parser.error(str(exc))
+
+
+def _comicinfo(args: Namespace) -> None:
+    """Parse paths and merge in the ComicInfo of their archives."""
+    with (
+        _open_input(args.input) as input_file,
+        _open_output(args.output) as output_file,
+        _engine(args) as engine,
+    ):
+        output_file.writelines(
+            dump_record(path, metadata)
+            for path, metadata in iter_enriched(
+                iter_shard(iter_lines(input_file), args.shard),
+                chunk_size=args.chunk_size,
+                engine=engine,
+                workers=args.workers,
+                prefer_filename=args.prefer_filename,
+            )
+        )
+
+
+def _merge(args: Namespace) -> None:
+    """Merge shard outputs into one ordered JSON lines output."""
+    with _open_output(args.output) as output_file:
+        try:
+            merge_shards(args.inputs, output_file)
+        except ValueError as exc:
+            args.parser.error(str(exc))
+
+
+def _dupes(args: Namespace) -> None:
+    """Report groups of paths that parsed to the same issue."""
+    index = DuplicateIndex()
+    with _open_input(args.input) as input_file:
+        records = (
+            iter_parsed(iter_lines(input_file), chunk_size=args.chunk_size)
+            if args.names
+            else iter_records(input_file)
+        )
+        index.add_many(records)
+    with _open_output(args.output) as output_file:
+        output_file.writelines(
+            json.dumps(
+                {
+                    "fingerprint": group.fingerprint,
+                    **group.key._asdict(),
+                    "paths": group.paths,
+                },
+                ensure_ascii=False,
+            )
+            + "\n"
+            for group in index.iter_groups()
+        )
+
+
+def _store(args: Namespace) -> None:
+    """Write parse results to a memory mapped lookup store."""
+    with _open_input(args.input) as input_file:
+        try:
+            write_store(iter_records(input_file), args.output)
+        except ValueError as exc:
+            args.parser.error(str(exc))
+
+
+def _iter_input_names(args: Namespace) -> Iterator[str]:
+    """Names from a listing file or stdin."""
+    if args.input == "-":
+        yield from iter_lines(sys.stdin)
+    else:
+        for *_, name in iter_listing(args.input):
+            yield name
+
+
+def _validate(args: Namespace) -> None:
+    """Check that names are stable when normalized twice."""
+    with _open_output(args.output) as output_file:
+
+        def _write_failure(failure: RoundTripFailure) -> None:
+            output_file.write(json.dumps(failure._asdict(), ensure_ascii=False) + "\n")
+
+        report = validate_round_trip(
+            _iter_input_names(args),
+            workers=args.workers,
+            max_examples=args.examples,
+            on_failure=_write_failure if args.output != "-" else None,
+        )
+    print(report.format())  # noqa: T201
+    if report.failures:
+        sys.exit(1)
+
+
+def _add_batch_options(parser: ArgumentParser) -> None:
+    parser.add_argument(
+        "-o", "--output", default="-", help="JSON lines file or - for stdout"
+    )
+    parser.add_argument(
+        "-c",
+        "--chunk-size",
+        type=int,
+        default=1024,
+        help="Names to run through each parse stage at once",
+    )
+    parser.add_argument(
+        "-S",
+        "--shard",
+        type=_part,
+        help="Only parse paths in shard i of N by path hash, counting from 0",
+    )
+    parser.add_argument(
+        "-p",
+        "--profile",
+        type=Path,
+        help="Learn & reuse fallback pattern hit rates in this JSON file",
+    )
+    parser.add_argument(
+        "-C",
+        "--canonical",
+        action="store_true",
+        help="Read names already in the normalized layout without the full parser",
+    )
+    parser.add_argument(
+        "-k",
+        "--sort-keys",
+        action="store_true",
+        help="Add natural issue sort keys to parse results",
+    )
+    parser.add_argument(
+        "-F",
+        "--casefold",
+        action="store_true",
+        help="Lowercase names once and match them with case sensitive patterns",
+    )
+    parser.add_argument(
+        "-r",
+        "--rules",
+        type=Path,
+        action="append",
+        default=[],
+        help="Read site specific fields with a JSON rule pack. May be repeated.",
+    )
+
+
+def _add_resume_options(parser: ArgumentParser) -> None:
+    parser.add_argument(
+        "-R",
+        "--resume",
+        action="store_true",
+        help="Continue a run that stopped from its output file's last checkpoint",
+    )
+    parser.add_argument(
+        "-e",
+        "--checkpoint-every",
+        type=int,
+        default=DEFAULT_CHECKPOINT_EVERY,
+        help="Sync the output file & save a checkpoint after this many records."
+        " 0 turns checkpoints off.",
+    )
+
+
+def _get_command_parser() -> ArgumentParser:
+    """Parser for the subcommands."""
+    parser = ArgumentParser(description=_DESCRIPTION)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = subparsers.add_parser(
+        "serve", help="Answer JSON parse requests over a unix socket or http."
+    )
+    serve_parser.add_argument("-s", "--socket", type=Path, help="Unix socket path")
+    serve_parser.add_argument(
+        "-p", "--port", type=int, help="Also serve http on this localhost port"
+    )
+    serve_parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=0,
+        help="Parse large requests on a pool of this many processes",
+    )
+    _add_verbose(serve_parser)
+    serve_parser.set_defaults(func=_serve, parser=serve_parser)
+
+    batch_parser = subparsers.add_parser(
+        "batch", help="Parse a listing of paths, one per line, into JSON lines."
+    )
+    batch_parser.add_argument(
+        "input", nargs="?", default="-", help="Listing file or - for stdin"
+    )
+    _add_batch_options(batch_parser)
+    _add_resume_options(batch_parser)
+    batch_parser.add_argument(
+        "-P",
+        "--part",
+        type=_part,
+        help="Only parse byte range part i of N of the listing file, counting from 0",
+    )
+    batch_parser.set_defaults(func=_batch, parser=batch_parser)
+
+    scan_parser = subparsers.add_parser(
+        "scan", help="Parse the comics in a library directory into JSON lines."
+    )
+    scan_parser.add_argument("root", type=Path, help="Library directory")
+    _add_batch_options(scan_parser)
+    _add_resume_options(scan_parser)
+    scan_parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="List directories ahead on this many threads, for network mounts",
+    )
+    scan_parser.add_argument(
+        "-m",
+        "--max-pending",
+        type=int,
+        default=64,
+        help="Most directory listings to hold ahead of the parser",
+    )
+    scan_parser.set_defaults(func=_scan, parser=scan_parser)
+
+    comicinfo_parser = subparsers.add_parser(
+        "comicinfo",
+        help="Parse archive paths and merge in their ComicInfo.xml as JSON lines.",
+    )
+    comicinfo_parser.add_argument(
+        "input", nargs="?", default="-", help="Listing file or - for stdin"
+    )
+    _add_batch_options(comicinfo_parser)
+    comicinfo_parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        help="Read archives on this many threads. Default is cpu count.",
+    )
+    comicinfo_parser.add_argument(
+        "-f",
+        "--prefer-filename",
+        action="store_true",
+        help="Keep filename values over ComicInfo values",
+    )
+    comicinfo_parser.set_defaults(func=_comicinfo, parser=comicinfo_parser)
+
+    merge_parser = subparsers.add_parser(
+        "merge", help="Merge batch or scan shard outputs into one ordered output."
+    )
+    merge_parser.add_argument("inputs", nargs="+", help="Shard JSON lines files")
+    merge_parser.add_argument(
+        "-o", "--output", default="-", help="JSON lines file or - for stdout"
+    )
+    merge_parser.set_defaults(func=_merge, parser=merge_parser)
+
+    dupes_parser = subparsers.add_parser(
+        "dupes",
+        help="Report paths that parsed to the same series, volume, issue & year.",
+    )
+    dupes_parser.add_argument(
+        "input",
+        nargs="?",
+        default="-",
+        help="Batch or scan JSON lines file, or - for stdin",
+    )
+    dupes_parser.add_argument(
+        "-o", "--output", default="-", help="JSON lines file or - for stdout"
+    )
+    dupes_parser.add_argument(
+        "-n",
+        "--names",
+        action="store_true",
+        help="Input is a listing of paths to parse instead of JSON lines",
+    )
+    dupes_parser.add_argument(
+        "-c",
+        "--chunk-size",
+        type=int,
+        default=1024,
+        help="Names to run through each parse stage at once",
+    )
+    dupes_parser.set_defaults(func=_dupes, parser=dupes_parser)
+
+    store_parser = subparsers.add_parser(
+        "store",
+        help="Write batch or scan results to a store for fast lookups by path.",
+    )
+    store_parser.add_argument(
+        "input",
+        nargs="?",
+        default="-",
+        help="Batch or scan JSON lines file, or - for stdin",
+    )
+    store_parser.add_argument(
+        "-o", "--output", type=Path, required=True, help="Store file"
+    )
+    store_parser.set_defaults(func=_store, parser=store_parser)
+
+    validate_parser = subparsers.add_parser(
+        "validate",
+        help="Report names that change when normalized twice. Exits 1 if any do.",
+    )
+    validate_parser.add_argument(
+        "input", nargs="?", default="-", help="Listing file or - for stdin"
+    )
+    validate_parser.add_argument(
+        "-o", "--output", default="-", help="Write every failure to a JSON lines file"
+    )
+    validate_parser.add_argument(
+        "-w", "--workers", type=int, help="Worker processes. Default is cpu count."
+    )
+    validate_parser.add_argument(
+        "-e",
+        "--examples",
+        type=int,
+        default=5,
+        help="Example names to show for each drifted field",
+    )
+    validate_parser.set_defaults(func=_validate, parser=validate_parser)
+
+    return parser
+
+
+_COMMANDS = frozenset(
+    {"batch", "comicinfo", "dupes", "merge", "scan", "serve", "store", "validate"}
+)
+
+
+def main() -> None:
+    """Test parser."""
+    argv = sys.argv[1:]
+    if argv and argv[0] in _COMMANDS:
+        args = _get_command_parser().parse_args(argv)
+        args.func(args)
+        return
+
+    parser = ArgumentParser(
+        description=_DESCRIPTION,
+        epilog="Commands: " + ", ".join(sorted(_COMMANDS)),
+    )
+    parser.add_argument("path", help="Path of comic filename to parse", type=Path)
+    _add_verbose(parser)
+    args = parser.parse_args(argv)
+    _parse_one(args)
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,125 @@
+"""Client for the comicfn2dict parse server."""
+
+from __future__ import annotations
+
+import json
+import socket
+from contextlib import suppress
+from threading import Thread
+from typing import TYPE_CHECKING
+
+from comicfn2dict.util import JSON_SEPARATORS
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+    from pathlib import Path
+    from types import TracebackType
+
+_END_OF_PIPELINE = -1
+
+
+def _tuplify(metadata: dict) -> dict[str, str | tuple[str, ...]]:
+    """Restore tuples that JSON turned into lists."""
+    for key, value in metadata.items():
+        if isinstance(value, list):
+            metadata[key] = tuple(value)
+    return metadata
+
+
+class ComicFilenameClient:
+    """Send parse requests to a comicfn2dict server over a unix socket."""
+
+    def _send(self, request_id: int, names: Sequence[str]) -> None:
+        """Write one request line."""
+        request = {"id": request_id, "names": list(names)}
+        line = json.dumps(request, separators=JSON_SEPARATORS).encode() + b"\n"
+        self._socket.sendall(line)
+
+    def _receive(self) -> tuple[int, list[dict[str, str | tuple[str, ...]]]]:
+        """Read one response line."""
+        line = self._file.readline()
+        if not line:
+            reason = "Server closed the connection."
+            raise ConnectionError(reason)
+        response = json.loads(line)
+        if error := response.get("error"):
+            raise ValueError(error)
+        results = [_tuplify(metadata) for metadata in response["results"]]
+        return response["id"], results
+
+    def parse_many(
+        self, names: Sequence[str]
+    ) -> list[dict[str, str | tuple[str, ...]]]:
+        """Parse a batch of names in one round trip."""
+        self._send(0, names)
+        return self._receive()[1]
+
+    def parse(self, name: str) -> dict[str, str | tuple[str, ...]]:
+        """Parse one name."""
+        return self.parse_many((name,))[0]
+
+    def pipeline(
+        self, batches: Iterable[Sequence[str]]
+    ) -> Iterator[list[dict[str, str | tuple[str, ...]]]]:
+        """Send batches without waiting for replies and yield results in order."""
+        # The writer always ends the pipeline, even when batches or a send
+        #     raise, so the reader never waits on replies that won't come.
+        #     Its error is raised here once the replies it did send are read.
+        errors: list[BaseException] = []
+
+        def _send_all() -> None:
+            try:
+                for request_id, names in enumerate(batches):
+                    self._send(request_id, names)
+            except BaseException as exc:
+                errors.append(exc)
+            try:
+                # An empty request marks the end of the pipeline.
+                self._send(_END_OF_PIPELINE, ())
+            except OSError:
+                # Closing the write side ends it instead.
+                with suppress(OSError):
+                    self._socket.shutdown(socket.SHUT_WR)
+
+        def _raise_writer_error() -> None:
+            writer.join()
+            if errors:
+                raise errors[0]
+
+        writer = Thread(target=_send_all, daemon=True)
+        writer.start()
+        while True:
+            try:
+                request_id, results = self._receive()
+            except ConnectionError:
+                _raise_writer_error()
+                raise
+            if request_id == _END_OF_PIPELINE:
+                break
+            yield results
+        _raise_writer_error()
+
+    def close(self) -> None:
+        """Close the connection."""
+        self._file.close()
+        self._socket.close()
+
+    def __enter__(self) -> ComicFilenameClient:  # noqa: PYI034
+        """Enter context."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Exit context."""
+        self.close()
+
+    def __init__(self, socket_path: str | Path, timeout: float | None = None):
+        """Connect to the server."""
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.settimeout(timeout)
+        self._socket.connect(str(socket_path))
+        self._file = self._socket.makefile("rb")
@@ -0,0 +1,148 @@
+"""Generate one specialized parse function from the parser's stages."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+from comicfn2dict.locales import compile_locales
+from comicfn2dict.parse import _STAGES, ComicFilenameParser
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from pathlib import Path
+
+    from comicfn2dict.canonical import CanonicalCounts
+    from comicfn2dict.locales import LocalePatterns
+
+_FILENAME = "<comicfn2dict generated parse>"
+_INDENT = "    "
+
+
+class _Source:
+    """Build the source of one function and the constants it reads."""
+
+    def line(self, text: str = "") -> None:
+        """Add a line at the current indent."""
+        self._lines.append(_INDENT * self._depth + text if text else "")
+
+    @contextmanager
+    def block(self, header: str) -> Iterator[None]:
+        """Add an indented block under a header line."""
+        self.line(header)
+        self._depth += 1
+        yield
+        self._depth -= 1
+
+    def const(self, value: object, hint: str) -> str:
+        """Name a constant in the function's globals."""
+        for name, existing in self.namespace.items():
+            if existing is value:
+                return name
+        name = f"{hint}_{len(self.namespace)}"
+        self.namespace[name] = value
+        return name
+
+    def call(self, method: Callable, hint: str) -> None:
+        """Call a parser method through a global, skipping attribute lookups."""
+        self.line(f"{self.const(method, hint)}(parser)")
+
+    def __str__(self) -> str:
+        """Join the lines."""
+        return "\n".join(self._lines) + "\n"
+
+    def __init__(self):
+        """Initialize empty."""
+        self._lines: list[str] = []
+        self._depth = 0
+        self.namespace: dict[str, object] = {}
+
+
+def _stage_condition(
+    src: _Source,
+    candidates: frozenset[str] | None,
+    gate: Callable[[ComicFilenameParser], bool] | None,
+    *,
+    prescan: bool,
+) -> str | None:
+    """Make the condition a stage runs under, or None if it always runs."""
+    conditions = []
+    if prescan and candidates is not None:
+        conditions.append(
+            f"not candidates.isdisjoint({src.const(candidates, 'CANDIDATES')})"
+        )
+    if gate is not None:
+        conditions.append(f"{src.const(gate, 'GATE')}(parser)")
+    return " and ".join(conditions) or None
+
+
+def generate_parse_source(
+    locale: LocalePatterns | None = None,
+    *,
+    prescan: bool = False,
+    canonical: bool = False,
+) -> tuple[str, dict[str, object]]:
+    """Write the source of a parse function and the globals it needs."""
+    # The stages come from parse._STAGES and run as the parser's own methods,
+    #     so the function can't drift from ComicFilenameParser.parse(). What
+    #     is specialized is the pipeline around them: the stage loop is
+    #     unrolled, the flags that are off leave no checks, prescan candidate
+    #     tests are inlined and rule hooks are left out.
+    src = _Source()
+    src.namespace.update(
+        {
+            "Parser": ComicFilenameParser,
+            "LOCALE": locale or compile_locales(),
+            "PRESCAN": prescan,
+        }
+    )
+    parser = ComicFilenameParser
+    with src.block("def parse(path):"):
+        src.line('"""Parse one filename with the configured stages unrolled."""')
+        src.line(
+            "parser = Parser(path, locale=LOCALE, prescan=PRESCAN, canonical=COUNTS)"
+        )
+        if canonical:
+            with src.block(
+                f"if {src.const(parser._parse_canonical, 'CANONICAL')}(parser):"  # noqa: SLF001
+            ):
+                src.line("return parser.metadata")
+        src.call(parser._parse_ext, "EXT")  # noqa: SLF001
+        src.call(parser._clean_dividers, "CLEAN")  # noqa: SLF001
+        if prescan:
+            src.call(parser._scan_candidates, "SCAN")  # noqa: SLF001
+            src.line("candidates = parser._candidates")
+        # Names leave the stages once nothing is left unparsed.
+        with src.block("while parser._unparsed_path:"):
+            for index, (name, stage, candidates, gate) in enumerate(_STAGES):
+                if index:
+                    with src.block("if not parser._unparsed_path:"):
+                        src.line("break")
+                condition = _stage_condition(src, candidates, gate, prescan=prescan)
+                if condition is None:
+                    src.call(stage, name.upper())
+                else:
+                    with src.block(f"if {condition}:"):
+                        src.call(stage, name.upper())
+            src.line("break")
+        src.call(parser._copy_volume_to_issue, "COPY_VOLUME")  # noqa: SLF001
+        src.call(parser._add_remainders, "ADD_REMAINDERS")  # noqa: SLF001
+        src.line("return parser.metadata")
+    return str(src), src.namespace
+
+
+def compile_parse(
+    locale: LocalePatterns | None = None,
+    *,
+    prescan: bool = False,
+    canonical: CanonicalCounts | None = None,
+) -> Callable[[str | Path], dict[str, str | tuple[str, ...]]]:
+    """Compile a parse function with the stages & flags of one configuration."""
+    source, namespace = generate_parse_source(
+        locale, prescan=prescan, canonical=canonical is not None
+    )
+    namespace["COUNTS"] = canonical
+    exec(compile(source, _FILENAME, "exec"), namespace)  # noqa: S102
+    parse = namespace["parse"]
+    parse.source = source  # type: ignore[attr-defined]
+    return parse  # type: ignore[return-value]
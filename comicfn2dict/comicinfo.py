@@ -0,0 +1,209 @@
+"""Read ComicInfo.xml and page counts from CBZ archives without extracting."""
+
+from __future__ import annotations
+
+import mmap
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from os import cpu_count, fstat
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+from xml.etree.ElementTree import ParseError, fromstring
+from zipfile import BadZipFile, ZipFile
+
+from comicfn2dict.engine import ComicFilenameEngine
+from comicfn2dict.util import iter_chunks
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping, Sequence
+    from zipfile import ZipInfo
+
+COMICINFO_NAME = "comicinfo.xml"
+PAGE_COUNT_KEY = "page_count"
+PAGE_SUFFIXES = frozenset(
+    {".avif", ".bmp", ".gif", ".jpeg", ".jpg", ".jxl", ".png", ".webp"}
+)
+ZIP_SUFFIXES = frozenset({".cbz", ".zip"})
+# ComicInfo elements and the parse keys they fill.
+COMICINFO_KEYS = MappingProxyType(
+    {
+        "Series": "series",
+        "Volume": "volume",
+        "Number": "issue",
+        "Count": "issue_count",
+        "Title": "title",
+        "Year": "year",
+        "Month": "month",
+        "Day": "day",
+        "Publisher": "publisher",
+        "Format": "original_format",
+        "ScanInformation": "scan_info",
+    }
+)
+# Only the filename knows these.
+_FILENAME_KEYS = frozenset({"ext", "remainders"})
+_PADDED_KEYS = frozenset({"month", "day"})
+# The ComicInfo schema uses -1 for unset numbers.
+_UNSET = "-1"
+_JUNK_PREFIX = "__macosx/"
+# Larger members aren't read, so a hostile archive can't inflate into memory.
+_MAX_COMICINFO_SIZE = 1 << 20
+# Broken archives raise these. zipfile raises RuntimeError for encrypted
+#     members and NotImplementedError for unsupported compression.
+_READ_ERRORS = (
+    OSError,
+    BadZipFile,
+    ParseError,
+    ValueError,
+    zlib.error,
+    RuntimeError,
+    NotImplementedError,
+    EOFError,
+)
+
+
+class _MappedArchive(mmap.mmap):
+    """A read only map zipfile can open members from."""
+
+    # zipfile asks for seekable(), which mmap only has from Python 3.13.
+
+    def seekable(self) -> bool:
+        """Report that maps can seek."""
+        return True
+
+
+def _find_comicinfo(infos: Iterable[ZipInfo]) -> ZipInfo | None:
+    """Find the shallowest ComicInfo.xml member."""
+    found = None
+    for info in infos:
+        name = info.filename.lower()
+        if (name == COMICINFO_NAME or name.endswith("/" + COMICINFO_NAME)) and (
+            found is None or name.count("/") < found.filename.count("/")
+        ):
+            found = info
+    return found
+
+
+def _count_pages(infos: Iterable[ZipInfo]) -> int:
+    """Count the image members."""
+    return sum(
+        1
+        for info in infos
+        if not info.is_dir()
+        and not info.filename.lower().startswith(_JUNK_PREFIX)
+        and Path(info.filename).suffix.lower() in PAGE_SUFFIXES
+    )
+
+
+def parse_comicinfo(xml: bytes | str) -> dict[str, str]:
+    """Read the ComicInfo fields comicfn2dict() also parses from filenames."""
+    metadata = {}
+    for element in fromstring(xml):  # noqa: S314
+        key = COMICINFO_KEYS.get(element.tag)
+        if not key or not element.text:
+            continue
+        value = element.text.strip()
+        if not value or value == _UNSET:
+            continue
+        if key in _PADDED_KEYS and value.isdigit():
+            value = value.zfill(2)
+        metadata[key] = value
+    return metadata
+
+
+def read_comicinfo(path: str | Path) -> dict[str, str]:
+    """Read ComicInfo.xml and the page count from the zip central directory."""
+    # Mapping the archive means only the pages holding the central directory
+    #     and ComicInfo.xml are read from disk, however large the archive.
+    with Path(path).open("rb") as archive_file:
+        if not fstat(archive_file.fileno()).st_size:
+            reason = f"{path} is empty"
+            raise BadZipFile(reason)
+        with _MappedArchive(
+            archive_file.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped:
+            with ZipFile(mapped) as archive:  # type: ignore[call-overload]
+                infos = archive.infolist()
+                metadata = {}
+                info = _find_comicinfo(infos)
+                if info is not None and info.file_size <= _MAX_COMICINFO_SIZE:
+                    metadata = parse_comicinfo(archive.read(info))
+            metadata[PAGE_COUNT_KEY] = str(_count_pages(infos))
+    return metadata
+
+
+def _read_or_skip(path: str | Path) -> dict[str, str]:
+    """Read zip archives, returning nothing for other or broken files."""
+    if Path(path).suffix.lower() not in ZIP_SUFFIXES:
+        return {}
+    try:
+        return read_comicinfo(path)
+    except _READ_ERRORS:
+        return {}
+
+
+def merge_comicinfo(
+    filename_metadata: Mapping,
+    comicinfo: Mapping,
+    *,
+    prefer_filename: bool = False,
+) -> dict:
+    """Merge ComicInfo fields into filename metadata."""
+    # By default ComicInfo values win, as they are usually curated, and
+    #     filename values fill the gaps. ext and remainders always come from
+    #     the filename.
+    if prefer_filename:
+        merged = {**comicinfo, **filename_metadata}
+    else:
+        merged = {**filename_metadata, **comicinfo}
+    for key in _FILENAME_KEYS:
+        if key in filename_metadata:
+            merged[key] = filename_metadata[key]
+    return merged
+
+
+def _enrich(
+    paths: Sequence[str | Path],
+    engine: ComicFilenameEngine,
+    executor: ThreadPoolExecutor,
+    prefer_filename: bool,
+) -> list[dict]:
+    """Parse filenames while the pool reads their archives, then merge."""
+    # Archive reads wait on disk, which releases the GIL, while this thread
+    #     parses the filenames.
+    comicinfos = executor.map(_read_or_skip, paths)
+    results = engine.parse_batch(paths)
+    return [
+        merge_comicinfo(metadata, comicinfo, prefer_filename=prefer_filename)
+        for metadata, comicinfo in zip(results, comicinfos)  # noqa: B905
+    ]
+
+
+def enrich_batch(
+    paths: Sequence[str | Path],
+    engine: ComicFilenameEngine | None = None,
+    workers: int | None = None,
+    *,
+    prefer_filename: bool = False,
+) -> list[dict]:
+    """Parse filenames and merge in ComicInfo read on a pool of threads."""
+    engine = engine or ComicFilenameEngine()
+    with ThreadPoolExecutor(max_workers=workers or cpu_count() or 1) as executor:
+        return _enrich(paths, engine, executor, prefer_filename)
+
+
+def iter_enriched(
+    paths: Iterable[str],
+    chunk_size: int = 1024,
+    engine: ComicFilenameEngine | None = None,
+    workers: int | None = None,
+    *,
+    prefer_filename: bool = False,
+) -> Iterator[tuple[str, dict]]:
+    """Enrich paths a chunk at a time, yielding each path with its metadata."""
+    engine = engine or ComicFilenameEngine()
+    with ThreadPoolExecutor(max_workers=workers or cpu_count() or 1) as executor:
+        for chunk in iter_chunks(paths, chunk_size):
+            results = _enrich(chunk, engine, executor, prefer_filename)
+            yield from zip(chunk, results)  # noqa: B905
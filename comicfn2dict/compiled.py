@@ -0,0 +1,17 @@
+"""Report which parser core modules are compiled."""
+
+from importlib.machinery import EXTENSION_SUFFIXES
+
+from comicfn2dict import parse, unparse
+
+_CORE_MODULES = (parse, unparse)
+
+
+def compiled_modules() -> tuple[str, ...]:
+    """Names of the core modules loaded from compiled extensions."""
+    suffixes = tuple(EXTENSION_SUFFIXES)
+    return tuple(
+        module.__name__
+        for module in _CORE_MODULES
+        if (module.__file__ or "").endswith(suffixes)
+    )
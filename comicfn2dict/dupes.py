@@ -0,0 +1,116 @@
+"""Find the same issue stored under different names."""
+
+from __future__ import annotations
+
+import re
+from hashlib import blake2b
+from typing import TYPE_CHECKING, NamedTuple
+
+from comicfn2dict.matcher import normalize_series
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+
+_FINGERPRINT_SIZE = 8
+_KEY_SEPARATOR = "\x1f"
+_LEADING_ZEROS_RE = re.compile(r"^0+(?=\d)")
+
+
+class IdentityKey(NamedTuple):
+    """The normalized fields that identify one issue."""
+
+    series: str
+    volume: str
+    issue: str
+    year: str
+
+
+class DuplicateGroup(NamedTuple):
+    """Paths that parsed to the same issue."""
+
+    fingerprint: str
+    key: IdentityKey
+    paths: tuple[str, ...]
+
+
+def normalize_number(value: object) -> str:
+    """Fold case and leading zeros of issue & volume numbers."""
+    if not isinstance(value, str):
+        return ""
+    return _LEADING_ZEROS_RE.sub("", value.strip().lstrip("#").casefold())
+
+
+def identity_key(metadata: Mapping) -> IdentityKey | None:
+    """Normalize the fields that identify an issue, or None without them."""
+    series = metadata.get("series")
+    issue = normalize_number(metadata.get("issue"))
+    if not isinstance(series, str) or not issue:
+        return None
+    if not (series_key := normalize_series(series)):
+        return None
+    year = metadata.get("year")
+    return IdentityKey(
+        series_key,
+        normalize_number(metadata.get("volume")),
+        issue,
+        year.strip() if isinstance(year, str) else "",
+    )
+
+
+def fingerprint(key: IdentityKey) -> int:
+    """Hash an identity key the same way on every machine and run."""
+    data = _KEY_SEPARATOR.join(key).encode("utf-8", "surrogateescape")
+    return int.from_bytes(blake2b(data, digest_size=_FINGERPRINT_SIZE).digest(), "big")
+
+
+def format_fingerprint(value: int) -> str:
+    """Format a fingerprint as fixed width hex."""
+    return f"{value:0{_FINGERPRINT_SIZE * 2}x}"
+
+
+class DuplicateIndex:
+    """A hash index of identity fingerprints built in one pass."""
+
+    # Each distinct issue costs one fingerprint and its first path. Keys and
+    #     path lists are only kept for issues seen more than once.
+
+    def add(self, path: str, metadata: Mapping) -> bool:
+        """Index one parse result, returning whether it is a duplicate."""
+        key = identity_key(metadata)
+        if key is None:
+            return False
+        value = fingerprint(key)
+        if (group := self._groups.get(value)) is not None:
+            group[1].append(path)
+            return True
+        if (first := self._first.pop(value, None)) is not None:
+            self._groups[value] = (key, [first, path])
+            return True
+        self._first[value] = path
+        return False
+
+    def add_many(self, records: Iterable[tuple[str, Mapping]]) -> None:
+        """Index many paths and parse results."""
+        for path, metadata in records:
+            self.add(path, metadata)
+
+    def iter_groups(self) -> Iterator[DuplicateGroup]:
+        """Yield duplicate groups in the order their second copy was seen."""
+        for value, (key, paths) in self._groups.items():
+            yield DuplicateGroup(format_fingerprint(value), key, tuple(paths))
+
+    def __len__(self) -> int:
+        """Count distinct issues."""
+        return len(self._first) + len(self._groups)
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._first: dict[int, str] = {}
+        self._groups: dict[int, tuple[IdentityKey, list[str]]] = {}
+
+
+def find_duplicates(records: Iterable[tuple[str, Mapping]]) -> list[DuplicateGroup]:
+    """Group paths whose parse results identify the same issue."""
+    index = DuplicateIndex()
+    index.add_many(records)
+    return list(index.iter_groups())
@@ -0,0 +1,150 @@
+"""A reusable, thread safe parsing engine."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from os import cpu_count
+from typing import TYPE_CHECKING
+
+from comicfn2dict.canonical import CanonicalCounts
+from comicfn2dict.codegen import compile_parse
+from comicfn2dict.locales import DEFAULT_LOCALES, compile_locales
+from comicfn2dict.parse import (
+    CaseFoldedParser,
+    ComicFilenameParser,
+    comicfn2dict_batch,
+)
+from comicfn2dict.rules import compile_rules
+from comicfn2dict.sort import ISSUE_SORT_KEY, issue_sort_key
+from comicfn2dict.util import iter_chunks
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from pathlib import Path
+    from types import MappingProxyType
+
+    from comicfn2dict.adaptive import AdaptiveProfile
+    from comicfn2dict.locales import LocalePatterns
+    from comicfn2dict.rules import Rule, StageRules
+
+_THREAD_CHUNK_SIZE = 256
+
+
+class ComicFilenameEngine:
+    """Hold parse configuration and share it between threads."""
+
+    # The engine keeps only configuration. Every call gets its own
+    #     ComicFilenameParser to hold per name state, so one engine may be
+    #     used by any number of threads at once.
+
+    def _add_sort_key(self, metadata: dict[str, str | tuple[str, ...]]) -> None:
+        """Add the issue's natural sort key to a parse result."""
+        if self._sort_keys and isinstance(issue := metadata.get("issue"), str):
+            metadata[ISSUE_SORT_KEY] = issue_sort_key(issue)  # type: ignore[assignment,reportArgumentType]
+
+    def parse(self, path: str | Path) -> dict[str, str | tuple[str, ...]]:
+        """Parse one path."""
+        if self._parse_fn is not None:
+            metadata = self._parse_fn(path)
+            self._add_sort_key(metadata)
+            return metadata
+        metadata = self._parser_class(
+            path,
+            verbose=self._verbose,
+            locale=self._locale,
+            prescan=self._prescan,
+            profile=self._profile,
+            canonical=self.canonical_counts,
+            rules=self._rules,
+        ).parse()
+        self._add_sort_key(metadata)
+        return metadata
+
+    def parse_batch(
+        self, paths: Iterable[str | Path], chunk_size: int = 1024
+    ) -> list[dict[str, str | tuple[str, ...]]]:
+        """Parse many paths stage by stage in this thread."""
+        results = comicfn2dict_batch(
+            paths,
+            chunk_size=chunk_size,
+            verbose=self._verbose,
+            locale=self._locale,
+            prescan=self._prescan,
+            profile=self._profile,
+            canonical=self.canonical_counts,
+            casefold=self._casefold,
+            rules=self._rules,
+        )
+        if self._sort_keys:
+            for metadata in results:
+                self._add_sort_key(metadata)
+        return results
+
+    def parse_many(
+        self,
+        paths: Iterable[str | Path],
+        workers: int | None = None,
+        chunk_size: int = _THREAD_CHUNK_SIZE,
+    ) -> list[dict[str, str | tuple[str, ...]]]:
+        """Parse many paths in order on a pool of threads."""
+        workers = workers or self._workers
+        chunks = iter_chunks(paths, chunk_size)
+        if workers <= 1:
+            return [md for chunk in chunks for md in self.parse_batch(chunk)]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(self.parse_batch, chunks)
+            return [md for chunk_results in results for md in chunk_results]
+
+    def __init__(  # noqa: PLR0913
+        self,
+        verbose: int = 0,
+        workers: int | None = None,
+        *,
+        locales: Iterable[str] = DEFAULT_LOCALES,
+        prescan: bool = False,
+        profile: AdaptiveProfile | None = None,
+        canonical: bool = False,
+        sort_keys: bool = False,
+        casefold: bool = False,
+        rules: Iterable[Rule] = (),
+        codegen: bool = False,
+    ):
+        """Initialize configuration."""
+        self._verbose: int = verbose
+        self._workers: int = workers or cpu_count() or 1
+        self._locale: LocalePatterns = compile_locales(tuple(locales))
+        # Skip the searching stages a single candidate scan rules out.
+        self._prescan: bool = prescan
+        # Guard rarely hit fallback patterns, learning hit rates as it goes.
+        self._profile: AdaptiveProfile | None = profile
+        # Read names already in the dict2comicfn() layout in one match.
+        self.canonical_counts: CanonicalCounts | None = (
+            CanonicalCounts() if canonical else None
+        )
+        # Add natural issue sort keys to parse results.
+        self._sort_keys: bool = sort_keys
+        # Match case sensitive patterns against lowercased names.
+        self._casefold: bool = casefold
+        self._parser_class: type[ComicFilenameParser] = (
+            CaseFoldedParser if casefold else ComicFilenameParser
+        )
+        # Rule pack rules validated and combined into one pattern per stage.
+        self._rules: MappingProxyType[str, StageRules] | None = (
+            compile_rules(rules) or None
+        )
+        # One generated parse function for single names, with this
+        #     configuration's stages & flags unrolled. Logging, profiles, case
+        #     folding and rules keep the usual stage loop.
+        self._parse_fn: (
+            Callable[[str | Path], dict[str, str | tuple[str, ...]]] | None
+        ) = (
+            compile_parse(
+                self._locale, prescan=prescan, canonical=self.canonical_counts
+            )
+            if codegen
+            and not verbose
+            and profile is None
+            and not casefold
+            and self._rules is None
+            else None
+        )
@@ -0,0 +1,105 @@
+"""Read huge filename listings through mmap."""
+
+from __future__ import annotations
+
+import mmap
+from contextlib import closing
+from os import fstat
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from comicfn2dict.shard import shard_of
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterator
+
+LISTING_ENCODING = "utf-8"
+_NEWLINE = b"\n"
+_CARRIAGE_RETURN = ord("\r")
+_SEPARATOR = b"/"
+
+
+def listing_ranges(path: str | Path, count: int) -> tuple[tuple[int, int], ...]:
+    """Split a listing file into count byte ranges for separate workers."""
+    if count < 1:
+        reason = f"Shard count must be at least 1, not {count}"
+        raise ValueError(reason)
+    size = Path(path).stat().st_size
+    return tuple(
+        (index * size // count, (index + 1) * size // count) for index in range(count)
+    )
+
+
+def _first_line_start(mapped: mmap.mmap, start: int, size: int) -> int:
+    """Find the first line that begins at or after start."""
+    # A line belongs to the range that holds its first byte.
+    if start <= 0:
+        return 0
+    if mapped[start - 1] == _NEWLINE[0]:
+        return start
+    newline = mapped.find(_NEWLINE, start)
+    return size if newline < 0 else newline + 1
+
+
+def decode_path(raw_path: bytes, encoding: str = LISTING_ENCODING) -> str:
+    """Decode a raw listing path like its basename was decoded."""
+    return str(raw_path, encoding, "surrogateescape")
+
+
+def _iter_mapped(  # noqa: PLR0913, PLR0917
+    mapped: mmap.mmap,
+    start: int,
+    end: int,
+    size: int,
+    encoding: str,
+    shard: tuple[int, int] | None,
+) -> Iterator[tuple[int, bytes, str]]:
+    """Split lines in place and decode only their basenames."""
+    pos = _first_line_start(mapped, start, size)
+    with memoryview(mapped) as view:
+        while pos < end:
+            newline = mapped.find(_NEWLINE, pos)
+            if newline < 0:
+                newline = size
+            line_end = newline
+            if line_end > pos and mapped[line_end - 1] == _CARRIAGE_RETURN:
+                line_end -= 1
+            if shard and shard_of(view[pos:line_end], shard[1]) != shard[0]:
+                pos = newline + 1
+                continue
+            raw_path = mapped[pos:line_end]
+            if raw_name := raw_path.rpartition(_SEPARATOR)[2]:
+                yield pos, raw_path, str(raw_name, encoding, "surrogateescape")
+            pos = newline + 1
+
+
+def iter_listing(
+    path: str | Path,
+    start: int = 0,
+    end: int | None = None,
+    encoding: str = LISTING_ENCODING,
+    shard: tuple[int, int] | None = None,
+) -> Generator[tuple[int, bytes, str], None, None]:
+    """Yield the byte offset, raw path and basename of each line in a listing."""
+    # Shards i of N keep the lines whose crc32 is i modulo N. Only basenames
+    #     are parsed, so paths stay bytes until decode_path() is called on
+    #     the ones that are kept.
+    with Path(path).open("rb") as listing_file:
+        size = fstat(listing_file.fileno()).st_size
+        if not size:
+            return
+        end = size if end is None else min(end, size)
+        with mmap.mmap(listing_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield from _iter_mapped(mapped, start, end, size, encoding, shard)
+
+
+def listing_path_at(
+    path: str | Path, offset: int, encoding: str = LISTING_ENCODING
+) -> str | None:
+    """Decode the path of the line at offset, or None if no line starts there."""
+    lines = iter_listing(path, start=offset, end=offset + 1, encoding=encoding)
+    with closing(lines):
+        for line_offset, raw_path, _ in lines:
+            if line_offset == offset:
+                return decode_path(raw_path, encoding)
+    return None
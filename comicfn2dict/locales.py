@@ -0,0 +1,175 @@
+"""Locale packs of month names and volume keywords."""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, NamedTuple
+
+from comicfn2dict.regex import (
+    MONTHS,
+    VOLUME_PREFIXES,
+    alpha_month_range_re,
+    month_first_date_re,
+    volume_re,
+    year_first_date_re,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from re import Pattern
+
+
+class LocalePack(NamedTuple):
+    """Month names for each month in order and volume keywords."""
+
+    months: tuple[tuple[str, ...], ...]
+    volume_keywords: tuple[str, ...] = ()
+
+
+# English is always on. Its patterns come from regex.py and these words are its
+#     lookup table.
+DEFAULT_LOCALES = ("en",)
+LOCALE_PACKS: MappingProxyType[str, LocalePack] = MappingProxyType(
+    {
+        "en": LocalePack(
+            months=(
+                ("jan", "january"),
+                ("feb", "february"),
+                ("mar", "march"),
+                ("apr", "april"),
+                ("may",),
+                ("jun", "june"),
+                ("jul", "july"),
+                ("aug", "august"),
+                ("sep", "september"),
+                ("oct", "october"),
+                ("nov", "november"),
+                ("dec", "december"),
+            ),
+        ),
+        "fr": LocalePack(
+            months=(
+                ("janv", "janvier"),
+                ("févr", "fevr", "février", "fevrier"),
+                ("mars",),
+                ("avr", "avril"),
+                ("mai",),
+                ("juin",),
+                ("juil", "juillet"),
+                ("août", "aout"),
+                ("sept", "septembre"),
+                ("octobre",),
+                ("novembre",),
+                ("déc", "décembre", "decembre"),
+            ),
+            volume_keywords=("tome",),
+        ),
+        "es": LocalePack(
+            months=(
+                ("ene", "enero"),
+                ("febrero",),
+                ("marzo",),
+                ("abr", "abril"),
+                ("mayo",),
+                ("junio",),
+                ("julio",),
+                ("ago", "agosto"),
+                ("sept", "septiembre", "setiembre"),
+                ("octubre",),
+                ("noviembre",),
+                ("dic", "diciembre"),
+            ),
+            volume_keywords=("tomo", "volumen"),
+        ),
+        "de": LocalePack(
+            months=(
+                ("januar", "jänner", "jaenner"),
+                ("februar",),
+                ("mär", "märz", "maerz"),
+                ("april",),
+                ("mai",),
+                ("juni",),
+                ("juli",),
+                ("august",),
+                ("sept",),
+                ("okt", "oktober"),
+                ("november",),
+                ("dez", "dezember"),
+            ),
+            volume_keywords=("band", "bd"),
+        ),
+        "it": LocalePack(
+            months=(
+                ("gen", "gennaio"),
+                ("febbraio",),
+                ("marzo",),
+                ("aprile",),
+                ("mag", "maggio"),
+                ("giu", "giugno"),
+                ("lug", "luglio"),
+                ("ago", "agosto"),
+                ("set", "settembre"),
+                ("ott", "ottobre"),
+                ("novembre",),
+                ("dic", "dicembre"),
+            ),
+            volume_keywords=("tomo",),
+        ),
+    }
+)
+
+
+class LocalePatterns(NamedTuple):
+    """Patterns and lookups compiled for a set of locales."""
+
+    month_numbers: MappingProxyType[str, str]
+    alpha_month_range_re: Pattern
+    month_first_date_re: Pattern
+    year_first_date_re: Pattern
+    volume_re: Pattern
+
+
+def _alternation(words: Iterable[str]) -> str:
+    """Longest first alternation of escaped words."""
+    return r"|".join(re.escape(word) for word in sorted(words, key=lambda w: -len(w)))
+
+
+@lru_cache(maxsize=16)
+def compile_locales(locales: tuple[str, ...] = DEFAULT_LOCALES) -> LocalePatterns:
+    """Merge locale packs into one lookup table and one set of patterns."""
+    month_numbers: dict[str, str] = {}
+    extra_months: set[str] = set()
+    volume_keywords: set[str] = set()
+    for locale in dict.fromkeys((*DEFAULT_LOCALES, *locales)):
+        pack = LOCALE_PACKS.get(locale)
+        if not pack:
+            reason = f"Unknown locale {locale!r}. Choose from {', '.join(LOCALE_PACKS)}"
+            raise ValueError(reason)
+        for index, names in enumerate(pack.months, start=1):
+            number = f"{index:02d}"
+            for name in names:
+                if month_numbers.setdefault(name, number) != number:
+                    reason = f"{locale} month name {name!r} is already another month"
+                    raise ValueError(reason)
+                if locale != "en":
+                    extra_months.add(name)
+        volume_keywords.update(pack.volume_keywords)
+
+    months = MONTHS
+    if extra_months:
+        months = (*months, _alternation(extra_months))
+    volume_prefixes = VOLUME_PREFIXES
+    if volume_keywords:
+        volume_prefixes = (
+            *volume_prefixes,
+            r"\b(?:" + _alternation(volume_keywords) + r")\.?",
+        )
+    return LocalePatterns(
+        month_numbers=MappingProxyType(month_numbers),
+        alpha_month_range_re=alpha_month_range_re(months),
+        month_first_date_re=month_first_date_re(months),
+        year_first_date_re=year_first_date_re(months),
+        volume_re=volume_re(volume_prefixes),
+    )
@@ -0,0 +1,209 @@
+"""Match parsed series names to a catalog of known series."""
+
+from __future__ import annotations
+
+import json
+import re
+import sys
+import unicodedata
+from array import array
+from collections import Counter
+from itertools import chain
+from operator import itemgetter
+from pathlib import Path
+from struct import Struct
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+_MAGIC = b"CFN2DSI1"
+_HEADER_SIZE = Struct("<I")
+_NON_WORD_RE = re.compile(r"[\W_]+")
+_LEADING_ARTICLE_RE = re.compile(r"^the\s+")
+_PAD = "  "
+# Only the rarest trigrams of a query gather candidates, up to a budget of
+#     postings so common trigrams don't make queries slow.
+_MIN_CANDIDATE_TRIGRAMS = 2
+_CANDIDATE_POSTINGS = 512
+_MAX_CANDIDATES = 16
+_MIN_SCORE = 0.5
+# Libraries repeat series names, so remember recent fuzzy lookups.
+_CACHE_SIZE = 65536
+
+
+class SeriesMatch(NamedTuple):
+    """A catalog series and how well it matched."""
+
+    series: str
+    score: float
+
+
+def normalize_series(series: str) -> str:
+    """Fold case, accents, punctuation and a leading 'The' into a key."""
+    key = series.casefold()
+    if not key.isascii():
+        decomposed = unicodedata.normalize("NFKD", key)
+        key = "".join(char for char in decomposed if not unicodedata.combining(char))
+    key = _NON_WORD_RE.sub(" ", key).strip()
+    return _LEADING_ARTICLE_RE.sub("", key)
+
+
+def _trigrams(key: str) -> set[str]:
+    """Split a padded key into trigrams."""
+    padded = _PAD + key + " "
+    return {padded[index : index + 3] for index in range(len(padded) - 2)}
+
+
+def _dice(first: set[str], second: set[str]) -> float:
+    """Dice coefficient of two trigram sets."""
+    total = len(first) + len(second)
+    return 2 * len(first & second) / total if total else 0.0
+
+
+class SeriesIndex:
+    """A trigram inverted index of catalog series names."""
+
+    @classmethod
+    def build(cls, catalog: Iterable[str]) -> SeriesIndex:
+        """Index a catalog of series names."""
+        names: list[str] = []
+        keys: list[str] = []
+        ids: dict[str, list[int]] = {}
+        for name in dict.fromkeys(catalog):
+            key = normalize_series(name)
+            if not key:
+                continue
+            series_id = len(names)
+            names.append(name)
+            keys.append(key)
+            for trigram in _trigrams(key):
+                if (trigram_ids := ids.get(trigram)) is None:
+                    ids[trigram] = [series_id]
+                else:
+                    trigram_ids.append(series_id)
+        postings = {
+            trigram: array("I", trigram_ids) for trigram, trigram_ids in ids.items()
+        }
+        return cls(names, keys, postings)
+
+    def save(self, path: str | Path) -> None:
+        """Write the index to one file that loads without reindexing."""
+        trigrams = sorted(self._postings)
+        header = json.dumps(
+            {
+                "byteorder": sys.byteorder,
+                "names": self._names,
+                "keys": self._keys,
+                "trigrams": trigrams,
+                "counts": [len(self._postings[trigram]) for trigram in trigrams],
+            },
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode()
+        with Path(path).open("wb") as index_file:
+            index_file.write(_MAGIC + _HEADER_SIZE.pack(len(header)) + header)
+            index_file.writelines(
+                self._postings[trigram].tobytes() for trigram in trigrams
+            )
+
+    @classmethod
+    def load(cls, path: str | Path) -> SeriesIndex:
+        """Read an index written by save()."""
+        data = Path(path).read_bytes()
+        if not data.startswith(_MAGIC):
+            reason = f"{path} is not a series index"
+            raise ValueError(reason)
+        start = len(_MAGIC) + _HEADER_SIZE.size
+        (header_size,) = _HEADER_SIZE.unpack_from(data, len(_MAGIC))
+        header = json.loads(data[start : start + header_size])
+        ids = array("I")
+        ids.frombytes(data[start + header_size :])
+        if header["byteorder"] != sys.byteorder:
+            ids.byteswap()
+        postings: dict[str, array | memoryview] = {}
+        view = memoryview(ids)
+        offset = 0
+        for trigram, count in zip(header["trigrams"], header["counts"]):  # noqa: B905
+            postings[trigram] = view[offset : offset + count]
+            offset += count
+        return cls(header["names"], header["keys"], postings)
+
+    def _candidates(self, trigrams: set[str], limit: int) -> list[int]:
+        """Series ids sharing the most of the query's rarest trigrams."""
+        lists = sorted(
+            (
+                posting
+                for trigram in trigrams
+                if (posting := self._postings.get(trigram))
+            ),
+            key=len,
+        )
+        total = 0
+        for taken, posting in enumerate(lists):
+            total += len(posting)
+            if taken >= _MIN_CANDIDATE_TRIGRAMS and total > _CANDIDATE_POSTINGS:
+                lists = lists[:taken]
+                break
+        hits = Counter(chain.from_iterable(lists))
+        ranked = sorted(hits.items(), key=itemgetter(1), reverse=True)
+        return [series_id for series_id, _ in ranked[:limit]]
+
+    def lookup(
+        self,
+        series: str,
+        min_score: float = _MIN_SCORE,
+        max_candidates: int = _MAX_CANDIDATES,
+    ) -> SeriesMatch | None:
+        """Find the best catalog match for a series name."""
+        key = normalize_series(series)
+        if not key:
+            return None
+        if (series_id := self._exact.get(key)) is not None:
+            return SeriesMatch(self._names[series_id], 1.0)
+        cache_key = (key, min_score, max_candidates)
+        if cache_key in self._cache:
+            return self._cache[cache_key]
+        trigrams = _trigrams(key)
+        best: SeriesMatch | None = None
+        for series_id in self._candidates(trigrams, max_candidates):
+            score = _dice(trigrams, _trigrams(self._keys[series_id]))
+            if score >= min_score and (best is None or score > best.score):
+                best = SeriesMatch(self._names[series_id], score)
+        if len(self._cache) >= _CACHE_SIZE:
+            self._cache.clear()
+        self._cache[cache_key] = best
+        return best
+
+    def match(
+        self, metadata: Mapping, min_score: float = _MIN_SCORE
+    ) -> SeriesMatch | None:
+        """Find the best catalog match for a parse result's series."""
+        series = metadata.get("series")
+        return self.lookup(series, min_score) if isinstance(series, str) else None
+
+    def match_many(
+        self, metadatas: Iterable[Mapping], min_score: float = _MIN_SCORE
+    ) -> list[SeriesMatch | None]:
+        """Match many parse results."""
+        return [self.match(metadata, min_score) for metadata in metadatas]
+
+    def __len__(self) -> int:
+        """Count catalog series."""
+        return len(self._names)
+
+    def __init__(
+        self,
+        names: list[str],
+        keys: list[str],
+        postings: Mapping[str, array | memoryview],
+    ):
+        """Initialize from built or loaded parts."""
+        self._names = names
+        self._keys = keys
+        self._postings = postings
+        # The first name wins when several normalize to the same key.
+        self._exact: dict[str, int] = {}
+        for series_id, key in enumerate(keys):
+            self._exact.setdefault(key, series_id)
+        self._cache: dict[tuple[str, float, int], SeriesMatch | None] = {}
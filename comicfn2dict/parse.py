@@ -2,22 +2,23 @@
 
 from __future__ import annotations
 
-from calendar import month_abbr
 from copy import copy
 from pathlib import Path
 from pprint import pformat
 from sys import maxsize
 from typing import TYPE_CHECKING
 
+from comicfn2dict.adaptive import FALLBACK_GUARDS
+from comicfn2dict.canonical import match_canonical
+from comicfn2dict.locales import compile_locales
 from comicfn2dict.log import print_log_header
 from comicfn2dict.regex import (
-    ALPHA_MONTH_RANGE_RE,
     BOOK_VOLUME_RE,
+    CANDIDATES_RE,
     ISSUE_BEGIN_RE,
     ISSUE_END_RE,
     ISSUE_NUMBER_RE,
     ISSUE_WITH_COUNT_RE,
-    MONTH_FIRST_DATE_RE,
     NON_NUMBER_DOT_RE,
     ORIGINAL_FORMAT_NAKED_RE,
     ORIGINAL_FORMAT_SCAN_INFO_RE,
@@ -31,30 +32,61 @@ from comicfn2dict.regex import (
     REMAINING_GROUP_RE,
     SCAN_INFO_SECONDARY_RE,
     TOKEN_DELIMETER,
-    VOLUME_RE,
     VOLUME_WITH_COUNT_RE,
     YEAR_END_RE,
-    YEAR_FIRST_DATE_RE,
     YEAR_TOKEN_RE,
+    fold_re,
 )
+from comicfn2dict.rules import match_rules
+from comicfn2dict.util import iter_chunks
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
     from re import Match, Pattern
+    from types import MappingProxyType
+
+    from comicfn2dict.adaptive import AdaptiveProfile
+    from comicfn2dict.canonical import CanonicalCounts
+    from comicfn2dict.locales import LocalePatterns
+    from comicfn2dict.rules import StageRules
 
 _DATE_KEYS = frozenset({"year", "month", "day"})
 _REMAINING_GROUP_KEYS = ("series", "title")
 # Ordered by commonness.
 _TITLE_PRECEDING_KEYS = ("issue", "year", "volume", "month")
+_END_TOKEN_KEYS = frozenset({"volume", "year", "issue"})
+_BATCH_CHUNK_SIZE = 1024
+# Candidate triggers from CANDIDATES_RE that each searching stage needs.
+_NUMBER_CANDIDATES = frozenset({"number"})
+_DATE_CANDIDATES = frozenset({"number", "dash"})
+_FORMAT_CANDIDATES = frozenset({"paren", "c2c"})
+_PAREN_CANDIDATES = frozenset({"paren"})
+_PUBLISHER_CANDIDATES = frozenset({"publisher"})
+
+
+def _join_marked_tokens(marked_str: str) -> str:
+    """Strip the tokens between delimiters and drop empty ones."""
+    parts = []
+    for part in marked_str.split(TOKEN_DELIMETER):
+        token = part.strip()
+        if token:
+            parts.append(token)
+    return TOKEN_DELIMETER.join(parts)
 
 
 class ComicFilenameParser:
     """Parse a filename metadata into a dict."""
 
+    # Stages reassign these before __init__ is read by type checkers.
+    _unparsed_path: str
+    _candidates: frozenset[str] | None
+    metadata: dict[str, str | tuple[str, ...]]
+
     def path_index(self, key: str, default: int = -1) -> int:
         """Lazily retrieve and memoize the key's location in the path."""
         if key == "remainders":
             return default
-        value: str = self.metadata.get(key, "")  # type: ignore[reportAssignmentType]
+        value: str = self.metadata.get(key, "")  # type: ignore[assignment,reportAssignmentType]
         if not value:
             return default
         if value not in self._path_indexes:
@@ -74,6 +106,21 @@ class ComicFilenameParser:
         print("  " + self._unparsed_path)  # noqa: T201
         print("  " + pformat(combined))  # noqa: T201
 
+    def _parse_canonical(self) -> bool:
+        """Read a name already in the dict2comicfn() layout in one match."""
+        counts = self._canonical
+        # Rules may read fields from any name.
+        if counts is None or self._rules is not None:
+            return False
+        metadata = match_canonical(self.path, self._locale.alpha_month_range_re)
+        counts.record(metadata is not None)
+        if metadata is None:
+            return False
+        self.metadata = metadata
+        self._unparsed_path = ""
+        self._log("After canonical fast path")
+        return True
+
     def _parse_ext(self) -> None:
         """Pop the extension from the pathname."""
         path = Path(self._unparsed_path)
@@ -97,12 +144,34 @@ class ComicFilenameParser:
         self._unparsed_path = data.strip()
         self._log("After Clean Path")
 
+    def _scan_candidates(self) -> None:
+        """Find the triggers for every searching stage in one scan."""
+        if not self._prescan:
+            return
+        self._candidates = frozenset(
+            match.lastgroup
+            for match in CANDIDATES_RE.finditer(self._unparsed_path)
+            if match.lastgroup
+        )
+
+    def _lacks_candidates(self, candidates: frozenset[str] | None) -> bool:
+        """Skip a stage whose patterns have nothing to match."""
+        return (
+            candidates is not None
+            and self._candidates is not None
+            and self._candidates.isdisjoint(candidates)
+        )
+
     def _parse_items_update_metadata(
-        self, matches: Match, exclude: str, require_all: bool, first_only: bool
+        self,
+        groups: dict[str, str | None],
+        exclude: str,
+        require_all: bool,
+        first_only: bool,
     ) -> bool:
         """Update Metadata."""
         matched_metadata = {}
-        for key, value in matches.groupdict().items():
+        for key, value in groups.items():
             if value == exclude:
                 continue
             if not value:
@@ -117,16 +186,15 @@ class ComicFilenameParser:
         self.metadata.update(matched_metadata)
         return True
 
+    def _set_unparsed_path(self, path: str) -> None:
+        """Replace the unparsed path after a stage removes text."""
+        self._unparsed_path = path
+
     def _parse_items_pop_tokens(self, regex: Pattern, first_only: bool) -> None:
         """Pop tokens from unparsed path."""
         count = 1 if first_only else 0
         marked_str = regex.sub(TOKEN_DELIMETER, self._unparsed_path, count=count)
-        parts = []
-        for part in marked_str.split(TOKEN_DELIMETER):
-            token = part.strip()
-            if token:
-                parts.append(token)
-        self._unparsed_path = TOKEN_DELIMETER.join(parts)
+        self._set_unparsed_path(_join_marked_tokens(marked_str))
 
     def _parse_items(
         self,
@@ -135,59 +203,98 @@ class ComicFilenameParser:
         first_only: bool = False,  # noqa: FBT002
         pop: bool = True,  # noqa: FBT002
         exclude: str = "",
-    ) -> None:
+    ) -> bool:
         """Parse a value from the data list into metadata and alter the data list."""
         # Match
         matches = regex.search(self._unparsed_path)
         if not matches:
-            return
+            return False
 
         if not self._parse_items_update_metadata(
-            matches, exclude, require_all, first_only
+            matches.groupdict(), exclude, require_all, first_only
         ):
-            return
+            return False
 
         if pop:
             self._parse_items_pop_tokens(regex, first_only)
+        return True
+
+    def _lowered_path(self) -> str:
+        """Lowercase the unparsed path for literal checks."""
+        return self._unparsed_path.lower()
+
+    def _parse_fallback(self, name: str, regex: Pattern) -> None:
+        """Parse items, skipping the search if its guard literal is missing."""
+        profile = self._profile
+        if profile is None:
+            self._parse_items(regex)
+            return
+        if (
+            profile.use_guard(name)
+            and FALLBACK_GUARDS[name] not in self._lowered_path()
+        ):
+            hit = False
+        else:
+            hit = self._parse_items(regex)
+        profile.record(name, hit)
+
+    def _parse_rules(self, stage: str) -> None:
+        """Read fields with the rule pack rules that run before a stage."""
+        if self._rules is None or (stage_rules := self._rules.get(stage)) is None:
+            return
+        path = self._unparsed_path
+        values, spans = match_rules(stage_rules, path, self.metadata)
+        self.metadata.update(values)
+        if spans:
+            parts = []
+            pos = 0
+            for start, end in spans:
+                parts.append(path[pos:start])
+                parts.append(TOKEN_DELIMETER)
+                pos = end
+            parts.append(path[pos:])
+            self._set_unparsed_path(_join_marked_tokens("".join(parts)))
+        self._log(f"After {stage} rules")
 
     def _parse_issue(self) -> None:
         """Parse Issue."""
-        self._parse_items(ISSUE_NUMBER_RE)
+        self._parse_fallback("issue_number", ISSUE_NUMBER_RE)
         if "issue" not in self.metadata:
-            self._parse_items(ISSUE_WITH_COUNT_RE)
+            self._parse_fallback("issue_with_count", ISSUE_WITH_COUNT_RE)
         self._log("After Issue")
 
     def _parse_volume(self) -> None:
         """Parse Volume."""
-        self._parse_items(VOLUME_RE)
+        self._parse_items(self._locale.volume_re)
         if "volume" not in self.metadata:
-            self._parse_items(VOLUME_WITH_COUNT_RE)
+            self._parse_fallback("volume_with_count", VOLUME_WITH_COUNT_RE)
         self._log("After Volume")
 
     def _alpha_month_to_numeric(self) -> None:
         """Translate alpha_month to numeric month."""
-        alpha_month: str = self.metadata.pop("alpha_month", "")  # type: ignore[reportAssignmentType]
-        if alpha_month:
-            alpha_month = alpha_month.capitalize()
-            # type: ignore[reportAttributeAccessIssue]
-            for index, abbr in enumerate(month_abbr):
-                if abbr and alpha_month.startswith(abbr):
-                    month = f"{index:02d}"
-                    self.metadata["month"] = month
-                    break
+        alpha_month: str = self.metadata.pop("alpha_month", "")  # type: ignore[assignment,reportAssignmentType]
+        if alpha_month and (
+            month := self._locale.month_numbers.get(alpha_month.lower())
+        ):
+            self.metadata["month"] = month
+
+    def _discard_alpha_month_ranges(self) -> None:
+        """Discard second month of alpha month ranges."""
+        self._set_unparsed_path(
+            self._locale.alpha_month_range_re.sub(r"\1", self._unparsed_path)
+        )
 
     def _parse_dates(self) -> None:
         """Parse date schemes."""
-        # Discard second month of alpha month ranges.
-        self._unparsed_path = ALPHA_MONTH_RANGE_RE.sub(r"\1", self._unparsed_path)
+        self._discard_alpha_month_ranges()
 
         # Month first date
-        self._parse_items(MONTH_FIRST_DATE_RE)
+        self._parse_items(self._locale.month_first_date_re)
         self._alpha_month_to_numeric()
 
         # Year first date
-        if _DATE_KEYS - self.metadata.keys():
-            self._parse_items(YEAR_FIRST_DATE_RE)
+        if not self.metadata.keys() >= _DATE_KEYS:
+            self._parse_items(self._locale.year_first_date_re)
             self._alpha_month_to_numeric()
 
         if "year" not in self.metadata:
@@ -212,7 +319,7 @@ class ComicFilenameParser:
             self._parse_items(
                 ORIGINAL_FORMAT_SCAN_INFO_SEPARATE_RE,
             )
-        self._parse_items(SCAN_INFO_SECONDARY_RE)
+        self._parse_fallback("secondary_scan_info", SCAN_INFO_SECONDARY_RE)
         if (
             scan_info_secondary := self.metadata.pop("secondary_scan_info", "")
         ) and "scan_info" not in self.metadata:
@@ -222,15 +329,15 @@ class ComicFilenameParser:
     def _parse_remainder_paren_groups(self) -> None:
         """Remove extraneous paren groups."""
         self._parse_items(REMAINDER_PAREN_GROUPS_RE)
-        remainders: str = self.metadata.get("remainders", "")  # type: ignore[reportAssignmentType]
+        remainders: str = self.metadata.get("remainders", "")  # type: ignore[assignment,reportAssignmentType]
         if remainders:
             self.metadata["remainders"] = (remainders,)
         self._log("After parsing remainder paren and bracket groups")
 
-    def _parse_ends_of_remaining_tokens(self):
+    def _parse_ends_of_remaining_tokens(self) -> None:
         # Volume left on the end of string tokens
         if "volume" not in self.metadata:
-            self._parse_items(BOOK_VOLUME_RE)
+            self._parse_fallback("book_volume", BOOK_VOLUME_RE)
             self._log("After original_format & scan_info")
 
         # Years left on the end of string tokens
@@ -242,7 +349,7 @@ class ComicFilenameParser:
 
         # Issue left on the end of string tokens
         if "issue" not in self.metadata and not year_end_matched:
-            exclude: str = self.metadata.get("year", "")  # type: ignore[reportAssignmentType]
+            exclude: str = self.metadata.get("year", "")  # type: ignore[assignment,reportAssignmentType]
             self._parse_items(ISSUE_END_RE, exclude=exclude)
         if "issue" not in self.metadata:
             self._parse_items(ISSUE_BEGIN_RE)
@@ -339,6 +446,13 @@ class ComicFilenameParser:
         self._unparsed_path = " ".join(unused_tokens) if unused_tokens else ""
         self._log("After Series & Title")
 
+    def _copy_volume_to_issue(self) -> None:
+        """Copy volume into issue if it's all we have."""
+        if "issue" not in self.metadata and "volume" in self.metadata:
+            self.metadata["issue"] = self.metadata["volume"]
+            self._log("Using volume for issue.")
+        self._log("After issue can be volume")
+
     def _add_remainders(self) -> None:
         """Add Remainders."""
         remainders = []
@@ -355,43 +469,293 @@ class ComicFilenameParser:
     def parse(self) -> dict[str, str | tuple[str, ...]]:
         """Parse the filename with a hierarchy of regexes."""
         self._log("Init")
+        if self._parse_canonical():
+            return self.metadata
         self._parse_ext()
         self._clean_dividers()
-        self._parse_issue()
-        self._parse_volume()
-        self._parse_dates()
-        self._parse_format_and_scan_info()
-        self._parse_remainder_paren_groups()
-        self._parse_ends_of_remaining_tokens()
-        self._parse_publisher()
-        self._parse_series_and_title()
-
-        # Copy volume into issue if it's all we have.
-        if "issue" not in self.metadata and "volume" in self.metadata:
-            self.metadata["issue"] = self.metadata["volume"]
-            self._log("Using volume for issue.")
-        self._log("After issue can be volume")
-
+        self._scan_candidates()
+        for name, stage, candidates, gate in _STAGES:
+            self._parse_rules(name)
+            if not self._lacks_candidates(candidates) and (gate is None or gate(self)):
+                stage(self)
+        self._copy_volume_to_issue()
         self._add_remainders()
 
         return self.metadata
 
-    def __init__(self, path: str | Path, verbose: int = 0):
+    def __init__(  # noqa: PLR0913
+        self,
+        path: str | Path,
+        verbose: int = 0,
+        *,
+        locale: LocalePatterns | None = None,
+        prescan: bool = False,
+        profile: AdaptiveProfile | None = None,
+        canonical: CanonicalCounts | None = None,
+        rules: MappingProxyType[str, StageRules] | None = None,
+    ):
         """Initialize."""
         self._debug: bool = verbose > 0
+        self._locale: LocalePatterns = locale or compile_locales()
+        self._prescan: bool = prescan
+        self._profile: AdaptiveProfile | None = profile
+        self._canonical: CanonicalCounts | None = canonical
+        self._rules: MappingProxyType[str, StageRules] | None = rules or None
+        self._candidates = None
         # munge path
         if isinstance(path, str):
             path = path.strip()
         p_path = Path(path)
         self.path = str(p_path.name).strip()
-        self.metadata: dict[str, str | tuple[str, ...]] = {}
+        self.metadata = {}
         self._unparsed_path = copy(self.path)
         self._path_indexes: dict[str, int] = {}
 
 
+class CaseFoldedParser(ComicFilenameParser):
+    """Parse with case sensitive patterns against a lowercased copy of the name."""
+
+    # IGNORECASE patterns fold the case of every character they compare on
+    #     every scan, and lose the literal prefix searches sre uses to skip
+    #     ahead. ASCII names are lowercased once after cleaning and again only
+    #     when a stage edits them, then searched with case sensitive twins of
+    #     the patterns. Lowercasing ASCII keeps every span, so values are
+    #     sliced from the original casing. Most searches miss, so the rare
+    #     edits still use the IGNORECASE patterns. Other names may have case
+    #     equivalences outside ASCII and use the IGNORECASE patterns throughout.
+
+    _folded: str | None
+
+    def _clean_dividers(self) -> None:
+        """Clean the path and lowercase a copy to match against."""
+        super()._clean_dividers()
+        path = self._unparsed_path
+        self._folded = path.lower() if path.isascii() else None
+
+    def _scan_candidates(self) -> None:
+        """Find the triggers for every searching stage in one scan."""
+        if self._folded is None:
+            super()._scan_candidates()
+            return
+        if not self._prescan:
+            return
+        self._candidates = frozenset(
+            match.lastgroup
+            for match in fold_re(CANDIDATES_RE).finditer(self._folded)
+            if match.lastgroup
+        )
+
+    def _original_groups(self, match: Match) -> dict[str, str | None]:
+        """Slice the named groups of a lowercased match from the unparsed path."""
+        path = self._unparsed_path
+        groups: dict[str, str | None] = {}
+        for key in match.re.groupindex:
+            start, end = match.span(key)
+            groups[key] = path[start:end] if start >= 0 else None
+        return groups
+
+    def _set_unparsed_path(self, path: str) -> None:
+        """Replace the unparsed path and its lowercased copy."""
+        self._unparsed_path = path
+        if self._folded is not None:
+            self._folded = path.lower()
+
+    def _parse_items(
+        self,
+        regex: Pattern,
+        require_all: bool = False,  # noqa: FBT002
+        first_only: bool = False,  # noqa: FBT002
+        pop: bool = True,  # noqa: FBT002
+        exclude: str = "",
+    ) -> bool:
+        """Parse a value from the data list into metadata and alter the data list."""
+        if self._folded is None:
+            return super()._parse_items(regex, require_all, first_only, pop, exclude)
+        matches = fold_re(regex).search(self._folded)
+        if not matches:
+            return False
+
+        if not self._parse_items_update_metadata(
+            self._original_groups(matches), exclude, require_all, first_only
+        ):
+            return False
+
+        if pop:
+            self._parse_items_pop_tokens(regex, first_only)
+        return True
+
+    def _lowered_path(self) -> str:
+        """Lowercase the unparsed path for literal checks."""
+        if self._folded is None:
+            return super()._lowered_path()
+        return self._folded
+
+    def _discard_alpha_month_ranges(self) -> None:
+        """Discard second month of alpha month ranges."""
+        folded = self._folded
+        if folded is None or fold_re(self._locale.alpha_month_range_re).search(folded):
+            super()._discard_alpha_month_ranges()
+
+
 def comicfn2dict(
     path: str | Path, verbose: int = 0
 ) -> dict[str, str | tuple[str, ...]]:
     """Simplfily the API."""
     parser = ComicFilenameParser(path, verbose=verbose)
     return parser.parse()
+
+
+def _lacks_end_token_keys(parser: ComicFilenameParser) -> bool:
+    """Skip the ends of tokens stage if volume, year & issue are all found."""
+    return not parser.metadata.keys() >= _END_TOKEN_KEYS
+
+
+# The searching stages of ComicFilenameParser.parse() in order, each named for
+#     the rules that run before it, with the prescan candidates it needs, if
+#     any, and an optional gate that skips the stage when it can't change the name.
+#     The generated parse function in codegen.py is written from this table.
+_STAGES: tuple[
+    tuple[
+        str,
+        Callable[[ComicFilenameParser], None],
+        frozenset[str] | None,
+        Callable[[ComicFilenameParser], bool] | None,
+    ],
+    ...,
+] = (
+    ("issue", ComicFilenameParser._parse_issue, _NUMBER_CANDIDATES, None),  # noqa: SLF001
+    ("volume", ComicFilenameParser._parse_volume, _NUMBER_CANDIDATES, None),  # noqa: SLF001
+    ("dates", ComicFilenameParser._parse_dates, _DATE_CANDIDATES, None),  # noqa: SLF001
+    (
+        "format",
+        ComicFilenameParser._parse_format_and_scan_info,  # noqa: SLF001
+        _FORMAT_CANDIDATES,
+        None,
+    ),
+    (
+        "remainders",
+        ComicFilenameParser._parse_remainder_paren_groups,  # noqa: SLF001
+        _PAREN_CANDIDATES,
+        None,
+    ),
+    (
+        "ends",
+        ComicFilenameParser._parse_ends_of_remaining_tokens,  # noqa: SLF001
+        _NUMBER_CANDIDATES,
+        _lacks_end_token_keys,
+    ),
+    (
+        "publisher",
+        ComicFilenameParser._parse_publisher,  # noqa: SLF001
+        _PUBLISHER_CANDIDATES,
+        None,
+    ),
+    # Series & title read whatever is left, so they need no candidates.
+    ("series", ComicFilenameParser._parse_series_and_title, None, None),  # noqa: SLF001
+)
+
+
+def _parse_chunk(  # noqa: PLR0913
+    paths: Iterable[str | Path],
+    verbose: int,
+    *,
+    locale: LocalePatterns | None,
+    prescan: bool,
+    profile: AdaptiveProfile | None,
+    canonical: CanonicalCounts | None,
+    casefold: bool,
+    rules: MappingProxyType[str, StageRules] | None,
+) -> list[dict[str, str | tuple[str, ...]]]:
+    """Run each stage across the whole chunk before moving to the next."""
+    locale = locale or compile_locales()
+    parser_class = CaseFoldedParser if casefold else ComicFilenameParser
+    parsers = [
+        parser_class(
+            path,
+            verbose=verbose,
+            locale=locale,
+            prescan=prescan,
+            profile=profile,
+            canonical=canonical,
+            rules=rules,
+        )
+        for path in paths
+    ]
+    # Canonical names are read in one match and skip every stage.
+    pending = [parser for parser in parsers if not parser._parse_canonical()]  # noqa: SLF001
+    for parser in pending:
+        parser._parse_ext()  # noqa: SLF001
+    for parser in pending:
+        parser._clean_dividers()  # noqa: SLF001
+        parser._scan_candidates()  # noqa: SLF001
+
+    # Names drop out of the searching stages once nothing is left unparsed.
+    active = [parser for parser in pending if parser._unparsed_path]  # noqa: SLF001
+    for name, stage, candidates, gate in _STAGES:
+        for parser in active:
+            parser._parse_rules(name)  # noqa: SLF001
+            if not parser._lacks_candidates(candidates) and (  # noqa: SLF001
+                gate is None or gate(parser)
+            ):
+                stage(parser)
+        active = [parser for parser in active if parser._unparsed_path]  # noqa: SLF001
+
+    for parser in pending:
+        parser._copy_volume_to_issue()  # noqa: SLF001
+    for parser in active:
+        parser._add_remainders()  # noqa: SLF001
+    return [parser.metadata for parser in parsers]
+
+
+def iter_comicfn2dict_batch(  # noqa: PLR0913
+    paths: Iterable[str | Path],
+    chunk_size: int = _BATCH_CHUNK_SIZE,
+    verbose: int = 0,
+    *,
+    locale: LocalePatterns | None = None,
+    prescan: bool = False,
+    profile: AdaptiveProfile | None = None,
+    canonical: CanonicalCounts | None = None,
+    casefold: bool = False,
+    rules: MappingProxyType[str, StageRules] | None = None,
+) -> Iterator[dict[str, str | tuple[str, ...]]]:
+    """Parse many paths stage by stage, a chunk at a time, in order."""
+    for chunk in iter_chunks(paths, chunk_size):
+        yield from _parse_chunk(
+            chunk,
+            verbose,
+            locale=locale,
+            prescan=prescan,
+            profile=profile,
+            canonical=canonical,
+            casefold=casefold,
+            rules=rules,
+        )
+
+
+def comicfn2dict_batch(  # noqa: PLR0913
+    paths: Iterable[str | Path],
+    chunk_size: int = _BATCH_CHUNK_SIZE,
+    verbose: int = 0,
+    *,
+    locale: LocalePatterns | None = None,
+    prescan: bool = False,
+    profile: AdaptiveProfile | None = None,
+    canonical: CanonicalCounts | None = None,
+    casefold: bool = False,
+    rules: MappingProxyType[str, StageRules] | None = None,
+) -> list[dict[str, str | tuple[str, ...]]]:
+    """Parse many paths with the same results as comicfn2dict()."""
+    return list(
+        iter_comicfn2dict_batch(
+            paths,
+            chunk_size=chunk_size,
+            verbose=verbose,
+            locale=locale,
+            prescan=prescan,
+            profile=profile,
+            canonical=canonical,
+            casefold=casefold,
+            rules=rules,
+        )
+    )
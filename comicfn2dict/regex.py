@@ -1,7 +1,7 @@
 """Parsing regexes."""
 
 import re
-from re import IGNORECASE, Pattern
+from re import IGNORECASE, Match, Pattern
 from types import MappingProxyType
 
 PUBLISHERS_UNAMBIGUOUS: tuple[str, ...] = (
@@ -85,6 +85,31 @@ def re_compile(exp: str, parenthify: bool = False) -> Pattern:  # noqa: FBT002
     return re.compile(exp, flags=IGNORECASE)
 
 
+# Escapes and group names keep their case.
+_FOLD_EXP_RE = re.compile(r"\\.|\(\?P[<=]\w+|[A-Z]+")
+
+
+def _fold_exp_token(match: Match) -> str:
+    """Lowercase letters that aren't escapes or group names."""
+    token = match.group()
+    return token if token[0] in "\\(" else token.lower()
+
+
+# Keyed by id because hashing a pattern hashes its compiled code every time.
+#     Entries keep their pattern alive so its id isn't reused.
+_FOLDED_RES: dict[int, tuple[Pattern, Pattern]] = {}
+
+
+def fold_re(regex: Pattern) -> Pattern:
+    """Compile a case sensitive twin of a pattern for lowercased ASCII text."""
+    if entry := _FOLDED_RES.get(id(regex)):
+        return entry[1]
+    exp = _FOLD_EXP_RE.sub(_fold_exp_token, regex.pattern)
+    folded = re.compile(exp, flags=regex.flags & ~IGNORECASE)
+    _FOLDED_RES[id(regex)] = (regex, folded)
+    return folded
+
+
 # CLEAN
 _TOKEN_DIVIDERS_RE = re_compile(r":")
 _SPACE_EQUIVALENT_RE = re_compile(r"_")
@@ -105,52 +130,71 @@ REGEX_SUBS: MappingProxyType[Pattern, tuple[str, int]] = MappingProxyType(
 
 ### DATES
 _YEAR_RE_EXP = r"(?P<year>[12]\d{3})"
-_MONTH_ALPHA_RE_EXP = r"(" + "(?P<alpha_month>" + r"|".join(MONTHS) + r")\.?" r")"
 _MONTH_NUMERIC_RE_EXP = r"(?P<month>0?\d|1[0-2]?)"
-_MONTH_RE_EXP = r"(" + _MONTH_ALPHA_RE_EXP + r"|" + _MONTH_NUMERIC_RE_EXP + r")"
-_ALPHA_MONTH_RANGE = (
-    r"\b"  # noqa: ISC003
-    + r"("
-    + r"|".join(MONTHS)
-    + r")"
-    + r"("
-    + r"\.?-"
-    + r"("
-    + r"|".join(MONTHS)
-    + r")"
-    + r")\b"
-)
-ALPHA_MONTH_RANGE_RE: Pattern = re_compile(_ALPHA_MONTH_RANGE)
-
 _DAY_RE_EXP = r"(?P<day>([0-2]?\d|(3)[0-1]))"
 _DATE_DELIM = r"[-\s]+"
-_MONTH_FIRST_DATE_RE_EXP = (
-    r"((\b|\(?)"
-    # Month
-    + _MONTH_RE_EXP
-    # Day
-    + r"("
-    + _DATE_DELIM
-    + _DAY_RE_EXP
-    + r")?"
-    # Year
-    + r"[,]?"
-    + _DATE_DELIM
-    + _YEAR_RE_EXP
-    + r"(\)?|\b))"
-)
-_YEAR_FIRST_DATE_RE_EXP = (
-    r"(\b\(?"
-    + _YEAR_RE_EXP
-    + _DATE_DELIM
-    + _MONTH_RE_EXP
-    + _DATE_DELIM
-    + _DAY_RE_EXP
-    + r"\b\)?)"
-)
-
-MONTH_FIRST_DATE_RE: Pattern = re_compile(_MONTH_FIRST_DATE_RE_EXP)
-YEAR_FIRST_DATE_RE: Pattern = re_compile(_YEAR_FIRST_DATE_RE_EXP)
+
+
+def _month_re_exp(months: tuple[str, ...]) -> str:
+    """Alpha or numeric month expression."""
+    month_alpha_re_exp = r"(" + "(?P<alpha_month>" + r"|".join(months) + r")\.?" r")"
+    return r"(" + month_alpha_re_exp + r"|" + _MONTH_NUMERIC_RE_EXP + r")"
+
+
+def alpha_month_range_re(months: tuple[str, ...]) -> Pattern:
+    """Compile the alpha month range regex for month names."""
+    exp = (
+        r"\b"  # noqa: ISC003
+        + r"("
+        + r"|".join(months)
+        + r")"
+        + r"("
+        + r"\.?-"
+        + r"("
+        + r"|".join(months)
+        + r")"
+        + r")\b"
+    )
+    return re_compile(exp)
+
+
+def month_first_date_re(months: tuple[str, ...]) -> Pattern:
+    """Compile the month first date regex for month names."""
+    exp = (
+        r"((\b|\(?)"
+        # Month
+        + _month_re_exp(months)
+        # Day
+        + r"("
+        + _DATE_DELIM
+        + _DAY_RE_EXP
+        + r")?"
+        # Year
+        + r"[,]?"
+        + _DATE_DELIM
+        + _YEAR_RE_EXP
+        + r"(\)?|\b))"
+    )
+    return re_compile(exp)
+
+
+def year_first_date_re(months: tuple[str, ...]) -> Pattern:
+    """Compile the year first date regex for month names."""
+    exp = (
+        r"(\b\(?"
+        + _YEAR_RE_EXP
+        + _DATE_DELIM
+        + _month_re_exp(months)
+        + _DATE_DELIM
+        + _DAY_RE_EXP
+        + r"\b\)?)"
+    )
+    return re_compile(exp)
+
+
+ALPHA_MONTH_RANGE_RE: Pattern = alpha_month_range_re(MONTHS)
+MONTH_FIRST_DATE_RE: Pattern = month_first_date_re(MONTHS)
+YEAR_FIRST_DATE_RE: Pattern = year_first_date_re(MONTHS)
 YEAR_TOKEN_RE: Pattern = re_compile(_YEAR_RE_EXP, parenthify=True)
 YEAR_END_RE: Pattern = re_compile(_YEAR_RE_EXP + r"\/|$")
 
@@ -187,10 +231,18 @@ ISSUE_BEGIN_RE: Pattern = re_compile(r"((^|\/)\(?" + _ISSUE_RE_EXP + r"\)?[\/|\s
 
 # Volume
 _VOLUME_COUNT_RE_EXP = r"\(of\s*(?P<volume_count>\d+)\)"
-VOLUME_RE: Pattern = re_compile(
-    r"(" + r"(?:v(?:ol(?:ume)?)?\.?)\s*(?P<volume>\d+)"  # noqa: ISC003
-    r"(\W*" + _VOLUME_COUNT_RE_EXP + r")?" + r")"
-)
+VOLUME_PREFIXES: tuple[str, ...] = (r"v(?:ol(?:ume)?)?\.?",)
+
+
+def volume_re(prefixes: tuple[str, ...]) -> Pattern:
+    """Compile the volume regex for volume keyword prefixes."""
+    return re_compile(
+        r"(" + r"(?:" + r"|".join(prefixes) + r")\s*(?P<volume>\d+)"
+        r"(\W*" + _VOLUME_COUNT_RE_EXP + r")?" + r")"
+    )
+
+
+VOLUME_RE: Pattern = volume_re(VOLUME_PREFIXES)
 VOLUME_WITH_COUNT_RE: Pattern = re_compile(
     r"(\(?" + r"(?P<volume>\d+)" + r"\)?" + r"\W*" + _VOLUME_COUNT_RE_EXP + r")"
 )
@@ -217,3 +269,22 @@ REMAINING_GROUP_RE: Pattern = re_compile(r"^[^\(].*[^\)]")
 NON_NUMBER_DOT_RE: Pattern = re_compile(r"(\D)\.(\D)")
 
 REMAINDER_PAREN_GROUPS_RE: Pattern = re_compile(r"(?P<remainders>\(.*\))")
+
+# CANDIDATES
+# One scan for the cheap triggers each searching stage needs to match.
+#     Stages only delete text, so a trigger missing after cleaning stays
+#     missing. Triggers are zero width so they may overlap and each starts
+#     with different characters so none hides another.
+_CANDIDATE_PUBLISHERS = r"|".join(
+    re.sub(r"\(\?<![^)]*\)", "", publisher)
+    for publisher in PUBLISHERS_UNAMBIGUOUS + PUBLISHERS_AMBIGUOUS
+)
+CANDIDATES_RE: Pattern = re_compile(
+    r"(?="
+    r"(?P<number>[\d½])"
+    r"|(?P<dash>-)"
+    r"|(?P<paren>\()"
+    r"|(?P<c2c>c2c)"
+    r"|(?P<publisher>" + _CANDIDATE_PUBLISHERS + r")"
+    r")"
+)
@@ -0,0 +1,172 @@
+"""Rule packs of site specific patterns run inside the parser."""
+
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, NamedTuple
+
+from comicfn2dict.regex import re_compile
+
+if TYPE_CHECKING:
+    from collections.abc import Container, Iterable
+    from re import Pattern
+
+# Rules run just before the parser stage they name, in this order.
+RULE_STAGES: tuple[str, ...] = (
+    "issue",
+    "volume",
+    "dates",
+    "format",
+    "remainders",
+    "ends",
+    "publisher",
+    "series",
+)
+_RULE_PACK_VERSION = 1
+_REQUIRED_RULE_KEYS = frozenset({"field", "pattern"})
+_RULE_KEYS = _REQUIRED_RULE_KEYS | {"stage", "pop", "priority"}
+_FIELD_RE = re.compile(r"[a-z][a-z0-9_]*")
+_RESERVED_FIELDS = frozenset({"ext", "remainders"})
+# Rules are combined into one pattern, so their groups must not refer to
+#     each other by name or number.
+_GROUP_REFERENCE_RE = re.compile(r"\(\?P[<=]|\\[1-9]|\(\?\(")
+# Flags for the whole pattern can't apply to one alternative of the combined
+#     pattern. Scoped flags like (?i:...) can.
+_GLOBAL_FLAGS_RE = re.compile(r"(?<!\\)\(\?[aiLmsux]+\)")
+
+
+class Rule(NamedTuple):
+    """Read one field with a pattern just before a parser stage."""
+
+    field: str
+    pattern: str
+    stage: str = RULE_STAGES[0]
+    pop: bool = True
+    priority: int = 0
+
+
+class _RuleGroup(NamedTuple):
+    """A compiled rule and the groups it reads in a combined pattern."""
+
+    field: str
+    value_group: int
+    pop: bool
+    rank: int
+
+
+class StageRules(NamedTuple):
+    """The rules of one stage combined into one pattern."""
+
+    regex: Pattern
+    groups: MappingProxyType[int, _RuleGroup]
+
+
+def _invalid(rule: Rule, reason: str) -> ValueError:
+    """Make the error for an invalid rule."""
+    return ValueError(f"Invalid rule {rule.field}: {rule.pattern!r}: {reason}")
+
+
+def _check_rule(rule: Rule) -> int:
+    """Validate one rule, returning its number of groups."""
+    if not _FIELD_RE.fullmatch(rule.field) or rule.field in _RESERVED_FIELDS:
+        raise _invalid(
+            rule, "field must be a lowercase key other than ext & remainders"
+        )
+    if rule.stage not in RULE_STAGES:
+        raise _invalid(rule, f"stage must be one of {', '.join(RULE_STAGES)}")
+    if not isinstance(rule.pop, bool) or not isinstance(rule.priority, int):
+        raise _invalid(rule, "pop must be a boolean and priority an integer")
+    if _GROUP_REFERENCE_RE.search(rule.pattern):
+        raise _invalid(rule, "named groups and backreferences are not allowed")
+    if _GLOBAL_FLAGS_RE.search(rule.pattern):
+        raise _invalid(rule, "global flags are not allowed, use (?flags:...)")
+    try:
+        regex = re_compile(rule.pattern)
+    except re.error as exc:
+        raise _invalid(rule, str(exc)) from exc
+    if regex.fullmatch(""):
+        raise _invalid(rule, "pattern matches empty text")
+    return regex.groups
+
+
+def _compile_stage(rules: list[tuple[int, Rule, int]]) -> StageRules:
+    """Combine the rules of one stage into one alternation."""
+    # Empty marker groups end each rule so alternatives still start with the
+    #     rule's own literals, which sre uses to skip ahead between matches.
+    exp = r"|".join(f"(?:{rule.pattern})(?P<r{index}>)" for index, rule, _ in rules)
+    try:
+        regex = re_compile(exp)
+    except re.error as exc:
+        # Rules that compile alone but not together.
+        reason = f"Rules for stage {rules[0][1].stage} don't combine: {exc}"
+        raise ValueError(reason) from exc
+    groups = {}
+    for rank, (index, rule, inner_groups) in enumerate(rules):
+        marker = regex.groupindex[f"r{index}"]
+        # The value is the rule's first group if it has any.
+        value_group = marker - inner_groups if inner_groups else 0
+        groups[marker] = _RuleGroup(rule.field, value_group, rule.pop, rank)
+    return StageRules(regex, MappingProxyType(groups))
+
+
+def compile_rules(
+    rules: Iterable[Rule],
+) -> MappingProxyType[str, StageRules]:
+    """Validate rules and combine each stage's rules into one pattern."""
+    stages: dict[str, list[tuple[int, Rule, int]]] = {}
+    for index, rule in enumerate(rules):
+        inner_groups = _check_rule(rule)
+        stages.setdefault(rule.stage, []).append((index, rule, inner_groups))
+    # Higher priority rules come first in each alternation.
+    return MappingProxyType(
+        {
+            stage: _compile_stage(
+                sorted(stages[stage], key=lambda item: -item[1].priority)
+            )
+            for stage in RULE_STAGES
+            if stage in stages
+        }
+    )
+
+
+def match_rules(
+    stage_rules: StageRules, text: str, exclude: Container[str]
+) -> tuple[dict[str, str], list[tuple[int, int]]]:
+    """Read fields from one scan of text, returning values & spans to pop."""
+    # Where matches overlap the leftmost wins. Of the rules that match a field
+    #     the highest priority wins, then the leftmost.
+    chosen: dict[str, tuple[int, str, tuple[int, int] | None]] = {}
+    for match in stage_rules.regex.finditer(text):
+        rule = stage_rules.groups[match.lastindex or 0]
+        if rule.field in exclude:
+            continue
+        if (current := chosen.get(rule.field)) and current[0] <= rule.rank:
+            continue
+        value = match.group(rule.value_group)
+        if value and (value := value.strip()):
+            chosen[rule.field] = (rule.rank, value, match.span() if rule.pop else None)
+    values = {field: value for field, (_, value, _) in chosen.items()}
+    spans = sorted(span for _, _, span in chosen.values() if span)
+    return values, spans
+
+
+def load_rules(path: str | Path) -> tuple[Rule, ...]:
+    """Load the rules of a JSON rule pack."""
+    data = json.loads(Path(path).read_text())
+    if not isinstance(data, dict) or data.get("version") != _RULE_PACK_VERSION:
+        reason = f"{path} is not a version {_RULE_PACK_VERSION} rule pack"
+        raise ValueError(reason)
+    rules = []
+    for item in data.get("rules", ()):
+        if not (
+            isinstance(item, dict) and _REQUIRED_RULE_KEYS <= item.keys() <= _RULE_KEYS
+        ):
+            reason = (
+                f"{path} rules need field & pattern and may have stage, pop & priority"
+            )
+            raise ValueError(reason)
+        rules.append(Rule(**item))
+    return tuple(rules)
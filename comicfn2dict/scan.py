@@ -0,0 +1,184 @@
+"""Scan a comic library directory into JSON lines."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from heapq import heappop, heappush
+from logging import getLogger
+from os import scandir
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING, TextIO
+
+from comicfn2dict.batch import batch
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable, Iterator
+    from concurrent.futures import Future
+
+    from comicfn2dict.checkpoint import Checkpointer
+    from comicfn2dict.engine import ComicFilenameEngine
+
+_LOG = getLogger(__name__)
+COMIC_SUFFIXES = frozenset({".cb7", ".cbr", ".cbt", ".cbz", ".pdf"})
+_MAX_PENDING_DIRS = 64
+
+
+def _list_dir(path: str, suffixes: frozenset[str]) -> list[tuple[str, bool]]:
+    """List the subdirectories and comics of one directory in name order."""
+    with scandir(path) as entries:
+        listing = [
+            (entry.name, is_dir)
+            for entry in entries
+            if (is_dir := entry.is_dir(follow_symlinks=False))
+            or Path(entry.name).suffix.lower() in suffixes
+        ]
+    listing.sort()
+    return listing
+
+
+def _list_subdir(path: str, suffixes: frozenset[str]) -> list[tuple[str, bool]]:
+    """List a directory below the root, or nothing if it can't be read."""
+    # Like os.walk(onerror=...), one unreadable directory doesn't end the
+    #     scan. Errors listing the root still raise.
+    try:
+        return _list_dir(path, suffixes)
+    except OSError as exc:
+        _LOG.warning("Skipping directory: %s", exc)
+        return []
+
+
+def _iter_dir(root: str, prefix: str, suffixes: frozenset[str]) -> Iterator[str]:
+    """Walk one directory depth first in name order."""
+    list_dir = _list_subdir if prefix else _list_dir
+    for name, is_dir in list_dir(root + prefix, suffixes):
+        if is_dir:
+            yield from _iter_dir(root, prefix + name + "/", suffixes)
+        else:
+            yield prefix + name
+
+
+class _DirectoryPrefetcher:
+    """List directories ahead of a depth first walk on a pool of threads."""
+
+    # Each scandir() on a network filesystem waits on round trips, which
+    #     release the GIL. Listings queue the subdirectories they find so the
+    #     pool works down the tree without waiting for the walk. Path parts
+    #     order the queue the way the walk enters directories. At most
+    #     max_pending listings are in flight or waiting to be walked.
+
+    def _top_up(self) -> None:
+        """Submit queued directories until max_pending are in flight."""
+        while (
+            self._queue and len(self._futures) < self._max_pending and not self._closed
+        ):
+            parts = heappop(self._queue)
+            self._futures[parts] = self._executor.submit(self._list, parts)
+
+    def _list(self, parts: tuple[str, ...]) -> list[tuple[str, bool]]:
+        """List one directory and queue its subdirectories."""
+        prefix = "".join(part + "/" for part in parts)
+        list_dir = _list_subdir if parts else _list_dir
+        listing = list_dir(self._root + prefix, self._suffixes)
+        with self._lock:
+            for name, is_dir in listing:
+                if is_dir:
+                    heappush(self._queue, (*parts, name))
+            self._top_up()
+        return listing
+
+    def enter(self, parts: tuple[str, ...]) -> list[tuple[str, bool]]:
+        """Get the listing of the next directory in depth first order."""
+        with self._lock:
+            future = self._futures.pop(parts, None)
+            if future is None:
+                # Not yet submitted, so it is first in the queue.
+                heappop(self._queue)
+            self._top_up()
+        return self._list(parts) if future is None else future.result()
+
+    def close(self) -> None:
+        """Stop submitting and cancel listings that haven't started."""
+        with self._lock:
+            self._closed = True
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def __init__(
+        self,
+        root: str,
+        suffixes: frozenset[str],
+        workers: int,
+        max_pending: int,
+    ):
+        """Initialize with only the root queued."""
+        self._root = root
+        self._suffixes = suffixes
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        self._max_pending = max(max_pending, 1)
+        self._lock = Lock()
+        self._closed = False
+        self._queue: list[tuple[str, ...]] = [()]
+        self._futures: dict[tuple[str, ...], Future[list[tuple[str, bool]]]] = {}
+
+
+def _iter_dirs_concurrent(
+    root: str, suffixes: frozenset[str], workers: int, max_pending: int
+) -> Generator[str, None, None]:
+    """Walk depth first in name order, listing directories on a thread pool."""
+    prefetcher = _DirectoryPrefetcher(root, suffixes, workers, max_pending)
+    try:
+        stack: list[tuple[tuple[str, ...], str, Iterator[tuple[str, bool]]]] = [
+            ((), "", iter(prefetcher.enter(())))
+        ]
+        while stack:
+            parts, prefix, entries = stack[-1]
+            for name, is_dir in entries:
+                if is_dir:
+                    child = (*parts, name)
+                    listing = prefetcher.enter(child)
+                    stack.append((child, prefix + name + "/", iter(listing)))
+                    break
+                yield prefix + name
+            else:
+                stack.pop()
+    finally:
+        prefetcher.close()
+
+
+def iter_library(
+    root: str | Path,
+    suffixes: Iterable[str] = COMIC_SUFFIXES,
+    workers: int = 1,
+    max_pending: int = _MAX_PENDING_DIRS,
+) -> Generator[str, None, None]:
+    """Yield the relative posix paths of comics under root in path order."""
+    # Closing a walk left early stops its prefetching threads.
+    root = str(root).rstrip("/") + "/"
+    suffix_set = frozenset(suffix.lower() for suffix in suffixes)
+    if workers > 1:
+        yield from _iter_dirs_concurrent(root, suffix_set, workers, max_pending)
+    else:
+        yield from _iter_dir(root, "", suffix_set)
+
+
+def scan(  # noqa: PLR0913
+    root: str | Path,
+    output: TextIO,
+    chunk_size: int = 1024,
+    shard: tuple[int, int] | None = None,
+    engine: ComicFilenameEngine | None = None,
+    *,
+    workers: int = 1,
+    max_pending: int = _MAX_PENDING_DIRS,
+    checkpointer: Checkpointer | None = None,
+) -> int:
+    """Parse the comics under root into JSON lines, returning the count."""
+    paths = iter_library(root, workers=workers, max_pending=max_pending)
+    return batch(
+        paths,
+        output,
+        chunk_size=chunk_size,
+        shard=shard,
+        engine=engine,
+        checkpointer=checkpointer,
+    )
@@ -0,0 +1,203 @@
+"""Serve warm comicfn2dict parsers over a unix socket or localhost http."""
+
+from __future__ import annotations
+
+import json
+import socket
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import suppress
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from socketserver import StreamRequestHandler, ThreadingUnixStreamServer
+from stat import S_ISSOCK
+from threading import Thread
+from typing import TYPE_CHECKING, Any
+
+from comicfn2dict.parse import comicfn2dict
+from comicfn2dict.util import JSON_SEPARATORS
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+_LOCALHOST = "127.0.0.1"
+_POOL_CHUNKSIZE = 256
+
+
+class ComicFilenameService:
+    """Answer JSON parse requests with a warm parser."""
+
+    # A request is a JSON object with a "names" list and an optional "id" that
+    #     is echoed back. A bare JSON string or list of strings also works.
+    # A response is a JSON object with the "id" and a "results" list in
+    #     request order, or an "error" message.
+
+    def _parse_names(self, names: Sequence[str]) -> list[dict]:
+        """Parse names inline or on the worker pool."""
+        if self._pool and len(names) > _POOL_CHUNKSIZE:
+            return list(self._pool.map(comicfn2dict, names, chunksize=_POOL_CHUNKSIZE))
+        return [comicfn2dict(name) for name in names]
+
+    def respond(self, data: bytes | str) -> dict[str, Any]:
+        """Parse one request into a response dict."""
+        request_id = None
+        try:
+            request = json.loads(data)
+            if isinstance(request, dict):
+                request_id = request.get("id")
+                names = request.get("names", ())
+            else:
+                names = request
+            if isinstance(names, str):
+                names = (names,)
+            if not isinstance(names, (list, tuple)) or not all(
+                isinstance(name, str) for name in names
+            ):
+                reason = "names must be a string or a list of strings"
+                raise TypeError(reason)  # noqa: TRY301
+            results = self._parse_names(names)
+        except Exception as exc:
+            return {"id": request_id, "error": str(exc)}
+        return {"id": request_id, "results": results}
+
+    def respond_bytes(self, data: bytes | str) -> bytes:
+        """Parse one request into a newline terminated JSON response."""
+        response = self.respond(data)
+        return json.dumps(response, separators=JSON_SEPARATORS).encode() + b"\n"
+
+    def close(self) -> None:
+        """Shut down the worker pool."""
+        if self._pool:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __init__(self, workers: int = 0):
+        """Initialize."""
+        self._pool: ProcessPoolExecutor | None = (
+            ProcessPoolExecutor(max_workers=workers) if workers > 0 else None
+        )
+
+
+class _SocketRequestHandler(StreamRequestHandler):
+    """Answer newline delimited JSON requests in order."""
+
+    # Clients may pipeline any number of requests before reading responses.
+
+    def handle(self) -> None:
+        """Handle each request line on the connection."""
+        service: ComicFilenameService = self.server.service  # type: ignore[reportAttributeAccessIssue]
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            self.wfile.write(service.respond_bytes(line))
+
+
+class _HTTPRequestHandler(BaseHTTPRequestHandler):
+    """Answer one JSON request per POST."""
+
+    def do_POST(self) -> None:
+        """Handle a POSTed request body."""
+        service: ComicFilenameService = self.server.service  # type: ignore[reportAttributeAccessIssue]
+        length = int(self.headers.get("Content-Length", 0))
+        body = service.respond_bytes(self.rfile.read(length))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:  # noqa: A002
+        """Log only when verbose."""
+        if self.server.verbose:  # type: ignore[reportAttributeAccessIssue]
+            super().log_message(format, *args)
+
+
+def _remove_stale_socket(path: str) -> None:
+    """Remove a socket nothing listens on, refusing to remove anything else."""
+    try:
+        mode = Path(path).lstat().st_mode
+    except FileNotFoundError:
+        return
+    if not S_ISSOCK(mode):
+        reason = f"{path} exists and is not a socket."
+        raise ValueError(reason)
+    # Only a refused connection means the socket's server is gone.
+    with socket.socket(socket.AF_UNIX) as probe:
+        try:
+            probe.connect(path)
+        except ConnectionRefusedError:
+            pass
+        else:
+            reason = f"{path} is in use by a running server."
+            raise ValueError(reason)
+    Path(path).unlink()
+
+
+class _UnixServer(ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def server_close(self) -> None:
+        super().server_close()
+        if self._bound_path is not None:
+            with suppress(FileNotFoundError):
+                Path(self._bound_path).unlink()
+
+    def __init__(self, path: str, service: ComicFilenameService, verbose: int):
+        _remove_stale_socket(path)
+        # Only a socket this server bound is removed when it closes.
+        self._bound_path: str | None = None
+        super().__init__(path, _SocketRequestHandler)
+        self._bound_path = path
+        self.service = service
+        self.verbose = verbose
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, port: int, service: ComicFilenameService, verbose: int):
+        super().__init__((_LOCALHOST, port), _HTTPRequestHandler)
+        self.service = service
+        self.verbose = verbose
+
+
+def _start(servers: list[_UnixServer | _HTTPServer], verbose: int) -> list[Thread]:
+    """Run each server in its own thread."""
+    threads = []
+    for server in servers:
+        thread = Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        threads.append(thread)
+        if verbose:
+            print(f"Serving on {server.server_address}")  # noqa: T201
+    return threads
+
+
+def serve(
+    socket_path: str | Path | None = None,
+    http_port: int | None = None,
+    workers: int = 0,
+    verbose: int = 0,
+) -> None:
+    """Serve parse requests until interrupted."""
+    if socket_path is None and http_port is None:
+        reason = "serve needs a socket path, an http port or both."
+        raise ValueError(reason)
+    service = ComicFilenameService(workers=workers)
+    servers: list[_UnixServer | _HTTPServer] = []
+    threads: list[Thread] = []
+    try:
+        if socket_path is not None:
+            servers.append(_UnixServer(str(socket_path), service, verbose))
+        if http_port is not None:
+            servers.append(_HTTPServer(http_port, service, verbose))
+        threads = _start(servers, verbose)
+        for thread in threads:
+            thread.join()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for server in servers[: len(threads)]:
+            server.shutdown()
+        for server in servers:
+            server.server_close()
+        service.close()
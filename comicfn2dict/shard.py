@@ -0,0 +1,77 @@
+"""Split libraries across machines by path hash and merge their results."""
+
+from __future__ import annotations
+
+import json
+from heapq import merge
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING, TextIO
+from zlib import crc32
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+_ENCODING = "utf-8"
+_ERRORS = "surrogateescape"
+
+
+def shard_of(path: str | bytes | memoryview, count: int) -> int:
+    """Stable shard index of a relative path."""
+    # crc32 is the same on every machine and python, unlike hash().
+    if isinstance(path, str):
+        path = path.encode(_ENCODING, _ERRORS)
+    return crc32(path) % count
+
+
+def iter_shard(paths: Iterable[str], shard: tuple[int, int] | None) -> Iterator[str]:
+    """Keep only the paths that belong to shard i of N."""
+    if not shard:
+        yield from paths
+        return
+    index, count = shard
+    for path in paths:
+        if shard_of(path, count) == index:
+            yield path
+
+
+def iter_numbered_shard(
+    paths: Iterable[str], shard: tuple[int, int] | None
+) -> Iterator[tuple[int, str]]:
+    """Pair paths with their input line number, keeping only shard i of N."""
+    # Every shard numbers the whole input, so merges restore input order.
+    for number, path in enumerate(paths):
+        if not shard or shard_of(path, shard[1]) == shard[0]:
+            yield number, path
+
+
+def record_sort_key(record: dict) -> tuple[int, tuple[str, ...]]:
+    """Order records by input offset, then by path components."""
+    # Listing records carry their line's byte offset and stdin records their
+    #     line number. Directory scans are depth first in name order, which is
+    #     the same as ordering their paths by components.
+    return record.get("offset", -1), PurePosixPath(record["path"]).parts
+
+
+def _iter_shard_records(path: str | Path) -> Iterator[tuple[tuple, str]]:
+    """Sort keys & lines from one shard output, which must already be in order."""
+    last_key = None
+    with Path(path).open("r", encoding=_ENCODING, errors=_ERRORS) as shard_file:
+        for line in shard_file:
+            if not line.strip():
+                continue
+            key = record_sort_key(json.loads(line))
+            if last_key is not None and key < last_key:
+                reason = f"{path} is out of order at {line.strip()!r}"
+                raise ValueError(reason)
+            last_key = key
+            yield key, line if line.endswith("\n") else line + "\n"
+
+
+def merge_shards(paths: Iterable[str | Path], output: TextIO) -> int:
+    """Merge ordered shard outputs into one ordered JSON lines output."""
+    count = 0
+    shards = (_iter_shard_records(path) for path in paths)
+    for _, line in merge(*shards, key=lambda item: item[0]):
+        output.write(line)
+        count += 1
+    return count
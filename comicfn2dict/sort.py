@@ -0,0 +1,44 @@
+"""Natural sort keys for parsed values."""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+
+# Letter prefixes, signs, whole numbers, halves, decimals, then any suffix
+#     like AU or .BEY.
+_ISSUE_NUMBER_RE = re.compile(
+    r"([^\W\d_½]*)(-)?(\d*)(½)?(?:\.(\d+))?(.*)", flags=re.DOTALL
+)
+_NUMERIC = 0
+_NON_NUMERIC = 1
+_HALF = 0.5
+_CACHE_SIZE = 65536
+
+IssueSortKey = tuple[str, int, float, str]
+# The parse result key engines add sort keys under.
+ISSUE_SORT_KEY = "issue_sort_key"
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def issue_sort_key(issue: str) -> IssueSortKey:
+    """Make a comparable key that orders issue numbers naturally."""
+    # Leading zeros are dropped like issue_formatter() does, so padded and
+    #     unpadded issues get the same key. Plain numbers sort before letter
+    #     prefixed ones and issues without numbers sort after their prefix.
+    text = issue.strip().lstrip("#")
+    stripped = text.lstrip("0")
+    match = _ISSUE_NUMBER_RE.fullmatch(stripped)
+    if not match:
+        return "", _NON_NUMERIC, 0.0, text.casefold()
+    prefix, sign, whole, half, fraction, suffix = match.groups()
+    if not (prefix or whole) and len(stripped) < len(text):
+        whole = "0"
+    if not (whole or half or fraction):
+        return prefix.casefold(), _NON_NUMERIC, 0.0, stripped.casefold()
+    number = float(f"{whole or 0}.{fraction or 0}")
+    if half:
+        number += _HALF
+    if sign:
+        number = -number
+    return prefix.casefold(), _NUMERIC, number, suffix.casefold()
@@ -0,0 +1,280 @@
+"""An immutable memory mapped store of parse results for fast lookups."""
+
+from __future__ import annotations
+
+import json
+import mmap
+import sys
+from array import array
+from hashlib import blake2b
+from pathlib import Path
+from struct import Struct
+from typing import TYPE_CHECKING
+
+from comicfn2dict.util import JSON_SEPARATORS
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+    from types import TracebackType
+
+_MAGIC = b"CFN2DRS1"
+_HEADER_SIZE = Struct("<I")
+_SLOT = Struct("<I")
+# String table offset and length of keys and values.
+_STRING_REF = Struct("<QI")
+# Slots are at most this full, so probe runs stay short.
+_MAX_LOAD = 0.7
+_HASH_SIZE = 8
+# The top two bits of a value's length say how to decode it.
+_KIND_SHIFT = 30
+_LENGTH_MASK = (1 << _KIND_SHIFT) - 1
+_STR, _STRS, _JSON = range(3)
+# Names can't hold NUL, so it joins the strings of tuple values.
+_SEPARATOR = "\0"
+# Results share most values, so keep decoded ones. Values are immutable.
+_CACHE_SIZE = 65536
+
+
+def _hash(key: bytes) -> int:
+    """Hash a key the same way on every machine and run."""
+    return int.from_bytes(blake2b(key, digest_size=_HASH_SIZE).digest(), "little")
+
+
+def _encode_value(value: object) -> tuple[int, str]:
+    """Encode a metadata value as a kind and a string."""
+    if isinstance(value, str):
+        return _STR, value
+    if (
+        isinstance(value, (tuple, list))
+        and value
+        and all(isinstance(v, str) for v in value)
+    ):
+        return _STRS, _SEPARATOR.join(value)
+    return _JSON, json.dumps(value, separators=JSON_SEPARATORS, ensure_ascii=False)
+
+
+def _tuples(value: object) -> object:
+    """Turn decoded JSON lists back into the tuples parse results use."""
+    if isinstance(value, list):
+        return tuple(_tuples(item) for item in value)
+    return value
+
+
+def _slot_count(count: int) -> int:
+    """Make a power of two number of slots under the maximum load."""
+    slots = 1
+    while slots * _MAX_LOAD <= count:
+        slots *= 2
+    return slots
+
+
+class _StringTable:
+    """Deduplicate strings into one UTF-8 blob."""
+
+    def add(self, text: str, kind: int = _STR) -> tuple[int, int]:
+        """Add a string, returning its offset and length with kind."""
+        ref = self._refs.get((kind, text))
+        if ref is None:
+            data = text.encode("utf-8", "surrogateescape")
+            if len(data) > _LENGTH_MASK:
+                reason = f"Value is too long to store: {text[:80]!r}..."
+                raise ValueError(reason)
+            ref = (self.size, len(data) | kind << _KIND_SHIFT)
+            self._refs[(kind, text)] = ref
+            self._chunks.append(data)
+            self.size += len(data)
+        return ref
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Iterate over the blob's chunks."""
+        return iter(self._chunks)
+
+    def __init__(self):
+        """Initialize empty."""
+        self._refs: dict[tuple[int, str], tuple[int, int]] = {}
+        self._chunks: list[bytes] = []
+        self.size = 0
+
+
+def write_store(records: Iterable[tuple[str, Mapping]], path: str | Path) -> int:
+    """Write path & metadata records to a store file, returning the count."""
+    # Later records replace earlier ones with the same path.
+    results = dict(records)
+    fields = sorted({field for metadata in results.values() for field in metadata})
+    field_ids = {field: index for index, field in enumerate(fields)}
+    strings = _StringTable()
+    # Value id 0 means a record has no value for a field.
+    value_refs: dict[tuple[int, int], int] = {}
+    value_table: list[tuple[int, int]] = []
+    slot_count = _slot_count(len(results))
+    slots = array("I", bytes(slot_count * _SLOT.size))
+    record = Struct(f"<QI{len(fields)}I")
+    records_blob = bytearray()
+    for record_id, (key, metadata) in enumerate(results.items()):
+        value_ids = [0] * len(fields)
+        for field, value in metadata.items():
+            kind, text = _encode_value(value)
+            ref = strings.add(text, kind)
+            if (value_id := value_refs.get(ref)) is None:
+                value_table.append(ref)
+                value_id = value_refs[ref] = len(value_table)
+            value_ids[field_ids[field]] = value_id
+        key_offset, key_length = strings.add(key)
+        records_blob += record.pack(key_offset, key_length, *value_ids)
+        slot = _hash(key.encode("utf-8", "surrogateescape")) & (slot_count - 1)
+        while slots[slot]:
+            slot = (slot + 1) & (slot_count - 1)
+        slots[slot] = record_id + 1
+    header = json.dumps(
+        {
+            "fields": fields,
+            "count": len(results),
+            "slots": slot_count,
+            "values": len(value_table),
+        },
+        ensure_ascii=False,
+        separators=JSON_SEPARATORS,
+    ).encode()
+    head = _MAGIC + _HEADER_SIZE.pack(len(header)) + header
+    with Path(path).open("wb") as store_file:
+        if sys.byteorder != "little":
+            slots.byteswap()
+        store_file.write(head)
+        store_file.write(slots.tobytes())
+        store_file.write(records_blob)
+        store_file.writelines(_STRING_REF.pack(*ref) for ref in value_table)
+        store_file.writelines(strings)
+    return len(results)
+
+
+class ResultStore:
+    """Look up parse results by path in a memory mapped store file."""
+
+    # Every process that opens a store shares the page cache's one copy of
+    #     it. Paths hash into a table of slots holding record ids. Records are
+    #     fixed width: a key reference and one value id per field. Values
+    #     refer into one table of deduplicated strings. Lookups read the map
+    #     in place and only decode the key & values of the record they find.
+
+    def _string(self, offset: int, length: int) -> str:
+        """Decode a string from the string table."""
+        start = self._strings + offset
+        return str(self._view[start : start + length], "utf-8", "surrogateescape")
+
+    def _decode(self, value_id: int) -> object:
+        """Decode a value by id."""
+        offset, length = _STRING_REF.unpack_from(
+            self._view, self._values + (value_id - 1) * _STRING_REF.size
+        )
+        text = self._string(offset, length & _LENGTH_MASK)
+        kind = length >> _KIND_SHIFT
+        if kind == _STR:
+            return text
+        if kind == _STRS:
+            return tuple(text.split(_SEPARATOR))
+        return _tuples(json.loads(text))
+
+    def _value(self, value_id: int) -> object:
+        """Get a value by id, decoding it if it isn't cached."""
+        value = self._cache.get(value_id)
+        if value is None:
+            if len(self._cache) >= _CACHE_SIZE:
+                self._cache.clear()
+            value = self._cache[value_id] = self._decode(value_id)
+        return value
+
+    def _find(self, key: str) -> int:
+        """Find the offset of a key's record, or -1."""
+        data = key.encode("utf-8", "surrogateescape")
+        mask = self._slot_count - 1
+        slot = _hash(data) & mask
+        while True:
+            (record_id,) = _SLOT.unpack_from(
+                self._view, self._slots + slot * _SLOT.size
+            )
+            if not record_id:
+                return -1
+            offset = self._records + (record_id - 1) * self._record.size
+            key_offset, key_length = _STRING_REF.unpack_from(self._view, offset)
+            if key_length == len(data):
+                start = self._strings + key_offset
+                if self._view[start : start + key_length] == data:
+                    return offset
+            slot = (slot + 1) & mask
+
+    def get(
+        self, path: str, default: dict | None = None
+    ) -> dict[str, str | tuple[str, ...]] | None:
+        """Get the parse result of a path."""
+        offset = self._find(path)
+        if offset < 0:
+            return default
+        value_ids = self._record.unpack_from(self._view, offset)
+        cache = self._cache
+        # The first two ids are the key reference.
+        return {
+            field: cache.get(value_id) or self._value(value_id)  # type: ignore[misc]
+            for field, value_id in zip(self._fields, value_ids[2:])  # noqa: B905
+            if value_id
+        }
+
+    def __getitem__(self, path: str) -> dict[str, str | tuple[str, ...]]:
+        """Get the parse result of a path or raise KeyError."""
+        metadata = self.get(path)
+        if metadata is None:
+            raise KeyError(path)
+        return metadata
+
+    def __contains__(self, path: object) -> bool:
+        """Check whether a path is stored."""
+        return isinstance(path, str) and self._find(path) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the stored paths in the order they were written."""
+        for record_id in range(len(self)):
+            offset = self._records + record_id * self._record.size
+            yield self._string(*_STRING_REF.unpack_from(self._view, offset))
+
+    def __len__(self) -> int:
+        """Count stored paths."""
+        return self._count
+
+    def close(self) -> None:
+        """Unmap the store."""
+        self._view.release()
+        self._mapped.close()
+
+    def __enter__(self) -> ResultStore:  # noqa: PYI034
+        """Enter context."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Exit context."""
+        self.close()
+
+    def __init__(self, path: str | Path):
+        """Map a store file written by write_store()."""
+        with Path(path).open("rb") as store_file:
+            self._mapped = mmap.mmap(store_file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mapped[: len(_MAGIC)] != _MAGIC:
+            self._mapped.close()
+            reason = f"{path} is not a result store"
+            raise ValueError(reason)
+        self._view = memoryview(self._mapped)
+        (header_size,) = _HEADER_SIZE.unpack_from(self._view, len(_MAGIC))
+        start = len(_MAGIC) + _HEADER_SIZE.size
+        header = json.loads(bytes(self._view[start : start + header_size]))
+        self._fields: tuple[str, ...] = tuple(header["fields"])
+        self._count: int = header["count"]
+        self._slot_count: int = header["slots"]
+        self._record = Struct(f"<QI{len(self._fields)}I")
+        self._slots = start + header_size
+        self._records = self._slots + self._slot_count * _SLOT.size
+        self._values = self._records + self._count * self._record.size
+        self._strings = self._values + header["values"] * _STRING_REF.size
+        self._cache: dict[int, object] = {}
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 from calendar import month_abbr
-from collections.abc import Callable, Mapping, Sequence
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from contextlib import suppress
+from functools import lru_cache
+from itertools import repeat
+from string import Formatter
 from types import MappingProxyType
 
 from comicfn2dict.log import print_log_header
@@ -38,6 +41,312 @@ _FILENAME_FORMAT_TAGS: tuple[tuple[str, str | Callable], ...] = (
 _EMPTY_VALUES: tuple[None, str] = (None, "")
 _DEFAULT_EXT = "cbz"
 _DATE_KEYS = ("year", "month", "day")
+_GROUP_START = "<"
+_GROUP_END = ">"
+# Format specs that name a formatter function instead of a format string.
+_FIELD_FORMATTERS: MappingProxyType[str, Callable[[str], str]] = MappingProxyType(
+    {"issue": issue_formatter}
+)
+
+
+def _format_date(values: Iterable) -> str:
+    """Construct date from a row of Y-m-D column values if they exist."""
+    parts: list[str] = []
+    for key, value in zip(_DATE_KEYS, values):  # noqa: B905
+        if part := value:
+            if key == "month" and not parts:
+                with suppress(TypeError):
+                    part = month_abbr[int(part)]
+
+            parts.append(part)
+        if key == "month" and not parts:
+            # noop if only day.
+            break
+    return "-".join(str(part) for part in parts)
+
+
+def _get_date(metadata: Mapping) -> str:
+    """Construct date from Y-m-D if there isn't a date."""
+    if (date := metadata.get("date")) is not None:
+        return date
+    parts: list[str] = []
+    for key in _DATE_KEYS:
+        if part := metadata.get(key):
+            if key == "month" and not parts:
+                with suppress(TypeError):
+                    part = month_abbr[int(part)]
+            parts.append(part)
+        if key == "month" and not parts:
+            # noop if only day.
+            break
+    return "-".join(str(part) for part in parts)
+
+
+def _join_remainders(remainders: object) -> str:
+    """Join the remainders specially."""
+    if remainders:
+        if isinstance(remainders, Sequence):
+            return " ".join(str(remainder) for remainder in remainders)
+        return str(remainders)
+    return ""
+
+
+def _get_remainders(metadata: Mapping) -> str:
+    """Join the remainders specially."""
+    return _join_remainders(metadata.get("remainders"))
+
+
+_FIELD_GETTERS: MappingProxyType[str, Callable[[Mapping], object]] = MappingProxyType(
+    {"date": _get_date, "remainders": _get_remainders}
+)
+
+
+def _get_column(columns: Mapping[str, Sequence], key: str, count: int) -> Iterable:
+    """Get a column, or no values if it's missing."""
+    column = columns.get(key)
+    return repeat(None, count) if column is None else column
+
+
+def _get_date_column(columns: Mapping[str, Sequence], count: int) -> Iterable:
+    """Construct dates from Y-m-D columns for rows without a date."""
+    date_columns = [_get_column(columns, key, count) for key in _DATE_KEYS]
+    if (dates := columns.get("date")) is None:
+        return map(_format_date, zip(*date_columns))  # noqa: B905
+    return [
+        _format_date(ymd) if date is None else date
+        for date, *ymd in zip(dates, *date_columns)  # noqa: B905
+    ]
+
+
+def _get_remainders_column(columns: Mapping[str, Sequence], count: int) -> Iterable:
+    """Join the remainders column specially."""
+    return map(_join_remainders, _get_column(columns, "remainders", count))
+
+
+_COLUMN_GETTERS: MappingProxyType[
+    str, Callable[[Mapping[str, Sequence], int], Iterable]
+] = MappingProxyType({"date": _get_date_column, "remainders": _get_remainders_column})
+
+
+def _count_rows(columns: Mapping[str, Sequence]) -> int:
+    """Count the rows of equal length columns."""
+    lengths = {len(column) for column in columns.values()}
+    if len(lengths) > 1:
+        reason = f"Columns must all be the same length, not {sorted(lengths)}"
+        raise ValueError(reason)
+    return lengths.pop() if lengths else 0
+
+
+def _format_tags_template(format_tags: tuple[tuple[str, str | Callable], ...]) -> str:
+    """Express format tags as a template."""
+    groups = []
+    for tag, fmt in format_tags:
+        field = (
+            "{" + tag + ":" + tag + "}"
+            if callable(fmt)
+            else fmt.replace("{", "{" + tag, 1)
+        )
+        groups.append(_GROUP_START + field + _GROUP_END)
+    return " ".join(groups) + _GROUP_START + "[{remainders}]" + _GROUP_END
+
+
+DEFAULT_FILENAME_TEMPLATE = _format_tags_template(_FILENAME_FORMAT_TAGS)
+
+
+class FilenameTemplate:
+    """A filename template compiled once for fast rendering."""
+
+    # Optional groups are wrapped in <>. A group renders only if all of its
+    #     {field} or {field:spec} values are not empty. Text between groups
+    #     separates groups that render. Text before the first and after the
+    #     last group always renders.
+
+    def _compile_group(self, text: str) -> tuple[str, tuple]:
+        """Compile a group into a format string and its fields."""
+        fmt = ""
+        fields: list[tuple] = []
+        for literal, key, spec, conversion in Formatter().parse(text):
+            fmt += literal.replace("{", "{{").replace("}", "}}")
+            if key is None:
+                continue
+            if not key or conversion:
+                reason = f"Template fields must be named without conversions: {text!r}"
+                raise ValueError(reason)
+            getter = _FIELD_GETTERS.get(key)
+            formatter = _FIELD_FORMATTERS.get(spec or "")
+            fmt += "{:" + spec + "}" if spec and not formatter else "{}"
+            fields.append((key, getter, formatter))
+        return fmt, tuple(fields)
+
+    def _compile(self, template: str) -> tuple[str, str, tuple]:
+        """Split the template into a prefix, groups and a suffix."""
+        prefix = ""
+        groups: list[tuple[str, str, tuple]] = []
+        pos = 0
+        separator = ""
+        while (start := template.find(_GROUP_START, pos)) >= 0:
+            end = template.find(_GROUP_END, start)
+            if end < 0:
+                reason = f"Unclosed {_GROUP_START} in template: {template!r}"
+                raise ValueError(reason)
+            literal = template[pos:start]
+            if "{" in literal:
+                reason = f"Template fields must be inside {_GROUP_START}{_GROUP_END} groups: {template!r}"
+                raise ValueError(reason)
+            if groups:
+                separator = literal
+            else:
+                prefix = literal
+            fmt, fields = self._compile_group(template[start + 1 : end])
+            groups.append((separator, fmt, fields))
+            pos = end + 1
+        suffix = template[pos:]
+        if "{" in suffix or _GROUP_END in suffix:
+            reason = f"Template fields must be inside {_GROUP_START}{_GROUP_END} groups: {template!r}"
+            raise ValueError(reason)
+        return prefix, suffix, tuple(groups)
+
+    def _render_groups(self, metadata: Mapping) -> str:
+        """Render the groups that have values."""
+        tokens = self._prefix
+        rendered = False
+        for separator, fmt, fields in self._groups:
+            values = []
+            for key, getter, formatter in fields:
+                value = getter(metadata) if getter else metadata.get(key)
+                if value in _EMPTY_VALUES:
+                    break
+                values.append(formatter(value).format(value) if formatter else value)
+            else:
+                if token := fmt.format(*values).strip():
+                    if rendered:
+                        tokens += separator
+                    tokens += token
+                    rendered = True
+        return tokens + self._suffix
+
+    def render(self, metadata: Mapping, ext: bool = True) -> str:  # noqa: FBT002
+        """Render a filename from a metadata mapping."""
+        fn = self._render_groups(metadata)
+        if ext:
+            # A None ext is missing, like a None in an ext column.
+            ext_value = metadata.get("ext")
+            fn += "." + str(_DEFAULT_EXT if ext_value is None else ext_value)
+        return fn
+
+    def render_many(
+        self,
+        metadatas: Iterable[Mapping],
+        ext: bool = True,  # noqa: FBT002
+    ) -> list[str]:
+        """Render filenames for many metadata mappings."""
+        render = self.render
+        return [render(metadata, ext) for metadata in metadatas]
+
+    def _render_field_column(
+        self, fmt: str, formatter: Callable | None, column: Iterable
+    ) -> list[str]:
+        """Render a group of one field for every row."""
+        fmt_format = fmt.format
+        if formatter:
+            return [
+                ""
+                if value in _EMPTY_VALUES
+                else fmt_format(formatter(value).format(value)).strip()
+                for value in column
+            ]
+        return [
+            "" if value in _EMPTY_VALUES else fmt_format(value).strip()
+            for value in column
+        ]
+
+    def _render_group_column(
+        self, fmt: str, fields: tuple, columns: Mapping[str, Sequence], count: int
+    ) -> Iterable[str]:
+        """Render one group for every row, empty where it has no values."""
+        if not fields:
+            return repeat(fmt.format().strip(), count)
+        field_columns = []
+        for key, _getter, _formatter in fields:
+            if column_getter := _COLUMN_GETTERS.get(key):
+                field_columns.append(column_getter(columns, count))
+            elif (column := columns.get(key)) is not None:
+                field_columns.append(column)
+            else:
+                return repeat("", count)
+        if len(fields) == 1:
+            return self._render_field_column(fmt, fields[0][2], field_columns[0])
+        formatters = [formatter for _key, _getter, formatter in fields]
+        tokens = []
+        for values in zip(*field_columns):  # noqa: B905
+            if any(value in _EMPTY_VALUES for value in values):
+                tokens.append("")
+                continue
+            formatted = [
+                formatter(value).format(value) if formatter else value
+                for formatter, value in zip(formatters, values)  # noqa: B905
+            ]
+            tokens.append(fmt.format(*formatted).strip())
+        return tokens
+
+    def _join_tokens(self, rows: Iterable[tuple[str, ...]]) -> Iterable[str]:
+        """Join the tokens that rendered in each row with their separators."""
+        separators = {separator for separator, _fmt, _fields in self._groups}
+        prefix, suffix = self._prefix, self._suffix
+        if len(separators) == 1:
+            join = separators.pop().join
+            return (prefix + join(filter(None, tokens)) + suffix for tokens in rows)
+        return (self._join_row_tokens(tokens) for tokens in rows)
+
+    def _join_row_tokens(self, tokens: tuple[str, ...]) -> str:
+        """Join one row's tokens with each group's own separator."""
+        fn = self._prefix
+        rendered = False
+        for (separator, _fmt, _fields), token in zip(self._groups, tokens):  # noqa: B905
+            if token:
+                if rendered:
+                    fn += separator
+                fn += token
+                rendered = True
+        return fn + self._suffix
+
+    def render_columns(
+        self,
+        columns: Mapping[str, Sequence],
+        ext: bool = True,  # noqa: FBT002
+    ) -> list[str]:
+        """Render filenames for rows of metadata held in columns by key."""
+        # Each group renders down its columns in one pass, then rows join the
+        #     tokens that rendered, so no row ever needs a mapping of its own.
+        #     Rows with a date use it instead of year, month & day.
+        count = _count_rows(columns)
+        group_columns = [
+            self._render_group_column(fmt, fields, columns, count)
+            for _separator, fmt, fields in self._groups
+        ]
+        rows = zip(*group_columns) if group_columns else repeat((), count)  # noqa: B905
+        filenames = self._join_tokens(rows)
+        if not ext:
+            return list(filenames)
+        exts = _get_column(columns, "ext", count)
+        return [
+            fn + "." + str(_DEFAULT_EXT if ext_value is None else ext_value)
+            for fn, ext_value in zip(filenames, exts)  # noqa: B905
+        ]
+
+    def __init__(self, template: str = DEFAULT_FILENAME_TEMPLATE):
+        """Compile the template."""
+        self.template: str = template
+        prefix, suffix, groups = self._compile(template)
+        self._prefix: str = prefix
+        self._suffix: str = suffix
+        self._groups: tuple[tuple[str, str, tuple], ...] = groups
+
+
+@lru_cache(maxsize=64)
+def compile_template(template: str = DEFAULT_FILENAME_TEMPLATE) -> FilenameTemplate:
+    """Compile and cache a filename template."""
+    return FilenameTemplate(template)
 
 
 class ComicFilenameSerializer:
@@ -50,75 +359,48 @@ class ComicFilenameSerializer:
         print_log_header(label)
         print(fn)  # noqa: T201
 
-    def _add_date(self) -> None:
-        """Construct date from Y-m-D if they exist."""
-        if "date" in self.metadata:
-            return
-        parts = []
-        for key in _DATE_KEYS:
-            if part := self.metadata.get(key):
-                if key == "month" and not parts:
-                    with suppress(TypeError):
-                        part = month_abbr[int(part)]
-
-                parts.append(part)
-            if key == "month" and not parts:
-                # noop if only day.
-                break
-        if parts:
-            parts = (str(part) for part in parts)
-            date = "-".join(parts)
-            self._log("After date", date)
-            self.metadata = MappingProxyType({**self.metadata, "date": date})
-
-    def _tokenize_tag(self, tag: str, fmt: str | Callable) -> str:
-        """Add tags to the string."""
-        val = self.metadata.get(tag)
-        if val in _EMPTY_VALUES:
-            return ""
-        final_fmt = fmt(val) if isinstance(fmt, Callable) else fmt
-        return final_fmt.format(val).strip()
-
-    def _add_remainder(self) -> str:
-        """Add the remainders specially."""
-        if remainders := self.metadata.get("remainders"):
-            if isinstance(remainders, Sequence):
-                remainders = (str(remainder) for remainder in remainders)
-                remainder = " ".join(remainders)
-            else:
-                remainder = str(remainders)
-            return f"[{remainder}]"
-        return ""
-
     def serialize(self) -> str:
         """Get our preferred basename from a metadata dict."""
-        self._add_date()
-
-        tokens = []
-        for tag, fmt in _FILENAME_FORMAT_TAGS:
-            if token := self._tokenize_tag(tag, fmt):
-                tokens.append(token)
-            self._log(f"After {tag}", str(tokens))
-        fn = " ".join(tokens)
-
-        fn += self._add_remainder()
-        self._log("After remainder", fn)
-
-        if self._ext:
-            ext = self.metadata.get("ext", _DEFAULT_EXT)
-            fn += f".{ext}"
-            self._log("After ext", fn)
-
+        self._log("Template", self._template.template)
+        fn = self._template.render(self.metadata, ext=self._ext)
+        self._log("After template", fn)
         return fn
 
-    def __init__(self, metadata: Mapping, ext: bool = True, verbose: int = 0):  # noqa: FBT002
+    def __init__(
+        self,
+        metadata: Mapping,
+        ext: bool = True,  # noqa: FBT002
+        verbose: int = 0,
+        template: FilenameTemplate | str | None = None,
+    ):
         """Initialize."""
         self.metadata: Mapping = metadata
         self._ext: bool = ext
         self._debug: bool = bool(verbose)
+        if template is None or isinstance(template, str):
+            template = compile_template(template or DEFAULT_FILENAME_TEMPLATE)
+        self._template: FilenameTemplate = template
 
 
-def dict2comicfn(md: Mapping, ext: bool = True, verbose: int = 0) -> str:  # noqa: FBT002
+def dict2comicfn(
+    md: Mapping,
+    ext: bool = True,  # noqa: FBT002
+    verbose: int = 0,
+    template: FilenameTemplate | str | None = None,
+) -> str:
     """Simplify API."""
-    serializer = ComicFilenameSerializer(md, ext=ext, verbose=verbose)
+    serializer = ComicFilenameSerializer(
+        md, ext=ext, verbose=verbose, template=template
+    )
     return serializer.serialize()
+
+
+def columns2comicfn(
+    columns: Mapping[str, Sequence],
+    ext: bool = True,  # noqa: FBT002
+    template: FilenameTemplate | str | None = None,
+) -> list[str]:
+    """Render filenames for rows of metadata held in columns by key."""
+    if template is None or isinstance(template, str):
+        template = compile_template(template or DEFAULT_FILENAME_TEMPLATE)
+    return template.render_columns(columns, ext=ext)
@@ -0,0 +1,20 @@
+"""Helpers shared by the batch, validation & serving modules."""
+
+from __future__ import annotations
+
+from itertools import islice
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+_T = TypeVar("_T")
+# Compact JSON for records, responses & stored values.
+JSON_SEPARATORS = (",", ":")
+
+
+def iter_chunks(items: Iterable[_T], size: int) -> Iterator[tuple[_T, ...]]:
+    """Split items into tuples of size, the last one shorter."""
+    iterator = iter(items)
+    while chunk := tuple(islice(iterator, size)):
+        yield chunk
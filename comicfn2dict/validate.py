@@ -0,0 +1,160 @@
+"""Validate that parsing and serializing names is stable."""
+
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from os import cpu_count
+from time import perf_counter
+from typing import TYPE_CHECKING, NamedTuple
+
+from comicfn2dict.parse import comicfn2dict_batch
+from comicfn2dict.unparse import FilenameTemplate, issue_formatter
+from comicfn2dict.util import iter_chunks
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Mapping
+
+_FILENAME_FIELD = "filename"
+# dict2comicfn() adds a default ext, so only check it if the name had one.
+_OPTIONAL_FIELDS = frozenset({"ext"})
+_NORMALIZERS: dict[str, Callable[[str], str]] = {
+    "issue": lambda issue: issue_formatter(issue).format(issue),
+}
+
+
+class RoundTripFailure(NamedTuple):
+    """A name that is not a fixed point of parse then serialize."""
+
+    name: str
+    fields: tuple[str, ...]
+    filename: str
+    second_filename: str
+
+
+def _normalize(key: str, value: object) -> object:
+    """Normalize values the serializer is expected to change."""
+    normalizer = _NORMALIZERS.get(key)
+    return normalizer(value) if normalizer and isinstance(value, str) else value
+
+
+def _drifted_fields(first: Mapping, second: Mapping) -> tuple[str, ...]:
+    """Find the fields that changed between two parses."""
+    fields = []
+    for key in sorted(first.keys() | second.keys()):
+        if key not in first and key in _OPTIONAL_FIELDS:
+            continue
+        if _normalize(key, first.get(key)) != _normalize(key, second.get(key)):
+            fields.append(key)
+    return tuple(fields)
+
+
+def _check_chunk(names: tuple[str, ...]) -> list[RoundTripFailure]:
+    """Parse, serialize and parse again, returning names that drift."""
+    template = FilenameTemplate()
+    firsts = comicfn2dict_batch(names)
+    filenames = template.render_many(firsts)
+    seconds = comicfn2dict_batch(filenames)
+    second_filenames = template.render_many(seconds)
+    failures = []
+    for name, first, filename, second, second_filename in zip(  # noqa: B905
+        names, firsts, filenames, seconds, second_filenames
+    ):
+        fields = _drifted_fields(first, second)
+        if filename != second_filename:
+            fields += (_FILENAME_FIELD,)
+        if fields:
+            failures.append(RoundTripFailure(name, fields, filename, second_filename))
+    return failures
+
+
+def iter_round_trip_failures(
+    names: Iterable[str],
+    workers: int | None = None,
+    chunk_size: int = 512,
+) -> Iterator[RoundTripFailure]:
+    """Stream names through parse, serialize & parse in parallel, yielding failures in order."""
+    workers = workers or cpu_count() or 1
+    chunks = iter_chunks(names, chunk_size)
+    if workers <= 1:
+        for chunk in chunks:
+            yield from _check_chunk(chunk)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Bound the chunks in flight so huge corpora stream.
+        pending: deque[Future[list[RoundTripFailure]]] = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_check_chunk, chunk))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+class RoundTripReport:
+    """Summarize round trip failures by drifted field."""
+
+    def add(self, failure: RoundTripFailure) -> None:
+        """Count a failure and keep a few examples."""
+        self.failures += 1
+        for field in failure.fields:
+            self.field_counts[field] = self.field_counts.get(field, 0) + 1
+            examples = self.examples.setdefault(field, [])
+            if len(examples) < self._max_examples:
+                examples.append(failure)
+
+    @property
+    def rate(self) -> float:
+        """Names per second."""
+        return self.total / self.seconds if self.seconds else 0.0
+
+    def format(self) -> str:
+        """Format the report as text."""
+        lines = [
+            (
+                f"{self.total} names, {self.failures} not stable, "
+                f"{self.seconds:.3f}s, {self.rate:,.0f} names/s"
+            )
+        ]
+        for field, count in sorted(
+            self.field_counts.items(), key=lambda item: (-item[1], item[0])
+        ):
+            lines.append(f"  {field}: {count}")
+            lines.extend(
+                f"    {failure.name!r} -> {failure.filename!r} -> {failure.second_filename!r}"
+                for failure in self.examples[field]
+            )
+        return "\n".join(lines)
+
+    def __init__(self, max_examples: int = 5):
+        """Initialize."""
+        self._max_examples = max_examples
+        self.total: int = 0
+        self.failures: int = 0
+        self.seconds: float = 0.0
+        self.field_counts: dict[str, int] = {}
+        self.examples: dict[str, list[RoundTripFailure]] = {}
+
+
+def validate_round_trip(
+    names: Iterable[str],
+    workers: int | None = None,
+    chunk_size: int = 512,
+    max_examples: int = 5,
+    on_failure: Callable[[RoundTripFailure], None] | None = None,
+) -> RoundTripReport:
+    """Check that a corpus is a fixed point of comicfn2dict & dict2comicfn."""
+    report = RoundTripReport(max_examples=max_examples)
+
+    def _count(names: Iterable[str]) -> Iterator[str]:
+        for name in names:
+            report.total += 1
+            yield name
+
+    start = perf_counter()
+    for failure in iter_round_trip_failures(_count(names), workers, chunk_size):
+        report.add(failure)
+        if on_failure:
+            on_failure(failure)
+    report.seconds = perf_counter() - start
+    return report
@@ -0,0 +1,87 @@
+"""Tests for adaptive fallback pattern guards."""
+
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from comicfn2dict import ComicFilenameEngine, comicfn2dict
+from comicfn2dict.adaptive import FALLBACK_GUARDS, AdaptiveProfile
+from tests.comic_filenames import PARSE_FNS
+
+NAMES = (
+    *PARSE_FNS,
+    "Sandman v2 (of 4).cbr",
+    "Sandman 2 (OF 4).cbr",
+    "Fables BOOK 3.cbz",
+    "Fables boo\N{KELVIN SIGN} 3.cbz",
+    "Saga C2C.cbz",
+    "Hellboy #5.cbz",
+)
+EXPECTED = [comicfn2dict(name) for name in NAMES]
+
+
+def _warmed(hit_rate: float) -> AdaptiveProfile:
+    """Make a profile with enough tries of every pattern to trust."""
+    profile = AdaptiveProfile()
+    for name in FALLBACK_GUARDS:
+        for index in range(1000):
+            profile.record(name, index < hit_rate * 1000)
+    return profile
+
+
+@pytest.mark.parametrize("hit_rate", [None, 0.0, 1.0])
+def test_profile_results_unchanged(hit_rate):
+    """Test that guarded and unguarded fallbacks parse the same."""
+    profile = AdaptiveProfile() if hit_rate is None else _warmed(hit_rate)
+    engine = ComicFilenameEngine(profile=profile)
+    assert [engine.parse(name) for name in NAMES] == EXPECTED
+    assert engine.parse_batch(NAMES) == EXPECTED
+
+
+def test_use_guard():
+    """Test guarding until hit rates are trusted and high."""
+    assert AdaptiveProfile().use_guard("issue_number")
+    assert _warmed(0.1).use_guard("issue_number")
+    assert not _warmed(0.9).use_guard("issue_number")
+
+
+def test_profile_threads():
+    """Test no tries are lost when threads record into one profile."""
+    switch_interval = sys.getswitchinterval()
+    # Switch threads often so unlocked counts would race.
+    sys.setswitchinterval(1e-6)
+    profile = AdaptiveProfile()
+
+    def _record(hit: bool) -> None:
+        for _ in range(2000):
+            profile.record("issue_number", hit)
+
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(_record, [True, False] * 4))
+    finally:
+        sys.setswitchinterval(switch_interval)
+    assert profile.rates() == {"issue_number": 0.5}
+    assert profile._counts["issue_number"] == [16000, 8000]
+
+
+def test_profile_round_trip(tmp_path):
+    """Test saving, loading and merging profiles."""
+    path = tmp_path / "profile.json"
+    profile = AdaptiveProfile()
+    ComicFilenameEngine(profile=profile).parse_batch(NAMES)
+    profile.save(path)
+    loaded = AdaptiveProfile.load(path)
+    assert loaded.rates() == profile.rates()
+    loaded.merge(profile)
+    assert loaded.rates() == profile.rates()
+
+
+def test_profile_load_missing_or_stale(tmp_path):
+    """Test that missing and other version profiles start empty."""
+    path = tmp_path / "profile.json"
+    assert not AdaptiveProfile.load(path).rates()
+    path.write_text(json.dumps({"version": 0, "patterns": {"book_volume": {}}}))
+    assert not AdaptiveProfile.load(path).rates()
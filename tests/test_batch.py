@@ -0,0 +1,28 @@
+"""Tests for stage major batch parsing."""
+
+from io import StringIO
+
+import pytest
+
+from comicfn2dict import comicfn2dict, comicfn2dict_batch
+from comicfn2dict.batch import batch, iter_lines, load_record
+from tests.comic_filenames import PARSE_FNS
+
+NAMES = (*PARSE_FNS, "", ".cbz", "#", "(2000)", "Sandman v2 (of 4).cbr")
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1024])
+def test_batch_matches_single(chunk_size):
+    """Test that batch results are identical to per name parsing."""
+    expected = [comicfn2dict(name) for name in NAMES]
+    assert comicfn2dict_batch(NAMES, chunk_size=chunk_size) == expected
+
+
+def test_batch_jsonl():
+    """Test JSON lines output."""
+    listing = StringIO("".join(f"{name}\n" for name in PARSE_FNS) + "\n")
+    output = StringIO()
+    count = batch(iter_lines(listing), output, chunk_size=10)
+    assert count == len(PARSE_FNS)
+    records = [load_record(line) for line in output.getvalue().splitlines()]
+    assert records == [(name, comicfn2dict(name)) for name in PARSE_FNS]
@@ -0,0 +1,99 @@
+"""Tests for the canonical dict2comicfn() layout fast path."""
+
+import random
+
+import pytest
+
+from comicfn2dict import ComicFilenameEngine, comicfn2dict, dict2comicfn
+from comicfn2dict.canonical import CANONICAL_RE
+from tests.comic_filenames import PARSE_FNS
+
+_WORDS = (
+    "The",
+    "Amazing",
+    "Spider-Man",
+    "Man",
+    "Saga",
+    "of",
+    "It's",
+    "Jan-Feb",
+    "Marvel",
+    "Captain",
+    "Annual",
+    "TPB",
+    "Digital",
+    "Web",
+    "Empire",
+    "Zone",
+    "v",
+    "I",
+)
+_OPTIONAL_CHANCE = 0.5
+_FORMATS = ("TPB", "Digital", "Digital Chapter", "Web-Rip", "Giant Size", "Fake")
+
+
+def _random_metadata(rng: random.Random) -> dict[str, str]:
+    """Make metadata for a canonical name with awkward words."""
+
+    def words() -> str:
+        return " ".join(rng.choice(_WORDS) for _ in range(rng.randint(1, 3)))
+
+    metadata = {"series": words(), "ext": rng.choice(("cbz", "CBR"))}
+    optional = {
+        "volume": lambda: str(rng.randint(0, 12)),
+        "volume_count": lambda: str(rng.randint(1, 12)),
+        "issue": lambda: rng.choice(("7", "12.5", "3b", "0")),
+        "issue_count": lambda: str(rng.randint(1, 50)),
+        "year": lambda: str(rng.randint(1000, 2999)),
+        "title": words,
+        "original_format": lambda: rng.choice(_FORMATS),
+        "scan_info": words,
+    }
+    for key, value in optional.items():
+        if rng.random() < _OPTIONAL_CHANCE:
+            metadata[key] = value()
+    return metadata
+
+
+_RNG = random.Random(39)  # noqa: S311
+NAMES = (
+    *PARSE_FNS,
+    *(dict2comicfn(comicfn2dict(name)) for name in PARSE_FNS),
+    *(dict2comicfn(_random_metadata(_RNG)) for _ in range(1000)),
+)
+EXPECTED = [comicfn2dict(name) for name in NAMES]
+
+
+def test_canonical_identical():
+    """Test the fast path reads names exactly as the full parser does."""
+    engine = ComicFilenameEngine(canonical=True)
+    results = [engine.parse(name) for name in NAMES]
+    assert [list(md.items()) for md in results] == [list(md.items()) for md in EXPECTED]
+    assert engine.parse_batch(NAMES, chunk_size=64) == EXPECTED
+    counts = engine.canonical_counts
+    assert counts
+    assert counts.tries == 2 * len(NAMES)
+    assert 0 < counts.hits < counts.tries
+    assert counts.rate == counts.hits / counts.tries
+
+
+@pytest.mark.parametrize(
+    ("name", "hit"),
+    [
+        ("Saga v2 (of 003) #005 (of 010) (2020) Title (TPB) (Empire).cbz", True),
+        ("Saga #005 (2020).cbz", True),
+        ("Saga (2020).cbz", True),
+        ("Saga #005 (2020) (Marvel).cbz", False),
+        ("Saga #005 (2020-03-15).cbz", False),
+        ("Saga #005[extra].cbz", False),
+    ],
+)
+def test_canonical_hits(name, hit):
+    """Test which names take the fast path."""
+    engine = ComicFilenameEngine(canonical=True)
+    assert engine.parse(name) == comicfn2dict(name)
+    counts = engine.canonical_counts
+    assert counts
+    assert counts.hits == hit
+    if hit:
+        assert CANONICAL_RE.fullmatch(name)
@@ -0,0 +1,57 @@
+"""Tests for case folded matching."""
+
+import pytest
+
+from comicfn2dict import ComicFilenameEngine, comicfn2dict
+from comicfn2dict.adaptive import AdaptiveProfile
+from comicfn2dict.locales import LOCALE_PACKS, compile_locales
+from comicfn2dict.parse import CaseFoldedParser, ComicFilenameParser
+from comicfn2dict.regex import MONTH_FIRST_DATE_RE, fold_re
+from tests.comic_filenames import PARSE_FNS
+
+NAMES = (
+    *PARSE_FNS,
+    *(name.upper() for name in PARSE_FNS),
+    *(name.swapcase() for name in PARSE_FNS),
+    "Captain MARVEL JAN-FEB 1980 C2C.cbz",
+    "Sandman V2 (OF 4) BOOK 3.cbr",
+    "Saga TPB (Digital-Empire) (IMAGE).cbz",
+    "Asterix TOME 12 (JANVIER 1999).cbz",
+    "Lucky Luke Band 4 (MÄRZ 1980).cbz",
+    "Spirou 3 (DÉC. 1970).cbz",
+    "Fables boo\N{KELVIN SIGN} 3 (Mar\N{LATIN SMALL LETTER LONG S} 2002).cbz",
+)
+LOCALES = ((), tuple(LOCALE_PACKS))
+
+
+@pytest.mark.parametrize("locales", LOCALES)
+def test_casefold_identical(locales):
+    """Test case folded matching parses exactly like the full parser."""
+    locale = compile_locales(("en", *locales))
+    expected = [ComicFilenameParser(name, locale=locale).parse() for name in NAMES]
+    results = [CaseFoldedParser(name, locale=locale).parse() for name in NAMES]
+    assert [list(md.items()) for md in results] == [list(md.items()) for md in expected]
+    engine = ComicFilenameEngine(locales=locales, casefold=True)
+    assert [engine.parse(name) for name in NAMES] == expected
+    assert engine.parse_batch(NAMES, chunk_size=64) == expected
+
+
+def test_casefold_with_other_modes():
+    """Test case folded matching with prescan and fallback guards."""
+    expected = [comicfn2dict(name) for name in NAMES]
+    engine = ComicFilenameEngine(
+        prescan=True, profile=AdaptiveProfile(), canonical=True, casefold=True
+    )
+    assert engine.parse_batch(NAMES) == expected
+    assert [engine.parse(name) for name in NAMES] == expected
+
+
+def test_fold_re():
+    """Test folded patterns keep escapes and group names."""
+    folded = fold_re(MONTH_FIRST_DATE_RE)
+    assert folded is fold_re(MONTH_FIRST_DATE_RE)
+    assert folded.groupindex == MONTH_FIRST_DATE_RE.groupindex
+    assert r"\b" in folded.pattern
+    assert "Jan" not in folded.pattern
+    assert folded.search("saga jan 2020")
+    assert not folded.search("saga JAN 2020")
@@ -0,0 +1,118 @@
+"""Tests for indexed catalog queries."""
+
+from itertools import product
+
+import pytest
+
+from comicfn2dict import comicfn2dict
+from comicfn2dict.catalog import CatalogEntry, ComicCatalog
+from comicfn2dict.matcher import normalize_series
+from comicfn2dict.sort import issue_sort_key
+from tests.comic_filenames import PARSE_FNS
+
+PUBLISHERS = ("Image", "Marvel", "DC Comics")
+FORMATS = ("TPB", "Digital", "Annual")
+
+
+def _records():
+    records = []
+    for index, name in enumerate(PARSE_FNS):
+        metadata = comicfn2dict(name)
+        if index % 3:
+            metadata["publisher"] = PUBLISHERS[index // 3 % len(PUBLISHERS)]
+        if index % 4:
+            metadata["original_format"] = FORMATS[index % len(FORMATS)]
+        records.append((f"comics/{index}/{name}", metadata))
+    return records
+
+
+RECORDS = _records()
+CATALOG = ComicCatalog(RECORDS)
+
+
+def _in_range(key, low, high):
+    return (
+        key is not None
+        and (low is None or low <= key)
+        and (high is None or key <= high)
+    )
+
+
+def _scan(publisher=None, original_format=None, year=None, issue=None, series=None):
+    """Filter records the slow way."""
+    results = []
+    for path, md in RECORDS:
+        if publisher and md.get("publisher", "").casefold() != publisher.casefold():
+            continue
+        if original_format and (
+            md.get("original_format", "").casefold() != original_format.casefold()
+        ):
+            continue
+        if series and normalize_series(md.get("series", "")) != normalize_series(
+            series
+        ):
+            continue
+        year_value = int(md["year"]) if md.get("year", "").isdigit() else None
+        if year and not _in_range(
+            year_value, *(bound and int(bound) for bound in year)
+        ):
+            continue
+        issue_value = issue_sort_key(md["issue"]) if "issue" in md else None
+        if issue and not _in_range(
+            issue_value, *(bound and issue_sort_key(bound) for bound in issue)
+        ):
+            continue
+        results.append(CatalogEntry(path, md))
+    return results
+
+
+@pytest.mark.parametrize(
+    ("publisher", "original_format", "year", "issue"),
+    list(
+        product(
+            (None, "image", "Unknown"),
+            (None, "tpb"),
+            (None, (2000, 2015), ("2020", None)),
+            (None, ("1", "12"), (None, "1.5")),
+        )
+    ),
+)
+def test_catalog_matches_scan(publisher, original_format, year, issue):
+    """Test intersected index hits are the records a full scan finds."""
+    expected = _scan(publisher, original_format, year, issue)
+    results = CATALOG.query(
+        publisher=publisher, original_format=original_format, year=year, issue=issue
+    )
+    assert results == expected
+
+
+def test_catalog_series_volume_issues():
+    """Test a series, volume & issue range query."""
+    path, md = next((path, md) for path, md in RECORDS if "volume" in md)
+    results = CATALOG.query(
+        series=md["series"].upper(),
+        volume="0" + md["volume"],
+        issue=(md["issue"], md["issue"]),
+    )
+    assert CatalogEntry(path, md) in results
+    assert CATALOG.query(series=md["series"], year=2021) == _scan(
+        series=md["series"], year=(2021, 2021)
+    )
+
+
+def test_catalog_single_values_and_empty():
+    """Test single years & issues, no filters and an empty catalog."""
+    assert CATALOG.query(year="2000") == CATALOG.query(year=(2000, 2000))
+    assert CATALOG.query(issue="1") == CATALOG.query(issue=("1", "1"))
+    assert CATALOG.query() == list(CATALOG)
+    assert len(CATALOG) == len(RECORDS)
+    empty = ComicCatalog([])
+    assert not len(empty)
+    assert empty.query(publisher="Image", year=(2000, 2010)) == []
+
+
+@pytest.mark.parametrize("year", ["abc", ("2000", "later"), (None, "")])
+def test_catalog_bad_year(year):
+    """Test year bounds that aren't numbers raise instead of opening the range."""
+    with pytest.raises(ValueError, match="Year bounds"):
+        CATALOG.query(year=year)
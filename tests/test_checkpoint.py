@@ -0,0 +1,188 @@
+"""Tests for resuming batch & scan runs from checkpoints."""
+
+from io import StringIO
+
+import pytest
+
+from comicfn2dict.batch import batch, batch_listing
+from comicfn2dict.checkpoint import Checkpointer, checkpoint_path, load_checkpoint
+from comicfn2dict.cli import main
+from comicfn2dict.scan import scan
+from tests.comic_filenames import PARSE_FNS
+
+NAMES = tuple(PARSE_FNS)[:40]
+CRASH_AFTER = 27
+
+
+class CrashError(Exception):
+    """The run died."""
+
+
+def _crashing(paths, after=CRASH_AFTER):
+    for index, path in enumerate(paths):
+        if index == after:
+            raise CrashError
+        yield path
+
+
+def _crashing_update(update, after):
+    calls = []
+
+    def crashing_update(output, chunk):
+        update(output, chunk)
+        calls.append(chunk)
+        if len(calls) == after:
+            raise CrashError
+
+    return crashing_update
+
+
+def _run(output_path, func, *, resume=False, every=4):
+    checkpointer = Checkpointer(checkpoint_path(output_path), every, resume=resume)
+    mode = "a" if resume else "w"
+    with output_path.open(mode, encoding="utf-8") as output:
+        return func(output, checkpointer)
+
+
+def _expected(func):
+    output = StringIO()
+    func(output)
+    return output.getvalue()
+
+
+def test_batch_resume(tmp_path):
+    """Test a resumed batch writes every record once."""
+    path = tmp_path / "out.jsonl"
+    with pytest.raises(CrashError):
+        _run(
+            path,
+            lambda output, cp: batch(
+                _crashing(NAMES), output, chunk_size=3, checkpointer=cp
+            ),
+        )
+    checkpoint = load_checkpoint(checkpoint_path(path))
+    assert checkpoint
+    assert 0 < checkpoint.records < CRASH_AFTER
+    # Records written after the checkpoint are dropped on resume.
+    assert path.stat().st_size > checkpoint.output_size
+    count = _run(
+        path,
+        lambda output, cp: batch(NAMES, output, chunk_size=3, checkpointer=cp),
+        resume=True,
+    )
+    assert count == len(NAMES) - checkpoint.records
+    assert path.read_text() == _expected(lambda output: batch(NAMES, output))
+    assert not checkpoint_path(path).exists()
+
+
+def test_batch_listing_resume(tmp_path):
+    """Test a resumed listing run starts after the last checkpointed line."""
+    listing = tmp_path / "listing.txt"
+    listing.write_text("".join(f"comics/{name}\n" for name in NAMES))
+    path = tmp_path / "out.jsonl"
+    checkpointer = Checkpointer(checkpoint_path(path), 4)
+    checkpointer.update = _crashing_update(checkpointer.update, 6)
+    with path.open("w") as output, pytest.raises(CrashError):
+        batch_listing(listing, output, chunk_size=3, checkpointer=checkpointer)
+    _run(
+        path,
+        lambda output, cp: batch_listing(
+            listing, output, chunk_size=3, checkpointer=cp
+        ),
+        resume=True,
+    )
+    assert path.read_text() == _expected(lambda output: batch_listing(listing, output))
+
+
+@pytest.mark.parametrize(
+    "edit",
+    [
+        lambda lines: ["comics/Inserted 001.cbz\n", *lines],
+        lambda lines: lines[1:],
+        lambda lines: [line.replace("comics/", "library/") for line in lines],
+    ],
+)
+def test_batch_listing_resume_changed(tmp_path, edit):
+    """Test resuming against an edited listing is refused."""
+    listing = tmp_path / "listing.txt"
+    lines = [f"comics/{name}\n" for name in NAMES]
+    listing.write_text("".join(lines))
+    path = tmp_path / "out.jsonl"
+    checkpointer = Checkpointer(checkpoint_path(path), 4)
+    checkpointer.update = _crashing_update(checkpointer.update, 6)
+    with path.open("w") as output, pytest.raises(CrashError):
+        batch_listing(listing, output, chunk_size=3, checkpointer=checkpointer)
+    listing.write_text("".join(edit(lines)))
+    with pytest.raises(ValueError, match="Input has changed"):
+        _run(
+            path,
+            lambda output, cp: batch_listing(listing, output, checkpointer=cp),
+            resume=True,
+        )
+
+
+def test_scan_resume(tmp_path):
+    """Test a resumed scan skips the comics already written."""
+    root = tmp_path / "library"
+    for index, name in enumerate(NAMES):
+        directory = root / f"Series {index % 5}"
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / name).touch()
+    path = tmp_path / "out.jsonl"
+    checkpointer = Checkpointer(checkpoint_path(path), 4)
+    checkpointer.update = _crashing_update(checkpointer.update, 6)
+    with path.open("w") as output, pytest.raises(CrashError):
+        scan(root, output, chunk_size=3, checkpointer=checkpointer)
+    _run(
+        path,
+        lambda output, cp: scan(root, output, chunk_size=3, checkpointer=cp),
+        resume=True,
+    )
+    assert path.read_text() == _expected(lambda output: scan(root, output))
+
+
+def test_resume_changed_input(tmp_path):
+    """Test resuming against different input is refused."""
+    path = tmp_path / "out.jsonl"
+    with pytest.raises(CrashError):
+        _run(
+            path,
+            lambda output, cp: batch(
+                _crashing(NAMES), output, chunk_size=3, checkpointer=cp
+            ),
+        )
+    with pytest.raises(ValueError, match="Input has changed"):
+        _run(
+            path,
+            lambda output, cp: batch(NAMES[1:], output, checkpointer=cp),
+            resume=True,
+        )
+
+
+def test_cli_resume_needs_checkpoints(tmp_path, monkeypatch, capsys):
+    """Test resuming without checkpoints is refused before output is touched."""
+    listing = tmp_path / "listing.txt"
+    listing.write_text("".join(f"{name}\n" for name in NAMES[:5]))
+    path = tmp_path / "out.jsonl"
+    monkeypatch.setattr(
+        "sys.argv", ["comicfn2dict", "batch", str(listing), "-o", str(path)]
+    )
+    main()
+    output = path.read_text()
+    monkeypatch.setattr(
+        "sys.argv",
+        [
+            "comicfn2dict",
+            "batch",
+            str(listing),
+            "-o",
+            str(path),
+            "--resume",
+            "--checkpoint-every",
+            "0",
+        ],
+    )
+    with pytest.raises(SystemExit):
+        main()
+    assert "--checkpoint-every" in capsys.readouterr().err
+    assert path.read_text() == output
@@ -0,0 +1,80 @@
+"""Tests for the generated parse function."""
+
+import pytest
+
+from comicfn2dict import ComicFilenameEngine, comicfn2dict, dict2comicfn
+from comicfn2dict.canonical import CanonicalCounts
+from comicfn2dict.codegen import compile_parse
+from comicfn2dict.locales import LOCALE_PACKS, compile_locales
+from comicfn2dict.parse import _STAGES, ComicFilenameParser
+from tests.comic_filenames import PARSE_FNS
+
+NAMES = (
+    *PARSE_FNS,
+    *(dict2comicfn(comicfn2dict(name)) or "" for name in PARSE_FNS),
+    "Captain Marvel c2c.cbz",
+    "Series xc2c.cbz",
+    "Series Jan-Feb.cbr",
+    "No Triggers At All.cbz",
+    "Asterix Tome 12 (Janvier 1999).cbz",
+    "Lucky Luke Band 4 (März 1980).cbz",
+    "comics/Series/Series 001 (2000).cbz",
+    " Padded 2 (1999).cbz ",
+    "No Extension 3",
+    "Trailing Dot.",
+    ".cbz",
+    "",
+)
+LOCALES = ((), tuple(LOCALE_PACKS))
+
+
+@pytest.mark.parametrize("locales", LOCALES)
+@pytest.mark.parametrize("prescan", [False, True])
+@pytest.mark.parametrize("canonical", [False, True])
+def test_codegen_identical(locales, prescan, canonical):
+    """Test the generated function parses exactly like the parser's stages."""
+    locale = compile_locales(("en", *locales))
+    counts, generated_counts = (
+        (CanonicalCounts(), CanonicalCounts()) if canonical else (None, None)
+    )
+    parse = compile_parse(locale, prescan=prescan, canonical=generated_counts)
+    expected = [
+        ComicFilenameParser(
+            name, locale=locale, prescan=prescan, canonical=counts
+        ).parse()
+        for name in NAMES
+    ]
+    results = [parse(name) for name in NAMES]
+    assert [list(md.items()) for md in results] == [list(md.items()) for md in expected]
+    if canonical:
+        assert counts is not None
+        assert generated_counts is not None
+        assert (generated_counts.tries, generated_counts.hits) == (
+            counts.tries,
+            counts.hits,
+        )
+
+
+def test_codegen_engine():
+    """Test engines use the generated function only where it applies."""
+    engine = ComicFilenameEngine(codegen=True, sort_keys=True)
+    assert engine._parse_fn is not None
+    expected = ComicFilenameEngine(sort_keys=True)
+    assert [engine.parse(name) for name in NAMES] == [
+        expected.parse(name) for name in NAMES
+    ]
+    assert ComicFilenameEngine(codegen=True, casefold=True)._parse_fn is None
+    assert ComicFilenameEngine(codegen=True, verbose=1)._parse_fn is None
+
+
+def test_codegen_source():
+    """Test the source calls every stage and flags that are off leave no checks."""
+    plain = compile_parse().source  # type: ignore[attr-defined]
+    for name, *_ in _STAGES:
+        assert f"{name.upper()}_" in plain
+    assert "candidates" not in plain
+    assert "CANONICAL" not in plain
+    prescan = compile_parse(prescan=True).source  # type: ignore[attr-defined]
+    assert "candidates.isdisjoint" in prescan
+    canonical = compile_parse(canonical=CanonicalCounts()).source  # type: ignore[attr-defined]
+    assert "CANONICAL" in canonical
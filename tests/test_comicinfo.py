@@ -0,0 +1,121 @@
+"""Tests for reading ComicInfo.xml from archives."""
+
+from __future__ import annotations
+
+from zipfile import ZIP_DEFLATED, ZipFile
+
+import pytest
+
+from comicfn2dict import ComicFilenameEngine
+from comicfn2dict.comicinfo import (
+    enrich_batch,
+    iter_enriched,
+    merge_comicinfo,
+    read_comicinfo,
+)
+
+COMICINFO = """<?xml version="1.0"?>
+<ComicInfo xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">
+  <Series>Saga</Series>
+  <Number>1</Number>
+  <Title>Chapter One</Title>
+  <Year>2012</Year>
+  <Month>3</Month>
+  <Count>-1</Count>
+  <Publisher> Image </Publisher>
+  <Writer>Brian K. Vaughan</Writer>
+</ComicInfo>
+"""
+# Fixed size of a zip local file header before its name.
+LOCAL_HEADER_SIZE = 30
+MEMBERS = (
+    ("page 01.jpg", b"jpeg"),
+    ("page 02.PNG", b"png"),
+    ("__MACOSX/._page 01.jpg", b"junk"),
+    ("extras/ComicInfo.xml", b"<ComicInfo><Series>Other</Series></ComicInfo>"),
+    ("notes.txt", b"text"),
+)
+
+
+def _make_cbz(path, comicinfo: str | None = COMICINFO):
+    with ZipFile(path, "w", compression=ZIP_DEFLATED) as archive:
+        for name, data in MEMBERS:
+            archive.writestr(name, data)
+        if comicinfo is not None:
+            archive.writestr("ComicInfo.xml", comicinfo)
+    return path
+
+
+def test_read_comicinfo(tmp_path):
+    """Test the root ComicInfo.xml and page count are read."""
+    path = _make_cbz(tmp_path / "Saga 001 (2012).cbz")
+    assert read_comicinfo(path) == {
+        "series": "Saga",
+        "issue": "1",
+        "title": "Chapter One",
+        "year": "2012",
+        "month": "03",
+        "publisher": "Image",
+        "page_count": "2",
+    }
+
+
+def test_read_without_comicinfo(tmp_path):
+    """Test archives without a root ComicInfo.xml use the shallowest one."""
+    path = _make_cbz(tmp_path / "Saga 001.cbz", comicinfo=None)
+    assert read_comicinfo(path) == {"series": "Other", "page_count": "2"}
+
+
+@pytest.mark.parametrize("prefer_filename", [False, True])
+def test_merge_precedence(prefer_filename):
+    """Test which source wins and that ext & remainders come from the name."""
+    filename_md = {"ext": "cbz", "series": "Saga Deluxe", "remainders": ("x",)}
+    comicinfo = {"series": "Saga", "issue": "1"}
+    merged = merge_comicinfo(filename_md, comicinfo, prefer_filename=prefer_filename)
+    assert merged["series"] == ("Saga Deluxe" if prefer_filename else "Saga")
+    assert merged["issue"] == "1"
+    assert merged["ext"] == "cbz"
+    assert merged["remainders"] == ("x",)
+
+
+def _corrupt_deflate(path):
+    """Overwrite the compressed ComicInfo.xml with an invalid deflate stream."""
+    with ZipFile(path) as archive:
+        info = archive.getinfo("ComicInfo.xml")
+    data = bytearray(path.read_bytes())
+    start = info.header_offset + LOCAL_HEADER_SIZE + len(info.filename)
+    data[start : start + info.compress_size] = b"\xff" * info.compress_size
+    path.write_bytes(data)
+    return path
+
+
+def _encrypt_flag(path):
+    """Mark every member encrypted in the local & central headers."""
+    data = bytearray(path.read_bytes())
+    for signature, flags_offset in ((b"PK\x03\x04", 6), (b"PK\x01\x02", 8)):
+        start = data.find(signature)
+        while start >= 0:
+            data[start + flags_offset] |= 1
+            start = data.find(signature, start + 1)
+    path.write_bytes(data)
+    return path
+
+
+def test_enrich_batch(tmp_path):
+    """Test broken, missing & other archives keep only the filename metadata."""
+    good = str(_make_cbz(tmp_path / "Saga v2 001 (2012).cbz"))
+    broken = tmp_path / "Broken 002.cbz"
+    broken.write_bytes(b"not a zip")
+    empty = tmp_path / "Empty 003.cbz"
+    empty.touch()
+    paths = [good, str(broken), str(empty), str(tmp_path / "Missing 004.cbz")]
+    paths.append(str(tmp_path / "Other 005.cbr"))
+    paths.append(str(_corrupt_deflate(_make_cbz(tmp_path / "Corrupt 006.cbz"))))
+    paths.append(str(_encrypt_flag(_make_cbz(tmp_path / "Encrypted 007.cbz"))))
+    engine = ComicFilenameEngine()
+    results = enrich_batch(paths, engine, workers=2)
+    assert results[0]["volume"] == "2"
+    assert results[0]["title"] == "Chapter One"
+    assert results[0]["page_count"] == "2"
+    assert results[1:] == [engine.parse(path) for path in paths[1:]]
+    assert [md for _, md in iter_enriched(paths, chunk_size=2)] == results
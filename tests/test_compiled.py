@@ -0,0 +1,16 @@
+"""Tests for the optional compiled build."""
+
+from os import environ
+
+from comicfn2dict.compiled import compiled_modules
+
+EXPECTED = (
+    ("comicfn2dict.parse", "comicfn2dict.unparse")
+    if environ.get("COMICFN2DICT_EXPECT_COMPILED")
+    else ()
+)
+
+
+def test_compiled_modules():
+    """Test the suite runs against the build it expects."""
+    assert compiled_modules() == EXPECTED
@@ -2,7 +2,8 @@
 
 import pytest
 
-from comicfn2dict import ComicFilenameSerializer
+from comicfn2dict import ComicFilenameSerializer, columns2comicfn, dict2comicfn
+from comicfn2dict.unparse import FilenameTemplate
 from tests.comic_filenames import SERIALIZE_FNS
 
 
@@ -12,3 +13,77 @@ def test_serialize_dict(item):
     test_fn, md = item
     fn = ComicFilenameSerializer(md).serialize()
     assert test_fn == fn
+
+
+def test_template_render_many():
+    """Test bulk rendering with the default template."""
+    mds = list(SERIALIZE_FNS.values())
+    assert FilenameTemplate().render_many(mds) == list(SERIALIZE_FNS)
+
+
+def _columns(mds: list[dict]) -> dict[str, list]:
+    """Hold metadata in one list per key."""
+    keys = sorted({key for md in mds for key in md})
+    return {key: [md.get(key) for md in mds] for key in keys}
+
+
+@pytest.mark.parametrize("ext", [True, False])
+@pytest.mark.parametrize(
+    "template", [None, "<{series}> - <{issue:issue}> <({date})>", "Comic <[{title}]>"]
+)
+def test_render_columns(template, ext):
+    """Test columnar rendering matches rendering each mapping."""
+    mds = [
+        *SERIALIZE_FNS.values(),
+        {"month": "3", "day": "4"},
+        {"day": "4", "remainders": "abc"},
+        {"series": "Series", "issue": "", "ext": "cbr"},
+        {"series": "Dated", "date": "2021-03-04", "year": "1999"},
+        {"series": "Undated", "date": None, "year": "2020", "month": "2"},
+        {"series": "No Ext", "ext": None},
+        {},
+    ]
+    expected = [dict2comicfn(md, ext=ext, template=template) for md in mds]
+    assert columns2comicfn(_columns(mds), ext=ext, template=template) == expected
+
+
+def test_render_none_ext():
+    """Test a None ext gets the default ext by row and by column."""
+    md = {"series": "Series", "ext": None}
+    assert dict2comicfn(md) == "Series.cbz"
+    assert columns2comicfn(_columns([md])) == ["Series.cbz"]
+
+
+def test_render_columns_lengths():
+    """Test columns must be the same length."""
+    assert columns2comicfn({}) == []
+    with pytest.raises(ValueError, match="same length"):
+        FilenameTemplate().render_columns({"series": ["A", "B"], "issue": ["1"]})
+
+
+@pytest.mark.parametrize(
+    ("template", "md", "fn"),
+    [
+        (
+            "<{series}> - <{issue:issue}> <({year})>",
+            {"series": "Series", "issue": "1", "year": "2000", "ext": "cbr"},
+            "Series - #001 (2000).cbr",
+        ),
+        (
+            "<{publisher}>/<{series}> <v{volume}>",
+            {"series": "Series", "volume": "2"},
+            "Series v2.cbz",
+        ),
+        ("Comic <{title}>", {"title": "Title"}, "Comic Title.cbz"),
+    ],
+)
+def test_custom_template(template, md, fn):
+    """Test user defined templates."""
+    assert dict2comicfn(md, template=template) == fn
+
+
+@pytest.mark.parametrize("template", ["{series}", "<{series}", "<{}>", "<{series!r}>"])
+def test_bad_template(template):
+    """Test template validation."""
+    with pytest.raises(ValueError, match="emplate"):
+        FilenameTemplate(template)
@@ -0,0 +1,60 @@
+"""Tests for duplicate issue detection."""
+
+from comicfn2dict import comicfn2dict
+from comicfn2dict.dupes import (
+    DuplicateIndex,
+    IdentityKey,
+    find_duplicates,
+    fingerprint,
+    identity_key,
+)
+
+NAMES = (
+    "Saga #1 (2012) (c2c).cbz",
+    "Saga #2 (2012).cbz",
+    "Saga #001 (2012) (Digital) (Empire).cbr",
+    "X-Men v2 #5.cbz",
+    "The Saga 001 (2012).cbz",
+    "x men v02 #005.cbr",
+    "No Issue Here.cbz",
+    "No Issue Here.cbr",
+)
+
+
+def _records():
+    return [(name, comicfn2dict(name)) for name in NAMES]
+
+
+def test_identity_key():
+    """Test identity keys fold case, punctuation and leading zeros."""
+    key = identity_key({"series": "The X-Men", "volume": "02", "issue": "#005"})
+    assert key == IdentityKey("x men", "2", "5", "")
+    assert identity_key({"series": "Saga", "issue": "000"}) == IdentityKey(
+        "saga", "", "0", ""
+    )
+    assert identity_key({"series": "Saga"}) is None
+    assert identity_key({"issue": "1"}) is None
+
+
+def test_fingerprint_stable():
+    """Test fingerprints don't depend on the process."""
+    assert fingerprint(IdentityKey("saga", "", "1", "2012")) == 0xDB83C1B04AD014D6  # noqa: PLR2004
+
+
+def test_find_duplicates():
+    """Test grouping paths by identity."""
+    groups = find_duplicates(_records())
+    assert [group.paths for group in groups] == [
+        (NAMES[0], NAMES[2], NAMES[4]),
+        (NAMES[3], NAMES[5]),
+    ]
+    assert groups[0].key == IdentityKey("saga", "", "1", "2012")
+    assert groups[0].fingerprint == "db83c1b04ad014d6"
+
+
+def test_index_counts():
+    """Test the index counts distinct issues and flags duplicates."""
+    index = DuplicateIndex()
+    duplicates = [index.add(path, metadata) for path, metadata in _records()]
+    assert duplicates == [False, False, True, False, True, True, False, False]
+    assert len(index) == 3  # noqa: PLR2004
@@ -0,0 +1,43 @@
+"""Tests for the shared parsing engine."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from comicfn2dict import ComicFilenameEngine, comicfn2dict
+from tests.comic_filenames import PARSE_FNS
+
+NAMES = tuple(PARSE_FNS) * 4
+EXPECTED = [comicfn2dict(name) for name in NAMES]
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_parse_many(workers):
+    """Test thread pool batches match per name parsing."""
+    engine = ComicFilenameEngine()
+    assert engine.parse_many(NAMES, workers=workers, chunk_size=16) == EXPECTED
+
+
+def test_shared_engine():
+    """Test one engine used from many threads at once."""
+    engine = ComicFilenameEngine()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert list(executor.map(engine.parse, NAMES)) == EXPECTED
+
+
+PRESCAN_FNS = (
+    *NAMES,
+    "Captain Marvel c2c.cbz",
+    "Series xc2c.cbz",
+    "Series Jan-Feb.cbr",
+    "Epic 2000Image.cbz",
+    "No Triggers At All.cbz",
+)
+
+
+def test_prescan():
+    """Test skipping stages after one candidate scan changes nothing."""
+    engine = ComicFilenameEngine(prescan=True)
+    expected = [comicfn2dict(name) for name in PRESCAN_FNS]
+    assert [engine.parse(name) for name in PRESCAN_FNS] == expected
+    assert engine.parse_batch(PRESCAN_FNS) == expected
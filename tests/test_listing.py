@@ -0,0 +1,69 @@
+"""Tests for mmap listing ingestion."""
+
+from io import StringIO
+
+import pytest
+
+from comicfn2dict import comicfn2dict
+from comicfn2dict.batch import batch_listing, load_record
+from comicfn2dict.listing import decode_path, iter_listing, listing_ranges
+from tests.comic_filenames import PARSE_FNS
+
+NAMES = tuple(PARSE_FNS)
+LINES = (
+    *(f"/comics/Publisher/{name}" for name in NAMES[:20]),
+    "",
+    "/comics/empty dir/",
+    *(f"relative/{name}\r" for name in NAMES[20:40]),
+    *NAMES[40:],
+)
+PATHS = tuple(line.rstrip("\r") for line in LINES if not line.endswith("/") and line)
+
+
+@pytest.fixture
+def listing(tmp_path):
+    """Write a listing file."""
+    path = tmp_path / "listing.txt"
+    path.write_text("\n".join(LINES), encoding="utf-8")
+    return path
+
+
+def test_iter_listing(listing):
+    """Test splitting lines into raw paths and decoded basenames."""
+    data = listing.read_bytes()
+    items = tuple(iter_listing(listing))
+    assert tuple(name for *_, name in items) == NAMES
+    assert tuple(path for _, path, _ in items) == tuple(path.encode() for path in PATHS)
+    for offset, path, _ in items:
+        assert data[offset:].split(b"\n", 1)[0].rstrip(b"\r") == path
+
+
+def test_iter_listing_undecodable(tmp_path):
+    """Test that undecodable bytes round trip through decode_path."""
+    raw_path = b"/comics/\xff/Series \xfe 001.cbz"
+    listing = tmp_path / "listing.txt"
+    listing.write_bytes(raw_path + b"\n")
+    ((offset, path, name),) = iter_listing(listing)
+    assert (offset, path) == (0, raw_path)
+    assert name == "Series \udcfe 001.cbz"
+    assert decode_path(path).encode("utf-8", "surrogateescape") == raw_path
+
+
+@pytest.mark.parametrize("count", [1, 2, 3, 7, 1000])
+def test_listing_ranges(listing, count):
+    """Test that byte range parts cover every line exactly once."""
+    items = []
+    for start, end in listing_ranges(listing, count):
+        items.extend(iter_listing(listing, start=start, end=end))
+    assert tuple(items) == tuple(iter_listing(listing))
+
+
+def test_batch_listing(listing):
+    """Test JSON lines output from a listing."""
+    output = StringIO()
+    assert batch_listing(listing, output, chunk_size=16) == len(NAMES)
+    records = [load_record(line) for line in output.getvalue().splitlines()]
+    assert records == [
+        (path, comicfn2dict(name))
+        for path, name in zip(PATHS, NAMES)  # noqa: B905
+    ]
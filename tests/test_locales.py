@@ -0,0 +1,51 @@
+"""Tests for locale packs."""
+
+import pytest
+
+from comicfn2dict import ComicFilenameEngine, comicfn2dict
+from comicfn2dict.locales import LOCALE_PACKS, compile_locales
+from comicfn2dict.regex import (
+    ALPHA_MONTH_RANGE_RE,
+    MONTH_FIRST_DATE_RE,
+    VOLUME_RE,
+    YEAR_FIRST_DATE_RE,
+)
+from tests.comic_filenames import PARSE_FNS
+
+LOCALE_FNS = {
+    "Asterix Tome 12 (janvier 1999).cbz": ("fr", {"volume": "12", "month": "01"}),
+    "Spirou 3 (déc. 1970).cbz": ("fr", {"month": "12"}),
+    "Mortadelo Tomo 3 (marzo 2001).cbz": ("es", {"volume": "3", "month": "03"}),
+    "Lucky Luke Band 4 (März 1980).cbz": ("de", {"volume": "4", "month": "03"}),
+    "Tex #12 (settembre 1990).cbz": ("it", {"issue": "12", "month": "09"}),
+}
+
+
+def test_default_patterns():
+    """Test the default locale compiles to the module patterns."""
+    patterns = compile_locales()
+    assert patterns.alpha_month_range_re.pattern == ALPHA_MONTH_RANGE_RE.pattern
+    assert patterns.month_first_date_re.pattern == MONTH_FIRST_DATE_RE.pattern
+    assert patterns.year_first_date_re.pattern == YEAR_FIRST_DATE_RE.pattern
+    assert patterns.volume_re.pattern == VOLUME_RE.pattern
+
+
+def test_all_locales_keep_english():
+    """Test extra locales leave English names alone."""
+    engine = ComicFilenameEngine(locales=tuple(LOCALE_PACKS))
+    for name in PARSE_FNS:
+        assert engine.parse(name) == comicfn2dict(name)
+
+
+@pytest.mark.parametrize("name", LOCALE_FNS)
+def test_locale(name):
+    """Test month names and volume keywords of one locale."""
+    locale, expected = LOCALE_FNS[name]
+    md = ComicFilenameEngine(locales=(locale,)).parse(name)
+    assert {key: md.get(key) for key in expected} == expected
+
+
+def test_unknown_locale():
+    """Test an unknown locale is an error."""
+    with pytest.raises(ValueError, match="Unknown locale"):
+        ComicFilenameEngine(locales=("xx",))
@@ -0,0 +1,89 @@
+"""Tests for the series catalog matcher."""
+
+import pytest
+
+from comicfn2dict import comicfn2dict
+from comicfn2dict.matcher import SeriesIndex, normalize_series
+
+CATALOG = (
+    "The Amazing Spider-Man",
+    "Spider-Woman",
+    "Astérix",
+    "Sandman",
+    "The Sandman: Overture",
+    "Saga",
+    "Savage Dragon",
+    "Batman",
+    "Batman & Robin",
+)
+
+
+@pytest.fixture(scope="module")
+def index():
+    """Build a small index."""
+    return SeriesIndex.build(CATALOG)
+
+
+def test_normalize_series():
+    """Test case, accents, punctuation and articles fold away."""
+    assert normalize_series("The Amazing Spider-Man") == "amazing spider man"
+    assert normalize_series("ASTERIX") == normalize_series("Astérix")
+
+
+@pytest.mark.parametrize(
+    ("series", "expected", "exact"),
+    [
+        ("amazing spider man", "The Amazing Spider-Man", True),
+        ("Asterix", "Astérix", True),
+        ("Amazng Spider-Man", "The Amazing Spider-Man", False),
+        ("Batman and Robin", "Batman & Robin", False),
+        ("Sandmann", "Sandman", False),
+    ],
+)
+def test_lookup(index, series, expected, exact):
+    """Test exact and fuzzy lookups."""
+    match = index.lookup(series)
+    assert match
+    assert match.series == expected
+    assert (match.score == 1.0) == exact
+
+
+def test_no_match(index):
+    """Test unrelated names don't match."""
+    assert index.lookup("Xyzzy Quux") is None
+    assert index.lookup("") is None
+
+
+def test_match_parse_results(index):
+    """Test matching parse results."""
+    mds = [
+        comicfn2dict("Amazing Spider-Man #001 (2018).cbz"),
+        comicfn2dict("Saga #54 (2018).cbz"),
+        comicfn2dict("#1.cbz"),
+    ]
+    matches = index.match_many(mds)
+    assert [match.series if match else None for match in matches] == [
+        "The Amazing Spider-Man",
+        "Saga",
+        None,
+    ]
+
+
+def test_save_load(index, tmp_path):
+    """Test the on disk format round trips."""
+    path = tmp_path / "series.idx"
+    index.save(path)
+    loaded = SeriesIndex.load(path)
+    assert len(loaded) == len(index)
+    for series in ("Amazng Spider-Man", "Sandmann", "Savage Dragons", "Saga"):
+        assert loaded.lookup(series) == index.lookup(series)
+    loaded.save(tmp_path / "again.idx")
+    assert (tmp_path / "again.idx").read_bytes() == path.read_bytes()
+
+
+def test_load_not_an_index(tmp_path):
+    """Test loading something else is an error."""
+    path = tmp_path / "listing.txt"
+    path.write_text("Saga #1.cbz\n")
+    with pytest.raises(ValueError, match="not a series index"):
+        SeriesIndex.load(path)
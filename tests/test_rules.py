@@ -0,0 +1,87 @@
+"""Tests for rule packs."""
+
+import json
+
+import pytest
+
+from comicfn2dict import ComicFilenameEngine, comicfn2dict
+from comicfn2dict.rules import RULE_STAGES, Rule, compile_rules, load_rules
+from tests.comic_filenames import PARSE_FNS
+
+RULES = (
+    Rule("scan_info", r"\(((?:digital|zone)-empire)\)", stage="format"),
+    Rule("release", r"-(repack|proper)\b", stage="series"),
+    Rule("source", r"\((getcomics)\)", stage="remainders"),
+    Rule("source", r"\b(newsgroup)\b", stage="remainders", priority=1),
+    Rule("imprint", r"vertigo", pop=False),
+)
+RULE_FNS = {
+    "Saga 001 (2012) (digital-Empire).cbz": {
+        "original_format": None,
+        "scan_info": "digital-Empire",
+    },
+    "Paper Girls #5 (2016) Title-REPACK.cbz": {"title": "Title", "release": "REPACK"},
+    "Monstress 012 (2017) [GetComics].cbz": {"source": "GetComics", "remainders": None},
+    "Monstress 012 (2017) (GetComics) newsgroup.cbz": {
+        "source": "newsgroup",
+        "remainders": ("(GetComics)",),
+    },
+    "Sandman Vertigo 001.cbz": {"imprint": "Vertigo", "series": "Sandman Vertigo"},
+}
+
+
+@pytest.mark.parametrize("name", RULE_FNS)
+def test_rules(name):
+    """Test rules read site specific fields."""
+    engine = ComicFilenameEngine(rules=RULES)
+    md = engine.parse(name)
+    expected = RULE_FNS[name]
+    assert {key: md.get(key) for key in expected} == expected
+    assert engine.parse_batch([name]) == [md]
+
+
+def test_rules_leave_other_names():
+    """Test many rules that don't match change nothing and compile per stage."""
+    rules = tuple(
+        Rule(f"site_{index}", rf"\(site{index}\)", stage=RULE_STAGES[index % 8])
+        for index in range(50)
+    )
+    assert len(compile_rules(rules)) == len(RULE_STAGES)
+    engine = ComicFilenameEngine(rules=rules, canonical=True, casefold=True)
+    expected = [comicfn2dict(name) for name in PARSE_FNS]
+    assert engine.parse_batch(PARSE_FNS) == expected
+    assert [engine.parse(name) for name in PARSE_FNS] == expected
+
+
+@pytest.mark.parametrize(
+    ("rule", "reason"),
+    [
+        (Rule("Scan", "x"), "lowercase key"),
+        (Rule("remainders", "x"), "lowercase key"),
+        (Rule("scan", "x", stage="last"), "stage must be"),
+        (Rule("scan", "x", priority="1"), "priority"),  # type: ignore[arg-type]
+        (Rule("scan", "(?P<name>x)"), "named groups"),
+        (Rule("scan", r"(x)\1"), "backreferences"),
+        (Rule("scan", "(x"), "missing"),
+        (Rule("scan", "x*"), "empty"),
+        (Rule("scan", "(?i)zone-empire"), "global flags"),
+    ],
+)
+def test_invalid_rules(rule, reason):
+    """Test invalid rules are rejected when compiled."""
+    with pytest.raises(ValueError, match=reason):
+        ComicFilenameEngine(rules=(rule,))
+
+
+def test_load_rules(tmp_path):
+    """Test loading JSON rule packs."""
+    path = tmp_path / "rules.json"
+    rules = [rule._asdict() for rule in RULES]
+    path.write_text(json.dumps({"version": 1, "rules": rules}))
+    assert load_rules(path) == RULES
+    path.write_text(json.dumps({"version": 1, "rules": [{"field": "x"}]}))
+    with pytest.raises(ValueError, match="need field & pattern"):
+        load_rules(path)
+    path.write_text(json.dumps({"version": 2, "rules": rules}))
+    with pytest.raises(ValueError, match="not a version 1 rule pack"):
+        load_rules(path)
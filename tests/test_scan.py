@@ -0,0 +1,86 @@
+"""Tests for library directory traversal."""
+
+import os
+import random
+from io import StringIO
+
+import pytest
+
+from comicfn2dict import scan as scan_module
+from comicfn2dict.scan import iter_library, scan
+
+FILES_PER_DIR = 3
+
+
+def _make_tree(root, rng: random.Random, depth: int) -> None:
+    """Make a random tree of comics, other files and empty directories."""
+    root.mkdir(parents=True, exist_ok=True)
+    for index in range(FILES_PER_DIR):
+        (root / f"Series {rng.randint(0, 99)} #{index}.cbz").touch()
+    (root / "cover.jpg").touch()
+    if depth:
+        for index in range(rng.randint(1, 3)):
+            _make_tree(root / f"dir {index}", rng, depth - 1)
+
+
+@pytest.fixture
+def library(tmp_path):
+    """Make a library directory tree."""
+    root = tmp_path / "library"
+    _make_tree(root, random.Random(44), 4)  # noqa: S311
+    (root / "empty").mkdir()
+    return root
+
+
+@pytest.mark.parametrize(("workers", "max_pending"), [(2, 1), (4, 2), (8, 64)])
+def test_concurrent_walk_order(library, workers, max_pending):
+    """Test listing directories on threads walks in the serial order."""
+    expected = list(iter_library(library))
+    assert len(expected) > FILES_PER_DIR
+    paths = iter_library(library, workers=workers, max_pending=max_pending)
+    assert list(paths) == expected
+
+
+def test_concurrent_scan(library):
+    """Test concurrent scans write the same JSON lines."""
+    serial = StringIO()
+    concurrent = StringIO()
+    count = scan(library, serial)
+    assert scan(library, concurrent, workers=4, max_pending=2) == count
+    assert concurrent.getvalue() == serial.getvalue()
+
+
+def test_concurrent_walk_close(library):
+    """Test stopping a concurrent walk early."""
+    paths = iter_library(library, workers=4)
+    assert next(paths)
+    paths.close()
+
+
+def test_concurrent_walk_missing(tmp_path):
+    """Test listing errors are raised from the walk."""
+    with pytest.raises(FileNotFoundError):
+        list(iter_library(tmp_path / "missing", workers=4))
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_walk_skips_unreadable(library, workers, monkeypatch, caplog):
+    """Test an unreadable subdirectory is logged and skipped."""
+    locked = library / "dir 0"
+    expected = [path for path in iter_library(library) if not path.startswith("dir 0/")]
+    locked.chmod(0)
+    if os.access(locked, os.R_OK):
+        # Permissions don't stop root, so fail its listing directly.
+        real_scandir = scan_module.scandir
+
+        def _scandir(path):
+            if path.rstrip("/") == str(locked):
+                raise PermissionError(13, "Permission denied", path)
+            return real_scandir(path)
+
+        monkeypatch.setattr(scan_module, "scandir", _scandir)
+    try:
+        assert list(iter_library(library, workers=workers)) == expected
+    finally:
+        locked.chmod(0o755)
+    assert "Skipping directory" in caplog.text
@@ -0,0 +1,102 @@
+"""Tests for the parse server and client."""
+
+import socket
+from threading import Thread
+
+import pytest
+
+from comicfn2dict import comicfn2dict
+from comicfn2dict.cli import main
+from comicfn2dict.client import ComicFilenameClient
+from comicfn2dict.server import ComicFilenameService, _UnixServer
+from tests.comic_filenames import PARSE_FNS
+
+NAMES = tuple(PARSE_FNS)
+
+
+def test_service_respond():
+    """Test request handling without a socket."""
+    service = ComicFilenameService()
+    response = service.respond('{"id": 7, "names": ["Sandman 53.cbz"]}')
+    assert response == {"id": 7, "results": [comicfn2dict("Sandman 53.cbz")]}
+    assert "error" in service.respond('{"names": [1]}')
+    assert "error" in service.respond("not json")
+
+
+def test_socket_client(tmp_path):
+    """Test parsing and pipelining over a unix socket."""
+    socket_path = tmp_path / "comicfn2dict.sock"
+    server = _UnixServer(str(socket_path), ComicFilenameService(), verbose=0)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        expected = [comicfn2dict(name) for name in NAMES]
+        with ComicFilenameClient(socket_path, timeout=10) as client:
+            assert client.parse(NAMES[0]) == expected[0]
+            assert client.parse_many(NAMES) == expected
+            batches = [NAMES[i : i + 10] for i in range(0, len(NAMES), 10)]
+            results = [md for batch in client.pipeline(batches) for md in batch]
+            assert results == expected
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class BatchError(Exception):
+    """Raised by a batch source partway through."""
+
+
+def test_pipeline_batches_error(tmp_path):
+    """Test a failing batch source ends the pipeline and raises its error."""
+    socket_path = tmp_path / "comicfn2dict.sock"
+    server = _UnixServer(str(socket_path), ComicFilenameService(), verbose=0)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    def _batches():
+        yield NAMES[:2]
+        yield NAMES[2:4]
+        raise BatchError
+
+    try:
+        with ComicFilenameClient(socket_path, timeout=5) as client:
+            results = []
+            with pytest.raises(BatchError):
+                results.extend(client.pipeline(_batches()))
+            assert results == [
+                [comicfn2dict(name) for name in NAMES[:2]],
+                [comicfn2dict(name) for name in NAMES[2:4]],
+            ]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_socket_path_reuse(tmp_path, monkeypatch, capsys):
+    """Test stale sockets are replaced and live sockets & files are kept."""
+    socket_path = tmp_path / "comicfn2dict.sock"
+    with socket.socket(socket.AF_UNIX) as stale:
+        stale.bind(str(socket_path))
+    server = _UnixServer(str(socket_path), ComicFilenameService(), verbose=0)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        with pytest.raises(ValueError, match="in use"):
+            _UnixServer(str(socket_path), ComicFilenameService(), verbose=0)
+        with ComicFilenameClient(socket_path, timeout=10) as client:
+            assert client.parse(NAMES[0]) == comicfn2dict(NAMES[0])
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert not socket_path.exists()
+
+    socket_path.write_text("not a socket")
+    with pytest.raises(ValueError, match="not a socket"):
+        _UnixServer(str(socket_path), ComicFilenameService(), verbose=0)
+    monkeypatch.setattr(
+        "sys.argv", ["comicfn2dict", "serve", "--socket", str(socket_path)]
+    )
+    with pytest.raises(SystemExit):
+        main()
+    assert "not a socket" in capsys.readouterr().err
+    assert socket_path.read_text() == "not a socket"
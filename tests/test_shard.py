@@ -0,0 +1,108 @@
+"""Tests for sharded scans and merging."""
+
+from io import StringIO
+
+import pytest
+
+from comicfn2dict import comicfn2dict
+from comicfn2dict.batch import batch, batch_listing, load_record
+from comicfn2dict.scan import iter_library, scan
+from comicfn2dict.shard import merge_shards, shard_of
+from tests.comic_filenames import PARSE_FNS
+
+NAMES = tuple(name for name in PARSE_FNS if "/" not in name)
+SHARDS = 3
+
+
+@pytest.fixture
+def library(tmp_path):
+    """Make a library directory of empty comics."""
+    root = tmp_path / "library"
+    for index, name in enumerate(NAMES):
+        path = root / f"Publisher {index % 4}" / ("a-b" if index % 3 else "a") / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+    (root / "notes.txt").touch()
+    return root
+
+
+def _write_shards(tmp_path, write) -> list:
+    """Write each shard with write(output, shard) and return the paths."""
+    paths = []
+    for index in range(SHARDS):
+        path = tmp_path / f"shard{index}.jsonl"
+        with path.open("w") as output:
+            write(output, (index, SHARDS))
+        paths.append(path)
+    return paths
+
+
+def test_shard_of():
+    """Test shards are stable and the same for str and bytes."""
+    assert shard_of("Publisher/Series #1.cbz", 7) == shard_of(
+        b"Publisher/Series #1.cbz", 7
+    )
+    assert {shard_of(name, SHARDS) for name in NAMES} == set(range(SHARDS))
+
+
+def test_scan_merge(tmp_path, library):
+    """Test merged scan shards are the same as one scan."""
+    paths = tuple(iter_library(library))
+    assert len(paths) == len(NAMES)
+    assert all(path.endswith(NAMES) for path in paths)
+    whole = StringIO()
+    scan(library, whole)
+
+    shard_paths = _write_shards(
+        tmp_path, lambda output, shard: scan(library, output, shard=shard)
+    )
+    merged = StringIO()
+    assert merge_shards(shard_paths, merged) == len(NAMES)
+    assert merged.getvalue() == whole.getvalue()
+    records = [load_record(line) for line in merged.getvalue().splitlines()]
+    assert records == [(path, comicfn2dict(path)) for path in paths]
+
+
+def test_listing_merge(tmp_path):
+    """Test merged listing shards are in listing order."""
+    listing = tmp_path / "listing.txt"
+    listing.write_text("".join(f"comics/{name}\n" for name in reversed(NAMES)))
+    whole = StringIO()
+    batch_listing(listing, whole)
+
+    shard_paths = _write_shards(
+        tmp_path, lambda output, shard: batch_listing(listing, output, shard=shard)
+    )
+    merged = StringIO()
+    merge_shards(shard_paths, merged)
+    assert merged.getvalue() == whole.getvalue()
+
+
+def test_stdin_batch_merge(tmp_path):
+    """Test merged shards of unsorted stdin paths are in input order."""
+    paths = (
+        "a/y.cbz",
+        "a-c/z.cbz",
+        "a b/x.cbz",
+        *(f"comics/{name}" for name in reversed(NAMES)),
+    )
+    whole = StringIO()
+    batch(paths, whole)
+
+    shard_paths = _write_shards(
+        tmp_path, lambda output, shard: batch(paths, output, shard=shard)
+    )
+    merged = StringIO()
+    assert merge_shards(shard_paths, merged) == len(paths)
+    assert merged.getvalue() == whole.getvalue()
+    assert [load_record(line)[0] for line in merged.getvalue().splitlines()] == list(
+        paths
+    )
+
+
+def test_merge_out_of_order(tmp_path):
+    """Test unordered shard outputs are rejected."""
+    path = tmp_path / "shard.jsonl"
+    path.write_text('{"path":"b.cbz","metadata":{}}\n{"path":"a.cbz","metadata":{}}\n')
+    with pytest.raises(ValueError, match="out of order"):
+        merge_shards([path], StringIO())
@@ -0,0 +1,46 @@
+"""Tests for natural issue sort keys."""
+
+import pytest
+
+from comicfn2dict import ComicFilenameEngine, comicfn2dict
+from comicfn2dict.sort import ISSUE_SORT_KEY, issue_sort_key
+from comicfn2dict.unparse import issue_formatter
+from tests.comic_filenames import PARSE_FNS
+
+ISSUES = ("-1", "0", "0.0.1", "½", "1", "001AU", "1.5", "1.9", "2½", "5", "5a", "10")
+
+
+def test_issue_order():
+    """Test issues sort by number, then suffix."""
+    assert sorted(sorted(ISSUES), key=issue_sort_key) == list(ISSUES)
+    assert sorted(("X", "B2", "10", "-", "B01"), key=issue_sort_key) == [
+        "10",
+        "-",
+        "B01",
+        "B2",
+        "X",
+    ]
+
+
+@pytest.mark.parametrize(
+    "issue",
+    sorted(
+        {md["issue"] for md in map(comicfn2dict, PARSE_FNS) if "issue" in md}
+        | set(ISSUES)
+    ),
+)
+def test_padding_consistent(issue):
+    """Test padded issues get the same key as unpadded ones."""
+    padded = issue_formatter(issue).format(issue)
+    assert issue_sort_key(padded) == issue_sort_key(issue)
+
+
+def test_engine_sort_keys():
+    """Test engines add sort keys to parse results."""
+    engine = ComicFilenameEngine(sort_keys=True)
+    names = ("Saga #1½.cbz", "Saga #001AU.cbz", "Saga.cbz")
+    for metadata in (*map(engine.parse, names), *engine.parse_batch(names)):
+        if "issue" in metadata:
+            assert metadata[ISSUE_SORT_KEY] == issue_sort_key(metadata["issue"])
+        else:
+            assert ISSUE_SORT_KEY not in metadata
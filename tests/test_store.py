@@ -0,0 +1,53 @@
+"""Tests for the memory mapped result store."""
+
+from io import StringIO
+
+import pytest
+
+from comicfn2dict import ComicFilenameEngine
+from comicfn2dict.batch import batch, iter_records
+from comicfn2dict.store import ResultStore, write_store
+from tests.comic_filenames import PARSE_FNS
+
+
+def test_store_round_trip(tmp_path):
+    """Test stored results are the same dicts the parser made."""
+    engine = ComicFilenameEngine(sort_keys=True)
+    output = StringIO()
+    batch(PARSE_FNS, output, engine=engine)
+    records = list(iter_records(output.getvalue().splitlines()))
+    records += [("No Metadata.cbz", {}), ("Empty Tuple.cbz", {"remainders": ()})]
+    path = tmp_path / "results.store"
+    assert write_store(records, path) == len(records)
+    with ResultStore(path) as store:
+        assert len(store) == len(records)
+        assert list(store) == [name for name, _ in records]
+        for name in PARSE_FNS:
+            assert store[name] == engine.parse(name)
+        assert store["No Metadata.cbz"] == {}
+        assert store["Empty Tuple.cbz"] == {"remainders": ()}
+        assert "Missing.cbz" not in store
+        assert store.get("Missing.cbz") is None
+        with pytest.raises(KeyError):
+            store["Missing.cbz"]
+
+
+def test_store_later_records_win(tmp_path):
+    """Test later records replace earlier ones with the same path."""
+    path = tmp_path / "results.store"
+    write_store([("a.cbz", {"issue": "1"}), ("a.cbz", {"issue": "2"})], path)
+    with ResultStore(path) as store:
+        assert len(store) == 1
+        assert store["a.cbz"] == {"issue": "2"}
+
+
+def test_store_empty(tmp_path):
+    """Test stores without records and files that aren't stores."""
+    path = tmp_path / "results.store"
+    write_store([], path)
+    with ResultStore(path) as store:
+        assert not len(store)
+        assert "a.cbz" not in store
+    path.write_bytes(b"not a store")
+    with pytest.raises(ValueError, match="not a result store"):
+        ResultStore(path)
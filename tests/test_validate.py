@@ -0,0 +1,27 @@
+"""Tests for round trip validation."""
+
+from comicfn2dict.validate import iter_round_trip_failures, validate_round_trip
+from tests.comic_filenames import PARSE_FNS
+
+STABLE = "Long Series Name #001 (2000) Title (TPB) (Releaser).cbz"
+UNSTABLE = "King of Skittles 01 (of 05) (2020) (digital) (Son of Ultron-Empire).cbr"
+UNSTABLE_DATE = "Series Name (2000-12).cbz"
+
+
+def test_round_trip_fields():
+    """Test reporting drifted fields."""
+    report = validate_round_trip((STABLE, UNSTABLE, UNSTABLE_DATE), workers=1)
+    assert report.total == 3  # noqa: PLR2004
+    assert report.failures == 2  # noqa: PLR2004
+    assert report.field_counts == {"issue_count": 1, "remainders": 1, "filename": 1}
+    assert report.examples["issue_count"][0].name == UNSTABLE
+    assert report.examples["filename"][0].name == UNSTABLE_DATE
+
+
+def test_round_trip_parallel():
+    """Test that parallel validation streams the same failures in order."""
+    names = tuple(PARSE_FNS) * 3
+    serial = list(iter_round_trip_failures(names, workers=1))
+    parallel = list(iter_round_trip_failures(names, workers=2, chunk_size=8))
+    assert serial
+    assert parallel == serial